@@ -0,0 +1,13 @@
+import os
+from importlib import import_module
+
+
+if __name__ == "__main__":
+    dir: str = os.path.dirname(__file__)
+
+    for name in sorted(os.listdir(dir)):
+        if not name.endswith("_benchmark.py"):
+            continue
+        print(f"# {name[:-3]}")
+        import_module(f"benchmark.{name[:-3]}").run()
+        print()
@@ -0,0 +1,89 @@
+import tracemalloc
+from timeit import Timer
+from typing import Callable
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> float:
+    """関数の実行時間の最小値を計測します。
+
+    Args:
+        func (Callable[[], object]): 計測する関数
+        repeat (int): 計測の繰り返し回数
+
+    Returns:
+        float: 一回あたりの実行時間(秒)
+    """
+    timer = Timer(func)
+    number: int = timer.autorange()[0]
+    return min(timer.repeat(repeat, number)) / number
+
+
+def report(name: str, seconds: float, count: int = 1, unit: str = "element") -> None:
+    """計測結果を出力します。
+
+    Args:
+        name (str): 計測対象の名前
+        seconds (float): 実行時間(秒)
+        count (int): 処理した要素数
+        unit (str): 要素の単位
+    """
+    value: float = seconds * 1e9 / count
+    scale: str = "ns"
+    for next_scale in ("us", "ms"):
+        if value < 1e4:
+            break
+        value /= 1e3
+        scale = next_scale
+    print(f"{name:<48}{value:>12.1f} {scale}/{unit}")
+
+
+def measure_memory(func: Callable[[], object]) -> int:
+    """関数の戻り値が保持するメモリ量を計測します。
+
+    Args:
+        func (Callable[[], object]): 計測する関数
+
+    Returns:
+        int: 関数の実行前後で増加したメモリ量(バイト)
+    """
+    tracemalloc.start()
+    try:
+        before: int = tracemalloc.get_traced_memory()[0]
+        result: object = func()
+        after: int = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def measure_peak_memory(func: Callable[[], object]) -> int:
+    """関数の実行中に増加したメモリ量の最大値を計測します。
+
+    Args:
+        func (Callable[[], object]): 計測する関数
+
+    Returns:
+        int: 関数の実行前からのメモリ量の増加の最大値(バイト)
+    """
+    tracemalloc.start()
+    try:
+        before: int = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        func()
+        peak: int = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak - before
+
+
+def report_memory(name: str, size: int, count: int = 1, unit: str = "element") -> None:
+    """メモリ量の計測結果を出力します。
+
+    Args:
+        name (str): 計測対象の名前
+        size (int): メモリ量(バイト)
+        count (int): 計測した要素数
+        unit (str): 要素の単位
+    """
+    print(f"{name:<48}{size / count:>12.1f} B/{unit}")
@@ -0,0 +1,20 @@
+from operator import itemgetter
+
+from pylinq import LinqSequence
+
+from ._common import measure, report
+
+
+def run() -> None:
+    source: list[tuple[int, int]] = [(i, i % 7) for i in range(100_000)]
+    count: int = len(source)
+
+    report("build where/select/skip_while/take_while", measure(lambda: LinqSequence.from_iterable(source)
+        .where(lambda x: x[1] > 0)
+        .select(lambda x: x[0])
+        .skip_while(lambda x: x < 10)
+        .take_while(lambda x: x >= 0)), 1, "query")
+    report("build select(itemgetter)", measure(lambda: LinqSequence.from_iterable(source).select(itemgetter(0))), 1, "query")
+    report("skip_while single argument", measure(lambda: LinqSequence.from_iterable(source).skip_while(lambda x: x[0] < count).count(), 3), count)
+    report("skip_while with index", measure(lambda: LinqSequence.from_iterable(source).skip_while(lambda x, i: i < count).count(), 3), count)
+    report("select_many single argument", measure(lambda: LinqSequence.from_iterable(source).select_many(lambda x: x).count(), 3), count)
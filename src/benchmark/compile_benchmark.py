@@ -0,0 +1,32 @@
+from pylinq import LinqSequence
+
+from ._common import measure, report
+
+
+def build(source: list[int]) -> LinqSequence[int]:
+    """計測に用いる5段のパイプラインを生成します。
+
+    Args:
+        source (list[int]): 読み込むリスト
+
+    Returns:
+        LinqSequence[int]: 生成されたパイプライン
+    """
+    return LinqSequence.from_iterable(source)\
+        .where(lambda x: x % 3 != 0)\
+        .select(lambda x: x * 2)\
+        .where(lambda x: x % 5 != 0)\
+        .select(lambda x: x + 1)\
+        .take(len(source))
+
+
+def run() -> None:
+    source: list[int] = list[int](range(100_000))
+    count: int = len(source)
+    baseline: float = measure(lambda: [x * 2 + 1 for x in source if x % 3 != 0 and x * 2 % 5 != 0], 3)
+    chain: LinqSequence[int] = build(source)
+    compiled: LinqSequence[int] = chain.compile()
+
+    report("list comprehension", baseline, count)
+    report("node chain", measure(chain.to_list, 3), count)
+    report("compiled", measure(compiled.to_list, 3), count)
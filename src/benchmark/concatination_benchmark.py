@@ -0,0 +1,29 @@
+from pylinq import LinqSequence
+
+from ._common import measure, report
+
+
+def appended(count: int) -> LinqSequence[int]:
+    sequence: LinqSequence[int] = LinqSequence.empty()
+    for i in range(count):
+        sequence = sequence.append(i)
+    return sequence
+
+
+def unioned(count: int) -> LinqSequence[int]:
+    sequence: LinqSequence[int] = LinqSequence.empty()
+    for i in range(count):
+        sequence = sequence.union((i, i + 1))
+    return sequence
+
+
+def run() -> None:
+    for parts in (10, 100, 1000, 10000):
+        sequence: LinqSequence[int] = appended(parts)
+        report(f"append chain of {parts} to_list", measure(sequence.to_list), parts)
+    for parts in (10, 100, 1000, 10000):
+        sequence = unioned(parts)
+        report(f"union chain of {parts} to_list", measure(sequence.to_list), parts * 2)
+    batches: list[list[int]] = [list[int](range(i, i + 10)) for i in range(0, 10000, 10)]
+    report("concat_all of 1000 parts to_list", measure(LinqSequence.empty().concat_all(batches).to_list), 10000)
+    report("union_all of 1000 parts to_list", measure(LinqSequence.empty().union_all(batches).to_list), 10000)
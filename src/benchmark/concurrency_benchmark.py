@@ -0,0 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from pylinq import LinqSequence
+
+from ._common import report
+
+
+def run() -> None:
+    source: list[int] = list[int](range(20_000))
+    query: LinqSequence[int] = LinqSequence.from_iterable(source)\
+        .where(lambda x: x % 3 != 0)\
+        .select(lambda x: x * 2)\
+        .take(10_000)
+    expected: list[int] = query.to_list()
+    executions: int = 64
+
+    for workers in (1, 2, 4, 8):
+        with ThreadPoolExecutor(workers) as executor:
+            start: float = perf_counter()
+            results: list[list[int]] = list(executor.map(lambda _: query.to_list(), range(executions)))
+            elapsed: float = perf_counter() - start
+        assert all(map(lambda x: x == expected, results)), "shared query returned a wrong result"
+        report(f"shared query, {workers} threads", elapsed, executions, "execution")
@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+from pylinq import LinqSequence
+
+from ._common import measure, report
+
+
+def build(source: list[int]) -> LinqSequence[int]:
+    return LinqSequence.from_iterable(source)\
+        .where(lambda x: x % 2 == 0)\
+        .select(lambda x: x * 3)\
+        .skip(1)\
+        .take(3)
+
+
+def import_time(cache: str) -> int:
+    """新しいプロセスでpylinqを読み込み，pylinq自身のモジュールの読み込み時間を取得します。
+
+    Args:
+        cache (str): バイトコードを書き込むディレクトリ
+
+    Returns:
+        int: typingなどを除いたpylinqのモジュールの読み込み時間の合計(マイクロ秒)
+    """
+    environment: dict[str, str] = dict(os.environ)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    environment["PYTHONPYCACHEPREFIX"] = cache
+    result: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pylinq"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    total: int = 0
+    for line in result.stderr.splitlines():
+        fields: list[str] = line.split("|")
+        if len(fields) == 3 and fields[2].strip().startswith("pylinq"):
+            total += int(fields[0].split(":")[1])
+    return total
+
+
+def run() -> None:
+    with tempfile.TemporaryDirectory() as cache:
+        cold: int = import_time(cache)
+        warm: int = min(import_time(cache) for _ in range(5))
+    report("import pylinq without bytecode cache", cold * 1e-6, 1, "import")
+    report("import pylinq with bytecode cache", warm * 1e-6, 1, "import")
+
+    source: list[int] = list[int](range(10))
+    query: LinqSequence[int] = build(source)
+
+    report("from_iterable", measure(lambda: LinqSequence.from_iterable(source)), 1, "query")
+    report("build where/select/skip/take", measure(lambda: build(source)), 1, "query")
+    report("build order_by/then_by", measure(lambda: LinqSequence.from_iterable(source).order_by(lambda x: x % 3).then_by(lambda x: -x)), 1, "query")
+    report("execute prebuilt where/select/skip/take", measure(query.to_list), 1, "query")
+    report("build and execute where/select/skip/take", measure(lambda: build(source).to_list()), 1, "query")
@@ -0,0 +1,70 @@
+from pylinq import LinqSequence, Lookup
+
+from ._common import measure, measure_peak_memory, report, report_memory
+
+
+def session(x: tuple[int, int]) -> int:
+    return x[0]
+
+
+def timestamp(x: tuple[int, int]) -> int:
+    return x[1]
+
+
+def run() -> None:
+    size: int = 1_000_000
+    # 100要素ずつ同じセッションが連続する行
+    rows: list[tuple[int, int]] = [(i // 100, i) for i in range(size)]
+    source: LinqSequence[tuple[int, int]] = LinqSequence.from_iterable(rows)
+
+    report("group_by first group", measure(lambda: next(iter(source.group_by(session))), 3), 1, "query")
+    report("group_adjacent first group", measure(lambda: next(iter(source.group_adjacent(session))), 3), 1, "query")
+    report("group_by count", measure(source.group_by(session).count, 3), size)
+    report("group_adjacent count", measure(source.group_adjacent(session).count, 3), size)
+    report_memory("group_by count peak", measure_peak_memory(source.group_by(session).count), size)
+    report_memory("group_adjacent count peak", measure_peak_memory(source.group_adjacent(session).count), size)
+
+    # 1000人のユーザーのイベントから，ユーザーごとに最新の5件を取得する
+    events: LinqSequence[tuple[int, int]] = LinqSequence.from_iterable([(i * 7919 % 1_000, i) for i in range(size)])
+    naive: LinqSequence[list[tuple[int, int]]] = events.group_by(session)\
+        .select(lambda g: g.order_by_descending(timestamp).take(5).to_list())
+    bounded: LinqSequence[list[tuple[int, int]]] = events.top_k_by_group(session, timestamp, 5, True)\
+        .select(lambda g: g.to_list())
+    report("group_by/order_by_descending/take 5", measure(naive.count, 3), size)
+    report("top_k_by_group 5", measure(bounded.count, 3), size)
+    report_memory("group_by/order_by_descending/take 5 peak", measure_peak_memory(naive.count), size)
+    report_memory("top_k_by_group 5 peak", measure_peak_memory(bounded.count), size)
+
+    numbers: LinqSequence[int] = LinqSequence.from_iterable(list(range(size)))
+    report("to_look_up with distinct keys", measure(lambda: numbers.to_look_up(lambda x: x), 3), size)
+    report("to_look_up with 1000 keys", measure(lambda: numbers.to_look_up(lambda x: x % 1000), 3), size)
+    report("join half of keys", measure(numbers.join(range(0, size, 2), lambda x: x, lambda x: x, lambda x, y: x).count, 3), size)
+
+    # 参照データの一部の行が変わった場合に，作り直す場合と差分のみを反映する場合を比べる
+    changed: int = 5_000
+    index: Lookup[int, int] = numbers.to_look_up(lambda x: x % 100_000)
+    removed: list[int] = list(range(0, size, size // changed))
+    added: list[int] = [size + x for x in removed]
+    updated: LinqSequence[int] = numbers.where(lambda x: x % (size // changed) != 0).concat(added)
+
+    def apply_delta() -> Lookup[int, int]:
+        result: Lookup[int, int] = index.snapshot()
+        result.remove_range(removed, lambda x: x % 100_000)
+        result.add_range(added, lambda x: x % 100_000)
+        return result
+
+    report("to_look_up rebuild after 5000 changes", measure(lambda: updated.to_look_up(lambda x: x % 100_000), 3), size)
+    report("snapshot/remove_range/add_range 5000 changes", measure(apply_delta, 3), size)
+
+    rollups: list[tuple[str, LinqSequence[tuple[int, float]]]] = [
+        ("group_by/count", events.group_by(session).select(lambda g: (g.key, g.count()))),
+        ("count_by", events.count_by(session)),
+        ("group_by/sum", events.group_by(session).select(lambda g: (g.key, g.sum(timestamp)))),
+        ("sum_by", events.sum_by(session, timestamp)),
+        ("group_by/max_by", events.group_by(session).select(lambda g: (g.key, g.max_by(timestamp)))),  # type: ignore
+        ("max_by_group", events.max_by_group(session, timestamp)),  # type: ignore
+    ]
+    for name, rollup in rollups:
+        report(name, measure(rollup.to_list, 3), size)
+    for name, rollup in rollups:
+        report_memory(f"{name} peak", measure_peak_memory(rollup.to_list), size)
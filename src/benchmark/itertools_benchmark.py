@@ -0,0 +1,36 @@
+from typing import Callable
+
+from pylinq import LinqSequence, optimization
+
+from ._common import measure, report
+
+
+def run() -> None:
+    size: int = 100_000
+    source: list[int] = list[int](range(size))
+    operators: dict[str, Callable[[LinqSequence[int]], LinqSequence]] = {
+        "where": lambda x: x.where(lambda y: y % 3 == 0),
+        "where_indexed": lambda x: x.where(lambda y, i: i % 3 == 0),
+        "select": lambda x: x.select(lambda y: y + 1),
+        "select_indexed": lambda x: x.select(lambda y, i: y + i),
+        "skip": lambda x: x.skip(100),
+        "take": lambda x: x.take(size - 100),
+        "skip_while": lambda x: x.skip_while(lambda y: y < 100),
+        "take_while": lambda x: x.take_while(lambda y: y < size - 100),
+        "zip": lambda x: x.zip(range(size)),
+        "zip_selector": lambda x: x.zip(range(size), lambda y, z: y + z),
+        "concat": lambda x: x.concat(range(100)),
+        "append": lambda x: x.append(0),
+        "prepend": lambda x: x.prepend(0),
+        "default_if_empty": lambda x: x.default_if_empty(0),
+        "chunk": lambda x: x.chunk(7),
+        "select_many": lambda x: x.select_many(lambda y: (y, y)),
+        "select_many_result": lambda x: x.select_many(lambda y, i: (y, i), lambda y: y * 2),
+    }
+
+    for name, operator in operators.items():
+        sequence: LinqSequence = operator(LinqSequence.from_iterable(source))
+        with optimization.disabled_rules("use_itertools"):
+            fallback: float = measure(sequence.to_list, 3)
+        report(f"{name} generator", fallback, size)
+        report(f"{name} itertools", measure(sequence.to_list, 3), size)
@@ -0,0 +1,29 @@
+from pylinq import LinqSequence
+
+from ._common import measure_memory, report_memory
+
+
+def positive(x: int) -> bool:
+    return x > 0
+
+
+def identity(x: int) -> int:
+    return x
+
+
+def build(source: LinqSequence[int], count: int) -> LinqSequence[int]:
+    # 関数を共有し，ノード自身の大きさのみを計上する
+    for _ in range(count):
+        source = source.where(positive).select(identity).take(10)
+    return source
+
+
+def run() -> None:
+    source: list[int] = list[int](range(1_000_000))
+    sequence: LinqSequence[int] = LinqSequence.from_iterable(source)
+
+    report_memory("where/select/take node", measure_memory(lambda: build(sequence, 10_000)), 30_000, "node")
+    report_memory("order_by/then_by node", measure_memory(lambda: [sequence.order_by(identity).then_by(identity) for _ in range(10_000)]), 20_000, "node")
+    # 値は既存のintを共有するため，キーとグループの構造のみが計上される
+    report_memory("to_look_up with distinct keys", measure_memory(lambda: sequence.to_look_up(lambda x: x)), len(source), "group")
+    report_memory("to_look_up with 1000 keys", measure_memory(lambda: sequence.to_look_up(lambda x: x % 1000)), 1000, "group")
@@ -0,0 +1,24 @@
+from typing import Callable
+
+from pylinq import LinqSequence, optimization
+
+from ._common import measure, report
+
+
+def run() -> None:
+    source: list[int] = list[int](range(100_000))
+    count: int = len(source)
+    queries: dict[str, Callable[[], LinqSequence[int]]] = {
+        "fuse_where": lambda: LinqSequence.from_iterable(source).where(lambda x: x % 2 == 0).where(lambda x: x % 3 == 0).where(lambda x: x % 5 == 0),
+        "fuse_select": lambda: LinqSequence.from_iterable(source).select(lambda x: x + 1).select(lambda x: x * 2).select(lambda x: x - 1),
+        "merge_take": lambda: LinqSequence.from_iterable(source).take(90_000).take(80_000).take(70_000),
+        "merge_skip": lambda: LinqSequence.from_iterable(source).skip(10).skip(10).skip(10),
+        "push_skip": lambda: LinqSequence.from_iterable(source).select(lambda x: x * 2).skip(90_000),
+    }
+
+    for name, query in queries.items():
+        with optimization.disabled_rules(name):
+            disabled: float = measure(lambda: query().to_list(), 3)
+        enabled: float = measure(lambda: query().to_list(), 3)
+        report(f"{name} disabled", disabled, count)
+        report(f"{name} enabled", enabled, count)
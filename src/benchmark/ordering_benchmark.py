@@ -0,0 +1,54 @@
+import random
+
+from pylinq import LinqSequence, OrderedLinqSequence, optimization
+
+from ._common import measure, report
+
+
+def run() -> None:
+    generator: random.Random = random.Random(0)
+    size: int = 100000
+    rows: list[tuple[int, int, int, int]] = [(generator.randrange(10), generator.randrange(100), generator.randrange(1000), i) for i in range(size)]
+    source: LinqSequence[tuple[int, int, int, int]] = LinqSequence.from_iterable(rows)
+
+    report("order_by 1 key", measure(source.order_by(lambda x: x[2]).to_list, 3), size)
+    report("order_by_descending 1 key", measure(source.order_by_descending(lambda x: x[2]).to_list, 3), size)
+    report("order_by/then_by 2 keys", measure(source.order_by(lambda x: x[0]).then_by(lambda x: x[1]).to_list, 3), size)
+    report("order_by/then_by x2 3 keys", measure(source.order_by(lambda x: x[0]).then_by(lambda x: x[1]).then_by(lambda x: x[2]).to_list, 3), size)
+    report("order_by/then_by_descending x2 3 keys", measure(source.order_by(lambda x: x[0]).then_by_descending(lambda x: x[1]).then_by(lambda x: x[2]).to_list, 3), size)
+
+    top: LinqSequence[tuple[int, int, int, int]] = source.order_by(lambda x: x[2]).then_by_descending(lambda x: x[1]).take(10)
+    report("order_by/then_by_descending take 10", measure(top.to_list, 3), size)
+    with optimization.disabled_rules("top_k"):
+        report("order_by/then_by_descending take 10 (full sort)", measure(top.to_list, 3), size)
+    report("order_by_descending take 10", measure(source.order_by_descending(lambda x: x[2]).take(10).to_list, 3), size)
+    report("order_by element_at 100", measure(lambda: source.order_by(lambda x: x[2]).element_at(100), 3), size)
+
+    ordered: OrderedLinqSequence[tuple[int, int, int, int]] = source.order_by(lambda x: x[0]).then_by_descending(lambda x: x[2])
+    report("order_by/then_by_descending first of iteration", measure(lambda: next(iter(ordered)), 3), size)
+    report("incremental first of iteration", measure(lambda: next(iter(ordered.incremental())), 3), size)
+    report("incremental take_while 1%", measure(ordered.incremental().take_while(lambda x: x[0] == 0 and x[2] >= 900).to_list, 3), size)
+    report("incremental to_list", measure(ordered.incremental().to_list, 3), size)
+
+    keyed: OrderedLinqSequence[tuple[int, int, int, int]] = source.order_by(lambda x: x[0]).then_by(lambda x: x[3])
+    cached: OrderedLinqSequence[tuple[int, int, int, int]] = keyed.cached()
+    cached.to_list()
+    cursor: tuple[int, int, int, int] = cached.element_at(size // 2)
+    report("deep page by skip/take", measure(lambda: keyed.skip(size // 2).take(20).to_list(), 3), 1, "page")
+    report("deep page by skip/take (cached)", measure(lambda: cached.skip(size // 2).take(20).to_list()), 1, "page")
+    report("deep page by page(cursor) (cached)", measure(lambda: cached.page((cursor[0], cursor[3]), 20).to_list()), 1, "page")
+
+    multi: OrderedLinqSequence[tuple[int, int, int, int]] = source.order_by(lambda x: x[0]).then_by_descending(lambda x: x[2])
+    report("order_by/then_by_descending in memory", measure(multi.to_list, 3), size)
+    report("order_by/then_by_descending external run 10000", measure(multi.external(10000).to_list, 3), size)
+
+    presorted: LinqSequence[tuple[int, int, int, int]] = LinqSequence.from_iterable(sorted(rows, key=lambda x: x[2]))
+    report("order_by presorted", measure(presorted.order_by(lambda x: x[2]).to_list, 3), size)
+    report("assume_sorted presorted", measure(presorted.assume_sorted(lambda x: x[2]).to_list, 3), size)
+    report("assume_sorted/then_by presorted", measure(presorted.assume_sorted(lambda x: x[2]).then_by(lambda x: x[3]).to_list, 3), size)
+
+    parts: list[list[tuple[int, int, int, int]]] = [sorted(rows[i::4], key=lambda x: x[2]) for i in range(4)]
+    first: LinqSequence[tuple[int, int, int, int]] = LinqSequence.from_iterable(parts[0])
+    report("concat x4/order_by", measure(first.concat_all(parts[1:]).order_by(lambda x: x[2]).to_list, 3), size)
+    report("merge_ordered x4", measure(first.merge_ordered(parts[1:], lambda x: x[2]).to_list, 3), size)
+    report("merge_ordered x4 take 10", measure(first.merge_ordered(parts[1:], lambda x: x[2]).take(10).to_list, 3), size)
@@ -0,0 +1,23 @@
+import os
+
+from pylinq import LinqSequence, OrderedLinqSequence
+
+from ._common import measure, report
+
+
+def weight(row: tuple[int, int]) -> float:
+    # ワーカーで計算する価値のある程度の重さを持つキー
+    value: float = float(row[0])
+    for _ in range(20):
+        value = (value * 1.0001 + row[1]) % 1000.0
+    return value
+
+
+def run() -> None:
+    print(f"cpu count: {os.cpu_count()}")
+    for size in (10000, 100000, 400000):
+        rows: list[tuple[int, int]] = [(i * 7919 % 1000, i % 13) for i in range(size)]
+        ordered: OrderedLinqSequence[tuple[int, int]] = LinqSequence.from_iterable(rows).order_by(weight)
+        report(f"order_by {size} serial", measure(ordered.to_list, 1), size)
+        for workers in (2, 4, 8):
+            report(f"order_by {size} parallel {workers} workers", measure(ordered.parallel(workers, 0).to_list, 1), size)
@@ -0,0 +1,23 @@
+from pylinq import LinqSequence, PreparedQuery
+
+from ._common import measure, report
+
+
+def build(source: list[int], limit: int, count: int) -> LinqSequence[int]:
+    return LinqSequence.from_iterable(source)\
+        .where(lambda x: x > limit)\
+        .select(lambda x: x * 3)\
+        .take(count)
+
+
+def run() -> None:
+    source: list[int] = list[int](range(10))
+    query: PreparedQuery[int, int] = LinqSequence.prepare(lambda source, limit, count: source
+                                                          .where(lambda x: x > limit)
+                                                          .select(lambda x: x * 3)
+                                                          .take(count))
+
+    report("build where/select/take", measure(lambda: build(source, 2, 3)), 1, "query")
+    report("bind prepared where/select/take", measure(lambda: query(source, 2, 3)), 1, "query")
+    report("build and execute where/select/take", measure(lambda: build(source, 2, 3).to_list()), 1, "query")
+    report("bind and execute prepared where/select/take", measure(lambda: query(source, 2, 3).to_list()), 1, "query")
@@ -0,0 +1,29 @@
+from pylinq import LinqSequence
+
+from ._common import measure, measure_peak_memory, report, report_memory
+
+
+def quarter(x: int) -> int:
+    return x // 4
+
+
+def run() -> None:
+    size: int = 1_000_000
+    # 同じキーで昇順に並んだ，半分の要素が重なるシーケンス
+    source: LinqSequence[int] = LinqSequence.range(0, size).assume_sorted(quarter)
+    target: LinqSequence[int] = LinqSequence.range(size // 2, size).assume_sorted(quarter)
+
+    cases: list[tuple[str, LinqSequence[int]]] = [
+        ("distinct_by (set)", LinqSequence.range(0, size).distinct_by(quarter)),
+        ("distinct_by (sorted input)", source.distinct_by(quarter)),
+        ("union_by (set)", source.union_by(target, quarter)),
+        ("union_ordered", source.union_ordered(target, quarter)),
+        ("excepted_by (set)", source.excepted_by(list(target), quarter)),
+        ("excepted_by (sorted inputs)", source.excepted_by(target, quarter)),
+        ("intercept_by (set)", source.intercept_by(list(target), quarter)),
+        ("intercept_by (sorted inputs)", source.intercept_by(target, quarter)),
+    ]
+    for name, sequence in cases:
+        report(name, measure(sequence.count, 3), size)
+    for name, sequence in cases:
+        report_memory(f"{name} peak", measure_peak_memory(sequence.count), size)
@@ -0,0 +1,18 @@
+from pylinq import LinqSequence
+
+from ._common import measure, report
+
+
+def run() -> None:
+    source: list[int] = list[int](range(100_000))
+    values: set[int] = set[int](source)
+    count: int = len(source)
+
+    report("count() after select", measure(lambda: LinqSequence.from_iterable(x for x in source).select(lambda x: x * 2).count(), 3), count)
+    report("first() after order_by", measure(lambda: LinqSequence.from_iterable(source).order_by(lambda x: -x).first(), 3), count)
+    report("last() of list", measure(lambda: LinqSequence.from_iterable(source).last()), 1, "call")
+    report("contains() of set", measure(lambda: LinqSequence.from_iterable(values).contains(count - 1)), 1, "call")
+    report("any() after select", measure(lambda: LinqSequence.from_iterable(source).select(lambda x: x * 2).any()), 1, "call")
+    report("element_at() after select", measure(lambda: LinqSequence.from_iterable(source).select(lambda x: x * 2).element_at(count - 1)), 1, "call")
+    report("skip().take() page of list", measure(lambda: LinqSequence.from_iterable(source).skip(count - 10).take(10).to_list()), 1, "call")
+    report("reverse().first() after select", measure(lambda: LinqSequence.from_iterable(source).select(lambda x: x * 2).reverse().first()), 1, "call")
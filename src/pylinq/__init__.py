@@ -1,3 +1,4 @@
 from .linq_sequence import LinqSequence
 from .grouping import Grouping, Lookup
 from .ordering import OrderedLinqSequence
+from .prepared_query import PreparedQuery
@@ -1,15 +1,126 @@
+from collections.abc import Sized
+from operator import attrgetter, itemgetter, methodcaller
+from types import BuiltinFunctionType, CodeType, FunctionType, MethodType, ModuleType
+from typing import Any, Callable, Iterable
+from weakref import WeakKeyDictionary
 
-from inspect import signature
-from typing import Callable
+from .linq_sequence import LinqSequence
+
+
+# inspect.CO_VARARGSと同じ値。inspectは読み込みが重いため，シグネチャが必要になるまで読み込まない
+_CO_VARARGS: int = 0x04
+_SINGLE_PARAMETER_TYPES: tuple[type, ...] = (attrgetter, itemgetter, methodcaller)
+# 抽象基底クラスによる判定を省略できる，要素数を持つ代表的な型
+_SIZED_TYPES: frozenset[type] = frozenset((list, tuple, range, str, bytes, dict, set, frozenset))
+
+_parameter_counts: WeakKeyDictionary[Any, int] = WeakKeyDictionary[Any, int]()
+# 組み込み関数は弱参照できないため，モジュールの関数と型のメソッド名で保持する
+_builtin_parameter_counts: dict[Any, int] = dict[Any, int]()
+
+
+def _inspect_parameter_count(func: Callable) -> int:
+    """シグネチャから位置引数として渡せるパラメータ数を取得します。
+
+    Args:
+        func (Callable): 対象関数
+
+    Returns:
+        int: funcの位置パラメータの個数。シグネチャを取得できない場合は1
+    """
+    from inspect import Parameter, signature
+    try:
+        parameters: Iterable[Parameter] = signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return 1
+    positional_kinds: tuple[Any, ...] = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD, Parameter.VAR_POSITIONAL)
+    return sum(1 for parameter in parameters if parameter.kind in positional_kinds)
 
 
 def get_parameter_count(func: Callable) -> int:
     """関数のパラメータ数を取得します。
+    キーワード専用のパラメータは数えません。シグネチャを調べる必要がある呼び出し可能オブジェクトの結果のみキャッシュされます。
 
     Args:
         func (Callable): 対象関数
 
     Returns:
-        int: funcにおけるパラメータの個数
+        int: funcにおける位置パラメータの個数
+    """
+    func_type: type = type(func)
+    if func_type is FunctionType:
+        # functools.wrapsなどで属性を持つ関数はシグネチャが元の関数と異なりうる
+        if not func.__dict__:
+            # コードオブジェクトの属性を読むだけのため，キャッシュを引くより速い
+            code: CodeType = func.__code__  # type: ignore
+            return code.co_argcount + (1 if code.co_flags & _CO_VARARGS else 0)
+    elif func_type is MethodType:
+        return max(get_parameter_count(func.__func__) - 1, 0)  # type: ignore
+    elif func_type in _SINGLE_PARAMETER_TYPES:
+        return 1
+    elif func_type is BuiltinFunctionType:
+        owner: Any = func.__self__  # type: ignore
+        key: Any = func if owner is None or isinstance(owner, ModuleType) else (type(owner), func.__name__)  # type: ignore
+        result: int | None = _builtin_parameter_counts.get(key)
+        if result is None:
+            result = _inspect_parameter_count(func)
+            _builtin_parameter_counts[key] = result
+        return result
+
+    try:
+        cached: int | None = _parameter_counts.get(func)
+    except TypeError:
+        # 弱参照またはハッシュ化できない呼び出し可能オブジェクト
+        return _inspect_parameter_count(func)
+    if cached is None:
+        cached = _inspect_parameter_count(func)
+        _parameter_counts[func] = cached
+    return cached
+
+
+def identity(value: Any) -> Any:
+    """引数をそのまま返します。
+    要素自身をキーとする並び替えを判別できるよう，キーを生成する関数として共有します。
+
+    Args:
+        value (Any): 対象の値
+
+    Returns:
+        Any: value
+    """
+    return value
+
+
+def get_count(source: Iterable[Any]) -> int:
+    """列挙せずにイテラブルなオブジェクトの要素数を取得します。
+
+    Args:
+        source (Iterable[Any]): 対象のオブジェクト
+
+    Returns:
+        int: 要素数。不明な場合は-1
+    """
+    if type(source) in _SIZED_TYPES:
+        return len(source)  # type: ignore
+    if isinstance(source, LinqSequence):
+        return source._try_get_count()
+    if isinstance(source, Sized):
+        return len(source)
+    return -1
+
+
+def get_max_count(source: Iterable[Any]) -> int:
+    """列挙せずにイテラブルなオブジェクトの要素数の上限を取得します。
+
+    Args:
+        source (Iterable[Any]): 対象のオブジェクト
+
+    Returns:
+        int: 要素数の上限。不明な場合は-1
     """
-    return len(signature(func).parameters)
+    if type(source) in _SIZED_TYPES:
+        return len(source)  # type: ignore
+    if isinstance(source, LinqSequence):
+        return source._get_max_count()
+    if isinstance(source, Sized):
+        return len(source)
+    return -1
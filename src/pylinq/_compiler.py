@@ -0,0 +1,162 @@
+from typing import Any, Callable, Generator
+
+from ._sequences import FromSequence, GeneratorSequence, SelectSequence, SkipSequence, TakeSequence, TakeWhileSequence, WhereSequence
+from ._sequences.plan import optimize
+from .linq_sequence import LinqSequence
+from .type_variants import *
+
+
+_WHERE = "where"
+_WHERE_INDEXED = "where_indexed"
+_SELECT = "select"
+_SELECT_INDEXED = "select_indexed"
+_SKIP = "skip"
+_TAKE = "take"
+_TAKE_WHILE = "take_while"
+_TAKE_WHILE_INDEXED = "take_while_indexed"
+
+_cache: dict[tuple[str, ...], Callable[..., Generator[Any, None, None]]] = dict[tuple[str, ...], Callable[..., Generator[Any, None, None]]]()
+
+
+def _emit_stages(shape: tuple[str, ...], position: int, indent: str, skip: str, lines: list[str]) -> None:
+    """指定した位置以降のステージの本体を出力します。
+
+    Args:
+        shape (tuple[str, ...]): ステージの種類の並び
+        position (int): 出力を開始するステージの位置
+        indent (str): インデント
+        skip (str): 要素を読み飛ばす際の文
+        lines (list[str]): 出力先
+    """
+    for i in range(position, len(shape)):
+        kind: str = shape[i]
+        if kind == _WHERE:
+            lines.append(f"{indent}if not a{i}(x):")
+            lines.append(f"{indent}    {skip}")
+        elif kind == _WHERE_INDEXED:
+            lines.append(f"{indent}i{i} += 1")
+            lines.append(f"{indent}if not a{i}(x, i{i}):")
+            lines.append(f"{indent}    {skip}")
+        elif kind == _SELECT:
+            lines.append(f"{indent}x = a{i}(x)")
+        elif kind == _SELECT_INDEXED:
+            lines.append(f"{indent}i{i} += 1")
+            lines.append(f"{indent}x = a{i}(x, i{i})")
+        elif kind == _SKIP:
+            lines.append(f"{indent}if i{i} < a{i}:")
+            lines.append(f"{indent}    i{i} += 1")
+            lines.append(f"{indent}    {skip}")
+        elif kind == _TAKE_WHILE:
+            lines.append(f"{indent}if not a{i}(x):")
+            lines.append(f"{indent}    return")
+        elif kind == _TAKE_WHILE_INDEXED:
+            lines.append(f"{indent}if not a{i}(x, i{i}):")
+            lines.append(f"{indent}    return")
+            lines.append(f"{indent}i{i} += 1")
+        elif kind == _TAKE:
+            # 上限に達した要素を流した後は以降の要素を読み込まない
+            lines.append(f"{indent}i{i} += 1")
+            lines.append(f"{indent}if i{i} == a{i}:")
+            _emit_stages(shape, i + 1, indent + "    ", "return", lines)
+            lines.append(f"{indent}    return")
+    lines.append(f"{indent}yield x")
+
+
+def _generate(shape: tuple[str, ...]) -> Callable[..., Generator[Any, None, None]]:
+    """ステージの並びから融合されたGeneratorを生成する関数を作成します。
+
+    Args:
+        shape (tuple[str, ...]): ステージの種類の並び
+
+    Returns:
+        Callable[..., Generator[Any, None, None]]: 読み込むイテラブルとステージの引数を受け取る関数
+    """
+    params: str = "".join(f", a{i}" for i in range(len(shape)))
+    lines: list[str] = [f"def fused(source{params}):"]
+    for i, kind in enumerate(shape):
+        if kind == _TAKE:
+            lines.append(f"    if a{i} <= 0:")
+            lines.append("        return")
+        if kind in (_WHERE_INDEXED, _SELECT_INDEXED):
+            lines.append(f"    i{i} = -1")
+        elif kind in (_SKIP, _TAKE, _TAKE_WHILE_INDEXED):
+            lines.append(f"    i{i} = 0")
+    lines.append("    for x in source:")
+    _emit_stages(shape, 0, "        ", "continue", lines)
+
+    namespace: dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<pylinq fused {'/'.join(shape)}>", "exec"), namespace)
+    return namespace["fused"]
+
+
+def get_fused_function(shape: tuple[str, ...]) -> Callable[..., Generator[Any, None, None]]:
+    """ステージの並びに対応する融合された関数を取得します。
+
+    Args:
+        shape (tuple[str, ...]): ステージの種類の並び
+
+    Returns:
+        Callable[..., Generator[Any, None, None]]: 読み込むイテラブルとステージの引数を受け取る関数
+    """
+    result: Callable[..., Generator[Any, None, None]] | None = _cache.get(shape)
+    if result is None:
+        result = _generate(shape)
+        _cache[shape] = result
+    return result
+
+
+def collect_stages(sequence: LinqSequence[Any]) -> tuple[tuple[str, ...], list[Any], Any]:
+    """融合できるステージの連なりを末尾から辿り，ステージの種類と引数を取得します。
+
+    Args:
+        sequence (LinqSequence[Any]): 辿るシーケンス
+
+    Returns:
+        tuple[tuple[str, ...], list[Any], Any]: 読み込む順のステージの種類，その引数，最初のステージが読み込むシーケンス
+    """
+    kinds: list[str] = []
+    args: list[Any] = []
+    node: Any = sequence
+    while True:
+        node_type: type = type(node)
+        if node_type is WhereSequence:
+            kinds.append(_WHERE_INDEXED if node._indexed else _WHERE)
+            args.append(node._match)
+        elif node_type is SelectSequence:
+            kinds.append(_SELECT_INDEXED if node._indexed else _SELECT)
+            args.append(node._selector)
+        elif node_type is SkipSequence:
+            kinds.append(_SKIP)
+            args.append(node._count)
+        elif node_type is TakeSequence:
+            kinds.append(_TAKE)
+            args.append(node._count)
+        elif node_type is TakeWhileSequence:
+            kinds.append(_TAKE_WHILE_INDEXED if node._indexed else _TAKE_WHILE)
+            args.append(node._match)
+        else:
+            break
+        node = node._source
+    kinds.reverse()
+    args.reverse()
+    return tuple(kinds), args, node
+
+
+def compile_sequence(sequence: LinqSequence[T]) -> LinqSequence[T]:
+    """シーケンスの連なりを単一のループに融合します。
+
+    Args:
+        sequence (LinqSequence[T]): 融合するシーケンス
+
+    Returns:
+        LinqSequence[T]: 融合されたシーケンス。融合できるステージが無い場合は書き換え後のsequence
+    """
+    kinds: tuple[str, ...]
+    args: list[Any]
+    node: Any
+    kinds, args, node = collect_stages(optimize(sequence))
+    if len(kinds) == 0:
+        return node
+
+    source: Any = node._source if isinstance(node, FromSequence) else node
+    return GeneratorSequence(get_fused_function(kinds), source, *args)
@@ -1,9 +1,10 @@
+from .planned_sequence import PlannedSequence
 from .from_sequence import FromSequence, DictSequence, GeneratorSequence, SizedFromSequence
 from .create_sequence import EmptySequence, RangeSequence, RepeatSequence
-from .concatination_sequence import ConcatSequence, ApPrependSequence
-from .projection_sequence import SelectSequence
+from .concatination_sequence import ConcatSequence, DefaultIfEmptySequence
+from .projection_sequence import SelectManySequence, SelectSequence, ZipSequence
 from .filtering_sequence import WhereSequence
-from .grouping_sequence import GroupingImpl, LookupImpl
-from .set_operation_sequence import UnionSequence, UnionBySequence, ExceptSequence, ExceptBySequence, InterceptSequence, InterceptBySequence
-from .ordering_sequence import OrderedLinqSequenceImpl
-from .partitioning_sequence import TakeSequence, TakeLastSequence, TakeWhileSequence
+from .grouping_sequence import AdjacentGroupingSequence, GroupingImpl, LookupImpl, TopByGroupSequence
+from .set_operation_sequence import UnionSequence, UnionBySequence, ExceptSequence, ExceptBySequence, InterceptSequence, InterceptBySequence, DistinctAdjacentSequence, OrderedExceptSequence, OrderedInterceptSequence
+from .ordering_sequence import MergeSequence, OrderedLinqSequenceImpl, ReverseSequence, TopSequence
+from .partitioning_sequence import ChunkSequence, SkipSequence, SkipWhileSequence, TakeSequence, TakeLastSequence, TakeWhileSequence
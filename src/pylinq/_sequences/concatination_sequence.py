@@ -1,96 +1,157 @@
+from collections import deque
+from itertools import chain
 from typing import Generic, Iterator, final
 
-from .. import LinqSequence
+from .. import optimization
+from ..linq_sequence import LinqSequence
+from .._common import get_count, get_max_count
 from ..type_variants import *
 
 
 @final
 class ConcatSequence(LinqSequence[T], Generic[T]):
     """結合されたシーケンスを表します。
+
+    連続したconcat，append，prependは直前のノードを指す一つのノードとして積み重ねられ，
+    列挙時に平坦な部分の並びに展開されます。部分の数によらず要素あたりの処理は一定です。
     """
 
-    def __init__(self, source: LinqSequence[T], after: Iterable[T]) -> None:
+    __slots__ = ("_previous", "_parts", "_prepend", "_flattened")
+
+    def __init__(self, previous: "ConcatSequence[T] | None", parts: tuple[Iterable[T], ...], prepend: bool) -> None:
         """ConcatSequence[T]の新しいインスタンスを初期化します。
 
         Args:
-            source (LinqSequence[T]): 読み込むシーケンス
-            after (Iterable[T]): 結合するシーケンス
+            previous (ConcatSequence[T] | None): 結合元の結合シーケンス。Noneの場合はpartsのみを結合する
+            parts (tuple[Iterable[T], ...]): 結合する部分の並び
+            prepend (bool): Trueでpartsを先頭に，Falseで末尾に結合する
         """
         super().__init__()
-        self.__source: LinqSequence[T] = source
-        self.__after: Iterable[T] = after
-        self.__iteartor: Iterator[T] | None = None
-        self.__is_after: bool = False
-
-    def _in_iteration(self) -> bool:
-        return self.__iteartor is not None
-
-    def _start_iteration(self) -> None:
-        self.__source._start_iteration()
-        self.__iteartor = iter(self.__source)
-        self.__is_after = False
+        self._previous: ConcatSequence[T] | None = previous
+        self._parts: tuple[Iterable[T], ...] = parts
+        self._prepend: bool = prepend
+        self._flattened: list[Iterable[T]] | None = None
 
-    def _stop_iteration(self) -> None:
-        self.__iteartor = None
-        self.__is_after = False
+    def _collect_parts(self) -> deque[Iterable[T]]:
+        """積み重ねられたノードを辿り，部分の並びを取得します。
 
-    def _get_next(self) -> T:
-        try:
-            return next(self.__iteartor)  # type: ignore
-        except:
-            if self.__is_after:
-                raise
-        self.__iteartor = iter(self.__after)
-        self.__is_after = True
-        return self._get_next()
+        Returns:
+            deque[Iterable[T]]: 結合順の部分の並び
+        """
+        nodes: list[ConcatSequence[T]] = []
+        node: ConcatSequence[T] | None = self
+        while node is not None:
+            nodes.append(node)
+            node = node._previous
+        result: deque[Iterable[T]] = deque()
+        for node in reversed(nodes):
+            if node._prepend:
+                result.extendleft(reversed(node._parts))
+            elif len(node._parts) == 1:
+                result.append(node._parts[0])
+            else:
+                result.extend(node._parts)
+        return result
+
+    def _get_parts(self) -> list[Iterable[T]]:
+        """部分として結合された結合シーケンスも展開し，平坦な部分の並びを取得します。
+
+        Returns:
+            list[Iterable[T]]: 結合順の部分の並び
+        """
+        # ノードは不変のため，展開した結果は列挙ごとに使い回せる
+        if self._flattened is not None:
+            return self._flattened
+        result: list[Iterable[T]] = []
+        # 再帰せずに展開するため，逆順に積んで先頭から取り出す
+        stack: list[Iterable[T]] = list(reversed(self._collect_parts()))
+        while len(stack) > 0:
+            part: Iterable[T] = stack.pop()
+            if type(part) is ConcatSequence:
+                stack.extend(reversed(part._collect_parts()))
+            else:
+                result.append(part)
+        self._flattened = result
+        return result
+
+    def __iter__(self) -> Iterator[T]:
+        if optimization._rules["use_itertools"]:
+            return chain.from_iterable(self._get_parts())
+        return self._iterate_fallback()
+
+    def _iterate_fallback(self) -> Iterator[T]:
+        for part in self._get_parts():
+            yield from part
+
+    def _try_get_count(self) -> int:
+        result: int = 0
+        for part in self._get_parts():
+            count: int = get_count(part)
+            if count < 0:
+                return -1
+            result += count
+        return result
+
+    def _get_max_count(self) -> int:
+        result: int = 0
+        for part in self._get_parts():
+            count: int = get_max_count(part)
+            if count < 0:
+                return -1
+            result += count
+        return result
 
 
 @final
-class ApPrependSequence(LinqSequence[T], Generic[T]):
-    """先頭または末尾に要素を追加されたシーケンスを表します。
+class DefaultIfEmptySequence(LinqSequence[T], Generic[T]):
+    """空の場合に既定値を一つ持つシーケンスを表します。
     """
 
-    def __init__(self, source: LinqSequence[T], value: T, append: bool) -> None:
-        """ApPrependSequence[T]の新しいインスタンスを初期化します。
+    __slots__ = ("_source", "_default")
+
+    def __init__(self, source: LinqSequence[T], default: T) -> None:
+        """DefaultIfEmptySequence[T]の新しいインスタンスを初期化します。
 
         Args:
             source (LinqSequence[T]): 読み込むシーケンス
-            value (T): 追加する要素
-            append (bool): TrueでAppend，FalseでPrepend
+            default (T): シーケンスが空の場合の既定値
         """
         super().__init__()
-        self.__source: LinqSequence[T] = source
-        self.__iterator: Iterator[T] | None = None
-        self.__value: T = value
-        self.__append: bool = append
-        self.__finished: bool = False
-        self.__value_returned: bool = False
-
-    def _in_iteration(self) -> bool:
-        return self.__source._in_iteration() or self.__value_returned
-
-    def _start_iteration(self) -> None:
-        self.__source._start_iteration()
-        self.__iterator = iter(self.__source)
-
-    def _stop_iteration(self) -> None:
-        self.__source._stop_iteration()
-        self.__iterator = None
-        self.__value_returned = False
-        self.__finished = False
-
-    def _get_next(self) -> T:
-        if not self.__value_returned and not self.__append:
-            self.__value_returned = True
-            return self.__value
-        if self.__finished:
-            raise StopIteration(0)
-
+        self._source: LinqSequence[T] = source
+        self._default: T = default
+
+    def __iter__(self) -> Iterator[T]:
+        if not optimization._rules["use_itertools"]:
+            yield from self._iterate_fallback()
+            return
+        iterator: Iterator[T] = iter(self._source)
+        for current in iterator:
+            yield current
+            # 残りの要素はCの列挙子のまま読み込む
+            yield from iterator
+            return
+        yield self._default
+
+    def _iterate_fallback(self) -> Iterator[T]:
+        iterator: Iterator[T] = iter(self._source)
         try:
-            return next(self.__iterator)  # type: ignore
-        except:
-            if not self.__value_returned and self.__append:
-                self.__value_returned = True
-                self.__finished = True
-                return self.__value
-            raise
+            yield next(iterator)
+        except StopIteration:
+            yield self._default
+        while True:
+            try:
+                yield next(iterator)
+            except StopIteration:
+                return
+
+    def _try_get_count(self) -> int:
+        count: int = self._source._try_get_count()
+        if count < 0:
+            return -1
+        return max(count, 1)
+
+    def _get_max_count(self) -> int:
+        count: int = self._source._get_max_count()
+        if count < 0:
+            return -1
+        return max(count, 1)
@@ -1,7 +1,7 @@
-from itertools import count
-from typing import Generic, final
+from itertools import repeat
+from typing import Generic, Iterator, final
 
-from .. import LinqSequence
+from ..linq_sequence import LinqSequence
 from ..type_variants import *
 
 
@@ -10,22 +10,21 @@ class EmptySequence(LinqSequence[T], Generic[T]):
     """空のシーケンスを表します。
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """EmptySequenceの新しいインスタンスを初期化します。
         """
         super().__init__()
 
-    def _in_iteration(self) -> bool:
-        return False
-
-    def _start_iteration(self) -> None:
-        pass
+    def __iter__(self) -> Iterator[T]:
+        return iter(())
 
-    def _stop_iteration(self) -> None:
-        pass
+    def _try_get_count(self) -> int:
+        return 0
 
-    def _get_next(self) -> T:
-        raise StopIteration()
+    def _is_indexable(self) -> bool:
+        return True
 
 
 @final
@@ -33,6 +32,8 @@ class RangeSequence(LinqSequence[int]):
     """指定した範囲の整数を列挙するシーケンスを表します。
     """
 
+    __slots__ = ("_start", "_end")
+
     def __init__(self, start: int, count: int) -> None:
         """RangeSequenceの新しいインスタンスを初期化します。
 
@@ -40,25 +41,21 @@ class RangeSequence(LinqSequence[int]):
             start (int): 開始値
             count (int): 列挙数
         """
-        self.__current: int = start
-        self.__start: int = start
-        self.__end: int = start + count
+        super().__init__()
+        self._start: int = start
+        self._end: int = start + count
 
-    def _in_iteration(self) -> bool:
-        return self.__current == self.__start
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._start, self._end))
 
-    def _start_iteration(self) -> None:
-        pass
+    def _try_get_count(self) -> int:
+        return max(0, self._end - self._start)
 
-    def _stop_iteration(self) -> None:
-        self.__current = self.__start
+    def _is_indexable(self) -> bool:
+        return True
 
-    def _get_next(self) -> int:
-        result: int = self.__current
-        self.__current += 1
-        if self.__current == self.__end:
-            raise StopIteration()
-        return result
+    def _get_item(self, index: int) -> int:
+        return self._start + index
 
 
 @final
@@ -66,6 +63,8 @@ class RepeatSequence(LinqSequence[T], Generic[T]):
     """単一の値を繰り返し出力するシーケンスを表します。
     """
 
+    __slots__ = ("_value", "_count")
+
     def __init__(self, value: T, count: int) -> None:
         """RepeatSequence[T]の新しいインスタンスを初期化します。
 
@@ -73,21 +72,18 @@ class RepeatSequence(LinqSequence[T], Generic[T]):
             value (T): 列挙する値
             count (int): 列挙数
         """
-        self.__index: int = 0
-        self.__value: T = value
-        self.__count: int = count
+        super().__init__()
+        self._value: T = value
+        self._count: int = count
 
-    def _in_iteration(self) -> bool:
-        return self.__index > 0
+    def __iter__(self) -> Iterator[T]:
+        return repeat(self._value, self._count)
 
-    def _start_iteration(self) -> None:
-        pass
+    def _try_get_count(self) -> int:
+        return max(0, self._count)
 
-    def _stop_iteration(self) -> None:
-        self.__index = 0
+    def _is_indexable(self) -> bool:
+        return True
 
-    def _get_next(self) -> T:
-        if self.__index == self.__count:
-            raise StopIteration()
-        self.__index += 1
-        return self.__value
+    def _get_item(self, index: int) -> T:
+        return self._value
@@ -0,0 +1,94 @@
+from heapq import merge
+from itertools import islice
+from operator import itemgetter
+from pickle import HIGHEST_PROTOCOL, dump, load
+from tempfile import TemporaryFile
+from typing import IO, Any, Iterator
+
+from ..type_variants import *
+from .ordering_sequence import Descending, SortLevels, sort_values
+
+
+# 一時ファイルに一度に書き込む要素数
+_BATCH_SIZE: int = 1024
+
+
+def _write_run(values: list[T], levels: SortLevels, directory: str | None) -> IO[bytes]:
+    """要素を並び替え，キーと要素の組を一時ファイルに書き込みます。
+
+    Args:
+        values (list[T]): 並び替えるリスト
+        levels (SortLevels): 並び替えの条件
+        directory (str | None): 一時ファイルを作成するディレクトリ。Noneの場合は既定の一時ディレクトリ
+
+    Returns:
+        IO[bytes]: 先頭に位置を戻した一時ファイル
+    """
+    columns: list[list[Any]] = [list(map(key_selector, values)) for key_selector, _ in levels]
+    # 並び替えは元のキーのまま組み込みのソートを重ねて行う
+    order: list[int] = list(range(len(values)))
+    for column, (_, descending) in zip(reversed(columns), reversed(levels)):
+        order.sort(key=column.__getitem__, reverse=descending)
+    # 全ての一時ファイルのキーを同じ形で比較できるよう，降順のキーは常に比較を逆にするオブジェクトで包む
+    keys: list[tuple[Any, ...]] = list(zip(*(map(Descending, column) if descending else column for column, (_, descending) in zip(columns, levels))))
+    file: IO[bytes] = TemporaryFile(dir=directory)
+    try:
+        for start in range(0, len(order), _BATCH_SIZE):
+            dump([(keys[i], values[i]) for i in order[start:start + _BATCH_SIZE]], file, HIGHEST_PROTOCOL)
+        file.seek(0)
+    except BaseException:
+        file.close()
+        raise
+    return file
+
+
+def _read_run(file: IO[bytes]) -> Iterator[tuple[tuple[Any, ...], Any]]:
+    """一時ファイルからキーと要素の組を順に読み込みます。
+
+    Args:
+        file (IO[bytes]): _write_runで書き込んだ一時ファイル
+
+    Yields:
+        tuple[tuple[Any, ...], Any]: キーと要素の組
+    """
+    while True:
+        try:
+            batch: list[tuple[tuple[Any, ...], Any]] = load(file)
+        except EOFError:
+            return
+        yield from batch
+
+
+def iterate_external(source: Iterable[T], levels: SortLevels, run_size: int, directory: str | None) -> Iterator[T]:
+    """一定数ずつ並び替えた要素を一時ファイルに書き出し，それらを併合しながら列挙します。
+    メモリに保持する要素はおよそrun_size個に抑えられ，結果は安定ソートと一致します。
+
+    Args:
+        source (Iterable[T]): 読み込むシーケンス
+        levels (SortLevels): 並び替えの条件
+        run_size (int): 一度にメモリ上で並び替える要素数
+        directory (str | None): 一時ファイルを作成するディレクトリ。Noneの場合は既定の一時ディレクトリ
+
+    Yields:
+        T: 並び替えられた要素
+    """
+    iterator: Iterator[T] = iter(source)
+    chunk: list[T] = list(islice(iterator, run_size))
+    if len(chunk) < run_size:
+        # 全ての要素がメモリに収まる場合は書き出さない
+        yield from sort_values(chunk, levels)
+        return
+    files: list[IO[bytes]] = []
+    try:
+        while len(chunk) > 0:
+            files.append(_write_run(chunk, levels, directory))
+            # 次の要素を読み込む前に書き出した要素を解放する
+            chunk = []
+            chunk = list(islice(iterator, run_size))
+        # 同じキーの要素はheapq.mergeにより先に書き出した一時ファイルから取り出される
+        for _, value in merge(*map(_read_run, files), key=itemgetter(0)):
+            yield value
+    finally:
+        # 列挙が途中で終わった場合も一時ファイルを削除する
+        for file in files:
+            file.close()
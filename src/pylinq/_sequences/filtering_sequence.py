@@ -1,40 +1,57 @@
-from typing import Callable, Generic, final
+from itertools import compress, count, tee
+from typing import Any, Callable, Generic, Iterator, final
 
-from .. import LinqSequence
+from .. import optimization
+from ..linq_sequence import LinqSequence
 from ..type_variants import *
+from .planned_sequence import PlannedSequence
 
 
 @final
-class WhereSequence(LinqSequence[T], Generic[T]):
+class WhereSequence(PlannedSequence[T], Generic[T]):
     """絞り込みを行うシーケンスを表します。
     """
 
-    def __init__(self, source: LinqSequence[T], match: Callable[[T, int], bool]) -> None:
+    __slots__ = ("_match", "_indexed", "_source")
+
+    def __init__(self, source: LinqSequence[T], match: Callable[[T], bool] | Callable[[T, int], bool], indexed: bool) -> None:
         """WhereSequence[T]の新しいインスタンスを初期化します。
 
         Args:
             source (LinqSequence[T]): 読み込むシーケンス
-            match (Callable[[T, int], bool]): 絞り込み関数
+            match (Callable[[T], bool] | Callable[[T, int], bool]): 絞り込み関数
+            indexed (bool): matchがインデックスを受け取る場合はTrue，それ以外でFalse
         """
         super().__init__()
-        self.__index: int = 0
-        self.__match: Callable[[T, int], bool] = match
-        self.__source: LinqSequence[T] = source
-
-    def _in_iteration(self) -> bool:
-        return self.__source._in_iteration()
-
-    def _start_iteration(self) -> None:
-        self.__source._start_iteration()
-
-    def _stop_iteration(self) -> None:
-        self.__source._stop_iteration()
-        self.__index = 0
-
-    def _get_next(self) -> T:
-        while True:
-            current: T = next(self.__source)
-            i: int = self.__index
-            self.__index += 1
-            if self.__match(current, i):
-                return current
+        self._match: Callable[[T], bool] | Callable[[T, int], bool] = match
+        self._indexed: bool = indexed
+        self._source: LinqSequence[T] = source
+
+    def _enumerate(self) -> Iterator[T]:
+        if not optimization._rules["use_itertools"]:
+            return self._enumerate_fallback()
+        if not self._indexed:
+            return filter(self._match, self._source)  # type: ignore
+        # 条件の判定用と出力用に分岐させ，判定結果で出力を選択する
+        values, targets = tee(self._source)
+        return compress(values, map(self._match, targets, count()))  # type: ignore
+
+    def _enumerate_fallback(self) -> Iterator[T]:
+        if not self._indexed:
+            match1: Callable[[T], bool] = self._match  # type: ignore
+            for current in self._source:
+                if match1(current):
+                    yield current
+            return
+        match2: Callable[[T, int], bool] = self._match  # type: ignore
+        index: int = 0
+        for current in self._source:
+            if match2(current, index):
+                yield current
+            index += 1
+
+    def _get_max_count(self) -> int:
+        return self._source._get_max_count()
+
+    def _get_sort_level(self) -> tuple[Callable[[Any], Any], bool] | None:
+        return self._source._get_sort_level()
@@ -1,13 +1,22 @@
+from collections.abc import Sequence
 from typing import Callable, Generator, Generic, Iterable, Iterator, Sized, final
 
-from .. import LinqSequence
+from ..linq_sequence import LinqSequence
 from ..type_variants import *
 
 
+# 抽象基底クラスによる判定を省略できる代表的なシーケンスの型
+SEQUENCE_TYPES: frozenset[type] = frozenset((list, tuple, range, str, bytes))
+# inによる判定が要素の比較と一致する型。strやbytesのinは部分文字列の判定になるため含めない
+_MEMBERSHIP_TYPES: tuple[type, ...] = (set, frozenset, dict, range)
+
+
 class FromSequence(LinqSequence[T], Generic[T]):
     """イテラブルなオブジェクトをそのまま持つシーケンスのクラスです。
     """
 
+    __slots__ = ("_source",)
+
     def __init__(self, source: Iterable[T]) -> None:
         """FromSequence[T]の新しいインスタンスを初期化します。
 
@@ -15,26 +24,27 @@ class FromSequence(LinqSequence[T], Generic[T]):
             source (Iterable[T]): 使用するイテラブルなオブジェクト
         """
         super().__init__()
-        self.__iterator: Iterator[T] | None = None
         self._source: Iterable[T] = source
 
-    def _in_iteration(self) -> bool:
-        return not self.__iterator is None
-
-    def _start_iteration(self) -> None:
-        self.__iterator = iter(self._source)
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._source)
 
-    def _stop_iteration(self) -> None:
-        self.__iterator = None
-
-    def _get_next(self) -> T:
-        return next(self.__iterator)  # type: ignore
+    def contains(self, value: T) -> bool:
+        if isinstance(self._source, _MEMBERSHIP_TYPES):
+            try:
+                return value in self._source
+            except TypeError:
+                # ハッシュ化できない値は集合や辞書に含まれない
+                pass
+        return super().contains(value)
 
 
 class SizedFromSequence(FromSequence[T], Sized, Generic[T]):
     """サイズ付きのイテラブルなオブジェクトをそのまま持つシーケンスのクラスです。
     """
 
+    __slots__ = ("_indexable",)
+
     def __init__(self, source: Iterable[T]) -> None:
         """SizedSequence[T]の新しいインスタンスを初期化します。
 
@@ -42,16 +52,25 @@ class SizedFromSequence(FromSequence[T], Sized, Generic[T]):
             source (Iterable[T]): 使用するイテラブルなオブジェクト
         """
         super().__init__(source)
+        self._indexable: bool = type(source) in SEQUENCE_TYPES or isinstance(source, Sequence)
 
     def __len__(self) -> int:
         return len(self._source)  # type: ignore
 
+    def _is_indexable(self) -> bool:
+        return self._indexable
+
+    def _get_item(self, index: int) -> T:
+        return self._source[index]  # type: ignore
+
 
 @final
 class DictSequence(LinqSequence[tuple[TKey, TValue]], Sized, Generic[TKey, TValue]):
     """辞書をそのまま持つシーケンスのクラスです。
     """
 
+    __slots__ = ("__source",)
+
     def __init__(self, source: dict[TKey, TValue]) -> None:
         """DictSequence[TKey, TValue]の新しいインスタンスを初期化します。
 
@@ -59,21 +78,17 @@ class DictSequence(LinqSequence[tuple[TKey, TValue]], Sized, Generic[TKey, TValu
             source (dict[TKey, TValue]): 使用する辞書
         """
         super().__init__()
-        self.__iterator: Iterator[TKey] | None = None
         self.__source: dict[TKey, TValue] = source
 
-    def _in_iteration(self) -> bool:
-        return not self.__iterator is None
-
-    def _start_iteration(self) -> None:
-        self.__iterator = iter(self.__source)
+    def __iter__(self) -> Iterator[tuple[TKey, TValue]]:
+        return iter(self.__source.items())
 
-    def _stop_iteration(self) -> None:
-        self.__iterator = None
-
-    def _get_next(self) -> tuple[TKey, TValue]:
-        key: TKey = next(self.__iterator)  # type: ignore
-        return (key, self.__source[key])
+    def contains(self, value: tuple[TKey, TValue]) -> bool:
+        try:
+            key, item = value
+            return key in self.__source and self.__source[key] == item
+        except (TypeError, ValueError):
+            return False
 
     def __len__(self) -> int:
         return len(self.__source)
@@ -83,6 +98,8 @@ class GeneratorSequence(LinqSequence[T], Generic[T]):
     """Generatorを基にしたシーケンスのクラスです。
     """
 
+    __slots__ = ("__func", "__args")
+
     def __init__(self, func: Callable[[*TArgs], Generator[T, None, None]], *args: *TArgs) -> None:  # type: ignore
         """GeneratorSequence[T]の新しいインスタンスを初期化します。
 
@@ -93,16 +110,6 @@ class GeneratorSequence(LinqSequence[T], Generic[T]):
         super().__init__()
         self.__func: Callable[[*TArgs], Generator[T, None, None]] = func  # type: ignore
         self.__args: tuple = args
-        self.__geneartor: Generator[T, None, None] | None = None
-
-    def _in_iteration(self) -> bool:
-        return not self.__geneartor is None
-
-    def _start_iteration(self) -> None:
-        self.__geneartor = self.__func(*self.__args)
-
-    def _stop_iteration(self) -> None:
-        self.__geneartor = None
 
-    def _get_next(self) -> T:
-        return next(self.__geneartor)  # type: ignore
+    def __iter__(self) -> Iterator[T]:
+        return self.__func(*self.__args)
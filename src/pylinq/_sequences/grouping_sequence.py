@@ -1,27 +1,37 @@
-from typing import Generic, Hashable, Iterator, Sized, final
+from itertools import groupby, starmap
+from typing import Any, Callable, Generic, Hashable, Iterator, Sized, final
 
-from .. import Grouping, LinqSequence, Lookup
+from ..grouping import Grouping, Lookup
+from ..linq_sequence import LinqSequence
 from ..type_variants import *
+from .create_sequence import EmptySequence
+
+
+# キーが存在しない場合に返す空のシーケンス
+_EMPTY: LinqSequence[Any] = EmptySequence()
 
 
 @final
 class GroupingImpl(Grouping[TKey, T], Sized, Hashable, Generic[TKey, T]):
     """Grouping[TKey, T]の実装です。
     """
+
+    __slots__ = ("__key", "__values")
+
     @property
     def key(self) -> TKey:
         return self.__key
 
-    def __init__(self, key: TKey) -> None:
+    def __init__(self, key: TKey, values: list[T] | None = None) -> None:
         """GroupingImpl[TKey, T]の新しいインスタンスを初期化します。
 
         Args:
             key (TKey): キー
+            values (list[T] | None): グループの要素として所有するリスト。Noneの場合は空のリスト
         """
         super().__init__()
         self.__key: TKey = key
-        self.__values: list[T] = list[T]()
-        self.__iterator: Iterator[T] | None = None
+        self.__values: list[T] = [] if values is None else values
 
     def add(self, value: T) -> None:
         """値を追加します。
@@ -31,35 +41,103 @@ class GroupingImpl(Grouping[TKey, T], Sized, Hashable, Generic[TKey, T]):
         """
         self.__values.append(value)
 
-    def _in_iteration(self) -> bool:
-        return not self.__iterator is None
-
-    def _start_iteration(self) -> None:
-        self.__iterator = iter(self.__values)
-
-    def _stop_iteration(self) -> None:
-        self.__iterator = None
-
-    def _get_next(self) -> T:
-        return next(self.__iterator)  # type: ignore
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.__values)
 
     def __len__(self) -> int:
         return len(self.__values)
 
+    def _is_indexable(self) -> bool:
+        return True
+
+    def _get_item(self, index: int) -> T:
+        return self.__values[index]
+
     def __hash__(self) -> int:
         return hash(self.key)
 
 
 class LookupImpl(Lookup[TKey, TValue], Generic[TKey, TValue]):
     """Lookup[TKey, TValue]の実装です。
+
+    キーごとの値はリストとしてのみ保持し，Groupingはキーで参照された時や列挙時にリストを共有するビューとして生成します。
+    snapshotで得た複製とは辞書とリストを共有し，変更時に変更する部分のみを複製します。
     """
 
+    __slots__ = ("__source", "__shared", "__owned")
+
     def __init__(self) -> None:
         """LookupImpl[TKey, TValue]の新しいインスタンスを初期化します。
         """
         super().__init__()
-        self.__source: dict[TKey, GroupingImpl[TKey, TValue]] = dict[TKey, GroupingImpl[TKey, TValue]]()
-        self.__key_iterator: Iterator[TKey] | None = None
+        self.__source: dict[TKey, list[TValue]] = {}
+        # 辞書を他のインスタンスと共有しているかどうか
+        self.__shared: bool = False
+        # 変更できるリストのキー。Noneの場合は全てのリストを変更できる
+        self.__owned: set[TKey] | None = None
+
+    @staticmethod
+    def create(source: Iterable[T], key_selector: Callable[[T], TKey], value_selector: Callable[[T], TValue] | None = None) -> "LookupImpl[TKey, Any]":
+        """シーケンスの要素をキーごとにまとめたLookupを生成します。
+
+        Args:
+            source (Iterable[T]): 読み込むシーケンス
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            value_selector (Callable[[T], TValue] | None): 要素を値に変換する関数。Noneの場合は要素自身
+
+        Returns:
+            LookupImpl[TKey, Any]: 生成されたLookup
+        """
+        result: LookupImpl[TKey, Any] = LookupImpl()
+        groups: dict[TKey, list[Any]] = result.__source
+        get: Callable[[TKey], list[Any] | None] = groups.get
+        values: list[Any] | None
+        if value_selector is None:
+            for current in source:
+                key: TKey = key_selector(current)
+                values = get(key)
+                if values is None:
+                    groups[key] = [current]
+                else:
+                    values.append(current)
+            return result
+        for current in source:
+            key = key_selector(current)
+            values = get(key)
+            if values is None:
+                groups[key] = [value_selector(current)]
+            else:
+                values.append(value_selector(current))
+        return result
+
+    def __get_writable(self, key: TKey, create: bool) -> list[TValue] | None:
+        """変更できる，キーに対応する値のリストを取得します。
+        共有している辞書やリストは，ここで複製されます。
+
+        Args:
+            key (TKey): キー
+            create (bool): キーが存在しない場合に追加する場合はTrue
+
+        Returns:
+            list[TValue] | None: keyに対応する値のリスト。存在せず追加しない場合はNone
+        """
+        if self.__shared:
+            self.__source = self.__source.copy()
+            self.__shared = False
+        source: dict[TKey, list[TValue]] = self.__source
+        owned: set[TKey] | None = self.__owned
+        values: list[TValue] | None = source.get(key)
+        if values is None:
+            if not create:
+                return None
+            values = []
+            source[key] = values
+        elif owned is not None and key not in owned:
+            values = values.copy()
+            source[key] = values
+        if owned is not None:
+            owned.add(key)
+        return values
 
     def contains_key(self, key: TKey) -> bool:
         return key in self.__source
@@ -72,13 +150,9 @@ class LookupImpl(Lookup[TKey, TValue], Generic[TKey, TValue]):
             key (TKey): キー
 
         Returns:
-            GroupingImpl[TKey, TValue]: keyに基づく存在するまたは生成されたインスタンス
+            GroupingImpl[TKey, TValue]: keyに基づく存在するまたは生成されたインスタンス。次のsnapshotまでに追加した値はこのLookupに反映される
         """
-        if key in self.__source:
-            return self.__source[key]
-        result = GroupingImpl[TKey, TValue](key)
-        self.__source[key] = result
-        return result
+        return GroupingImpl(key, self.__get_writable(key, True))
 
     def get_grouping(self, key: TKey) -> GroupingImpl[TKey, TValue] | None:
         """キーに基づくGroupingのインスタンスを取得します。
@@ -89,27 +163,177 @@ class LookupImpl(Lookup[TKey, TValue], Generic[TKey, TValue]):
         Returns:
             GroupingImpl[TKey, TValue] | None: keyに基づくインスタンス。存在しない場合はNone
         """
-        if key in self.__source:
-            return self.__source[key]
-        return None
+        values: list[TValue] | None = self.__source.get(key)
+        if values is None:
+            return None
+        return GroupingImpl(key, values)
+
+    def get_values(self, key: TKey) -> list[TValue] | None:
+        """Groupingを生成せずに，キーに対応する値のリストを取得します。
+        返されたリストは変更しないでください。
+
+        Args:
+            key (TKey): キー
 
-    def _in_iteration(self) -> bool:
-        return not self.__key_iterator is None
+        Returns:
+            list[TValue] | None: keyに対応する値のリスト。存在しない場合はNone
+        """
+        return self.__source.get(key)
 
-    def _start_iteration(self) -> None:
-        self.__key_iterator = iter(self.__source)
+    def add(self, key: TKey, value: TValue) -> None:
+        self.__get_writable(key, True).append(value)  # type: ignore
 
-    def _stop_iteration(self) -> None:
-        self.__key_iterator = None
+    def add_range(self, source: Iterable[T], key_selector: Callable[[T], TKey], value_selector: Callable[[T], TValue] | None = None) -> None:
+        get_writable: Callable[[TKey, bool], list[TValue] | None] = self.__get_writable
+        if value_selector is None:
+            for current in source:
+                get_writable(key_selector(current), True).append(current)  # type: ignore
+            return
+        for current in source:
+            get_writable(key_selector(current), True).append(value_selector(current))  # type: ignore
 
-    def _get_next(self) -> Grouping[TKey, TValue]:
-        key: TKey = next(
-            self.__key_iterator  # type: ignore
-        )
-        return self.__source[key]
+    def remove(self, key: TKey, value: TValue) -> bool:
+        current: list[TValue] | None = self.__source.get(key)
+        if current is None or value not in current:
+            return False
+        values: list[TValue] = self.__get_writable(key, False)  # type: ignore
+        values.remove(value)
+        if len(values) == 0:
+            del self.__source[key]
+            if self.__owned is not None:
+                self.__owned.discard(key)
+        return True
 
-    def __getitem__(self, key: TKey) -> LinqSequence[TValue]:
-        return self.__source.get(key, LinqSequence[TValue].empty())
+    def remove_range(self, source: Iterable[T], key_selector: Callable[[T], TKey], value_selector: Callable[[T], TValue] | None = None) -> None:
+        remove: Callable[[TKey, TValue], bool] = self.remove
+        if value_selector is None:
+            for current in source:
+                remove(key_selector(current), current)  # type: ignore
+            return
+        for current in source:
+            remove(key_selector(current), value_selector(current))
+
+    def merge(self, other: Lookup[TKey, TValue]) -> None:
+        # 自身を併合する場合に，追加中のリストを読み込まないよう先に複製を取る
+        groupings: list[Grouping[TKey, TValue]] = list(other.snapshot() if other is self else other)
+        for grouping in groupings:
+            self.__get_writable(grouping.key, True).extend(grouping)  # type: ignore
+
+    def snapshot(self) -> "LookupImpl[TKey, TValue]":
+        result: LookupImpl[TKey, TValue] = LookupImpl()
+        result.__source = self.__source
+        result.__shared = True
+        result.__owned = set()
+        # 以降はどちらも，変更する前に辞書とリストを複製する
+        self.__shared = True
+        self.__owned = set()
+        return result
+
+    def __iter__(self) -> Iterator[Grouping[TKey, TValue]]:
+        return starmap(GroupingImpl, self.__source.items())
+
+    def __getitem__(self, key: TKey) -> LinqSequence[TValue]:  # type: ignore[override]
+        values: list[TValue] | None = self.__source.get(key)
+        if values is None:
+            # 空のシーケンスは状態を持たないため共有する
+            return _EMPTY
+        return GroupingImpl(key, values)
 
     def __len__(self) -> int:
         return len(self.__source)
+
+
+@final
+class AdjacentGroupingSequence(LinqSequence[Any], Generic[T, TKey, T2, TResult]):
+    """キーが等しい連続した要素ごとにグループ化したシーケンスを表します。
+
+    キーが変わるたびにグループを生成するため，メモリに保持するのは現在のグループの要素のみです。
+    生成したグループは次のグループに進んだ後も使用できます。
+    """
+
+    __slots__ = ("_source", "_key_selector", "_element_selector", "_result_selector")
+
+    def __init__(
+        self,
+        source: LinqSequence[T],
+        key_selector: Callable[[T], TKey],
+        element_selector: Callable[[T], T2] | None,
+        result_selector: Callable[[TKey, LinqSequence[Any]], TResult] | None
+    ) -> None:
+        """AdjacentGroupingSequence[T, TKey, T2, TResult]の新しいインスタンスを初期化します。
+
+        Args:
+            source (LinqSequence[T]): 読み込むシーケンス
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            element_selector (Callable[[T], T2] | None): 要素を変換する関数。Noneの場合は変換しない
+            result_selector (Callable[[TKey, LinqSequence[Any]], TResult] | None): キーとグループ化された要素を変換する関数。Noneの場合はGroupingを返す
+        """
+        super().__init__()
+        self._source: LinqSequence[T] = source
+        self._key_selector: Callable[[T], TKey] = key_selector
+        self._element_selector: Callable[[T], T2] | None = element_selector
+        self._result_selector: Callable[[TKey, LinqSequence[Any]], TResult] | None = result_selector
+
+    def __iter__(self) -> Iterator[Any]:
+        element_selector: Callable[[T], T2] | None = self._element_selector
+        result_selector: Callable[[TKey, LinqSequence[Any]], TResult] | None = self._result_selector
+        for key, run in groupby(self._source, self._key_selector):
+            # groupbyのグループは次のグループに進むと読めなくなるため，リストに移してから渡す
+            grouping: GroupingImpl[TKey, Any] = GroupingImpl(key, list(run) if element_selector is None else list(map(element_selector, run)))
+            yield grouping if result_selector is None else result_selector(key, grouping)
+
+    def _get_max_count(self) -> int:
+        return self._source._get_max_count()
+
+
+@final
+class TopByGroupSequence(LinqSequence[Grouping[TKey, T]], Generic[T, TKey]):
+    """キーごとに，並び替えた先頭から指定した個数の要素をグループ化したシーケンスを表します。
+
+    キーごとに保持する要素はcountの2倍程度までのため，メモリはキーの数とcountの積に比例します。
+    """
+
+    __slots__ = ("_source", "_key_selector", "_order_key", "_count", "_descending")
+
+    def __init__(self, source: LinqSequence[T], key_selector: Callable[[T], TKey], order_key: Callable[[T], Any], count: int, descending: bool) -> None:
+        """TopByGroupSequence[T, TKey]の新しいインスタンスを初期化します。
+
+        Args:
+            source (LinqSequence[T]): 読み込むシーケンス
+            key_selector (Callable[[T], TKey]): 要素からグループのキーを選択する関数
+            order_key (Callable[[T], Any]): グループ内の並び替えのキーを生成する関数
+            count (int): グループごとに取得する要素数
+            descending (bool): 降順に並び替える場合はTrue
+        """
+        super().__init__()
+        self._source: LinqSequence[T] = source
+        self._key_selector: Callable[[T], TKey] = key_selector
+        self._order_key: Callable[[T], Any] = order_key
+        self._count: int = count
+        self._descending: bool = descending
+
+    def __iter__(self) -> Iterator[Grouping[TKey, T]]:
+        key_selector: Callable[[T], TKey] = self._key_selector
+        order_key: Callable[[T], Any] = self._order_key
+        count: int = self._count
+        descending: bool = self._descending
+        # 一定数を読み込むごとに並び替えて先頭だけを残す。残した要素は後に読み込む要素より前にあるため，安定ソートで元の順序が保たれる
+        limit: int = max(count * 2, 16)
+        buffers: dict[TKey, list[T]] = {}
+        for current in self._source:
+            group: TKey = key_selector(current)
+            buffer: list[T] | None = buffers.get(group)
+            if buffer is None:
+                buffer = []
+                buffers[group] = buffer
+            buffer.append(current)
+            if len(buffer) >= limit:
+                buffer.sort(key=order_key, reverse=descending)
+                del buffer[count:]
+        for group, buffer in buffers.items():
+            buffer.sort(key=order_key, reverse=descending)
+            del buffer[count:]
+            yield GroupingImpl(group, buffer)
+
+    def _get_max_count(self) -> int:
+        return self._source._get_max_count()
@@ -1,72 +1,587 @@
-from typing import Callable, Generic
+from bisect import bisect_right
+from heapq import heapify, heappop, merge, nlargest, nsmallest
+from itertools import groupby, islice
+from operator import neg
+from typing import Any, Callable, Generic, Iterator, final
 
-from .. import LinqSequence, OrderedLinqSequence
+from .._common import identity
+from ..linq_sequence import LinqSequence
+from ..ordering import OrderedLinqSequence
 from ..type_variants import *
+from .concatination_sequence import ConcatSequence
+from .from_sequence import SizedFromSequence
 
 
-class OrderedLinqSequenceImpl(OrderedLinqSequence[T], Generic[T, TKey]):
+# 符号を反転すると大小が逆になる型
+_NEGATABLE_TYPES: frozenset[type] = frozenset((int, float, bool))
+
+# 要素が無いことを表す値
+_MISSING: Any = object()
+
+# 並び替えの条件。キーを生成する関数と降順かどうかの組を優先度の高い順に並べる
+SortLevels = tuple[tuple[Callable[[Any], Any], bool], ...]
+
+
+def sort_values(values: list[T], levels: SortLevels) -> list[T]:
+    """リストを並び替えの条件に従って安定に並び替えます。
+    各条件のキーを生成する関数は要素ごとに一度だけ呼び出されます。
+
+    Args:
+        values (list[T]): 並び替えるリスト。条件が一つの場合はこのリストを直接並び替える
+        levels (SortLevels): 並び替えの条件
+
+    Returns:
+        list[T]: 並び替えられたリスト
+    """
+    if len(levels) == 1:
+        key_selector: Callable[[Any], Any]
+        descending: bool
+        key_selector, descending = levels[0]
+        values.sort(key=key_selector, reverse=descending)
+        return values
+    # 優先度の低い条件から順に安定ソートを重ね，条件ごとに向きを変える
+    indices: list[int] = list(range(len(values)))
+    for key_selector, descending in reversed(levels):
+        keys: list[Any] = list(map(key_selector, values))
+        indices.sort(key=keys.__getitem__, reverse=descending)
+    return list(map(values.__getitem__, indices))
+
+
+def compare_keys(keys1: list[Any], keys2: list[Any], levels: SortLevels) -> int:
+    """並び替えの条件に従って二つの要素のキーを比較します。
+
+    Args:
+        keys1 (list[Any]): 一つ目の要素の条件ごとのキー
+        keys2 (list[Any]): 二つ目の要素の条件ごとのキー
+        levels (SortLevels): 並び替えの条件
+
+    Returns:
+        int: 一つ目の要素が先に並ぶ場合は負，後に並ぶ場合は正，同順の場合は0
+    """
+    for key1, key2, (_, descending) in zip(keys1, keys2, levels):
+        if key1 < key2:
+            return 1 if descending else -1
+        if key2 < key1:
+            return -1 if descending else 1
+    return 0
+
+
+def select_top(source: Iterable[T], levels: SortLevels, count: int) -> list[T]:
+    """全体を並び替えずに，並び替えた先頭から指定した個数の要素を取得します。
+    要素数に対してO(n log count)の時間とO(count)のメモリで動作し，結果は安定ソートの先頭と一致します。
+    条件が複数の場合は，count件の要素を残しながら一定数ずつ読み込んで並び替えます。
+
+    Args:
+        source (Iterable[T]): 読み込むシーケンス
+        levels (SortLevels): 並び替えの条件
+        count (int): 取得する要素数
+
+    Returns:
+        list[T]: 並び替えた先頭からcount個の要素
+    """
+    if count <= 0:
+        return []
+    if len(levels) == 1:
+        key_selector: Callable[[Any], Any]
+        descending: bool
+        key_selector, descending = levels[0]
+        if descending:
+            return nlargest(count, source, key_selector)
+        return nsmallest(count, source, key_selector)
+    # 向きの異なる条件を含む場合も組み込みのソートで比較できるよう，一定数ずつ読み込んで並び替え先頭だけを残す
+    buffer_size: int = max(count * 4, 1024)
+    result: list[T] = []
+    iterator: Iterator[T] = iter(source)
+    while True:
+        chunk: list[T] = list(islice(iterator, buffer_size))
+        if len(chunk) == 0:
+            return result
+        # 残した要素は読み込んだ要素より前にあるため，安定ソートで元の順序が保たれる
+        result.extend(chunk)
+        result = sort_values(result, levels)
+        del result[count:]
+
+
+@final
+class Descending:
+    """降順の条件のキーを，大小を逆にして比較できるようにします。
+    """
+
+    __slots__ = ("_key",)
+
+    def __init__(self, key: Any) -> None:
+        """Descendingの新しいインスタンスを初期化します。
+
+        Args:
+            key (Any): 元のキー
+        """
+        self._key: Any = key
+
+    def __lt__(self, other: "Descending") -> bool:
+        return other._key < self._key
+
+    def __eq__(self, other: object) -> bool:
+        # ソートと同じく，どちらも小さくない場合を同順とする
+        return not self._key < other._key and not other._key < self._key  # type: ignore
+
+
+def to_comparable(keys: list[Any], descending: bool) -> tuple[Iterable[Any], Callable[[Any], Any] | None]:
+    """一つの条件のキーを，組み込みの比較で昇順に並ぶ形に変換します。
+
+    Args:
+        keys (list[Any]): 条件のキー
+        descending (bool): 降順の条件の場合はTrue
+
+    Returns:
+        tuple[Iterable[Any], Callable[[Any], Any] | None]: 変換したキーと，元のキーに適用した変換
+    """
+    if not descending:
+        return (keys, None)
+    # 数値のキーは符号を反転すれば組み込みの比較のまま降順にできる
+    transform: Callable[[Any], Any] = neg if set(map(type, keys)) <= _NEGATABLE_TYPES else Descending
+    return (map(transform, keys), transform)
+
+
+def get_comparable_columns(values: list[T], levels: SortLevels) -> tuple[list[Iterable[Any]], list[Callable[[Any], Any] | None]]:
+    """条件ごとのキーを，組にして組み込みの比較で昇順に並ぶ形で取得します。
+
+    Args:
+        values (list[T]): 対象のリスト
+        levels (SortLevels): 並び替えの条件
+
+    Returns:
+        tuple[list[Iterable[Any]], list[Callable[[Any], Any] | None]]: 条件ごとのキーと，元のキーに適用した変換
+    """
+    columns: list[Iterable[Any]] = []
+    transforms: list[Callable[[Any], Any] | None] = []
+    for key_selector, descending in levels:
+        # 降順の条件のみ型を調べるためにリストにする
+        keys: Iterable[Any] = list(map(key_selector, values)) if descending else map(key_selector, values)
+        column: Iterable[Any]
+        transform: Callable[[Any], Any] | None
+        column, transform = to_comparable(keys, descending)  # type: ignore
+        columns.append(column)
+        transforms.append(transform)
+    return (columns, transforms)
+
+
+def iterate_incremental(values: list[T], levels: SortLevels) -> Iterator[T]:
+    """ヒープを用いて，要素が必要になるたびに並び替えを進めながら列挙します。
+    結果は安定ソートと一致します。
+
+    Args:
+        values (list[T]): 並び替えるリスト
+        levels (SortLevels): 並び替えの条件
+
+    Yields:
+        T: 並び替えられた要素
+    """
+    columns: list[Iterable[Any]] = get_comparable_columns(values, levels)[0]
+    # 位置を最後に加え，同順の要素を元の順序で取り出す
+    heap: list[tuple[Any, ...]] = list(zip(*columns, range(len(values))))
+    heapify(heap)
+    while len(heap) > 0:
+        yield values[heappop(heap)[-1]]
+
+
+def iterate_assumed(source: Iterable[T], levels: SortLevels, assumed: int) -> Iterator[T]:
+    """先頭の条件で並び替え済みの要素を，残りの条件で並び替えながら列挙します。
+    先頭の条件のキーが等しい連続した要素ごとに並び替えるため，メモリに保持するのはその要素のみです。
+
+    Args:
+        source (Iterable[T]): 先頭のassumed個の条件で並び替え済みのシーケンス
+        levels (SortLevels): 並び替えの条件
+        assumed (int): 並び替え済みとみなす先頭の条件の数
+
+    Yields:
+        T: 並び替えられた要素
+    """
+    if len(levels) == assumed:
+        yield from source
+        return
+    selectors: list[Callable[[Any], Any]] = [key_selector for key_selector, _ in levels[:assumed]]
+    rest: SortLevels = levels[assumed:]
+    key: Callable[[T], Any] = selectors[0] if len(selectors) == 1 else lambda x: tuple([key_selector(x) for key_selector in selectors])
+    for _, run in groupby(source, key):
+        yield from sort_values(list(run), rest)
+
+
+@final
+class SortCache(Generic[T]):
+    """並び替えた要素と，二分探索に用いるキーを保持します。
+    """
+
+    __slots__ = ("values", "keys", "transforms")
+
+    def __init__(self) -> None:
+        """SortCache[T]の新しいインスタンスを初期化します。
+        """
+        self.values: list[T] | None = None
+        self.keys: list[Any] = []
+        self.transforms: list[Callable[[Any], Any] | None] = []
+
+    def build(self, values: list[T], levels: SortLevels) -> list[T]:
+        """要素を並び替えて保持します。
+
+        Args:
+            values (list[T]): 並び替えるリスト
+            levels (SortLevels): 並び替えの条件
+
+        Returns:
+            list[T]: 並び替えられた要素
+        """
+        columns: list[Iterable[Any]]
+        transforms: list[Callable[[Any], Any] | None]
+        columns, transforms = get_comparable_columns(values, levels)
+        # 条件が一つであればキーをそのまま，複数であれば組にして比較する
+        keys: list[Any] = list(columns[0]) if len(columns) == 1 else list(zip(*columns))
+        order: list[int] = sorted(range(len(values)), key=keys.__getitem__)
+        self.keys = list(map(keys.__getitem__, order))
+        self.transforms = transforms
+        result: list[T] = list(map(values.__getitem__, order))
+        # 他のスレッドが途中の状態を読まないよう，要素は最後に設定する
+        self.values = result
+        return result
+
+    def search_after(self, key: Any) -> int:
+        """指定したキーより後に並ぶ最初の要素の位置を二分探索します。
+
+        Args:
+            key (Any): 元のキー。条件が複数の場合は条件ごとのキーのタプル
+
+        Returns:
+            int: keyより後に並ぶ最初の要素の位置
+        """
+        transforms: list[Callable[[Any], Any] | None] = self.transforms
+        if len(transforms) == 1:
+            comparable: Any = key if transforms[0] is None else transforms[0](key)
+        else:
+            comparable = tuple([current if transform is None else transform(current) for current, transform in zip(key, transforms)])
+        return bisect_right(self.keys, comparable)
+
+
+class OrderedLinqSequenceImpl(OrderedLinqSequence[T], Generic[T]):
     """OrderedLinqSequenceの実装です。
     """
 
-    def __init__(self, source: LinqSequence[T], key_selector: Callable[[T], TKey], descending: bool, parent: "OrderedLinqSequence[T] | None") -> None:
-        super().__init__()
-        self.__source: LinqSequence[T] = source
-        self.__key_selector: Callable[[T], TKey] = key_selector
-        self.__descending: bool = descending
-        self.__parent: OrderedLinqSequence[T] | None = parent
-        self.__iterated: list[T] = list[T]()
-        self.__keys: list[tuple[TKey, int]] = list[tuple[TKey, int]]()
-        self.__index_selector: Callable[[int], int]
-        self.__index: int = 0
-
-    def __index_selector_ascending(self, value: int) -> int:
-        """昇順列挙時のインデックスの導出する関数です。
+    __slots__ = ("_source", "_levels", "_mode", "_option")
+
+    def __init__(self, source: LinqSequence[T], levels: SortLevels, mode: str = "sort", option: Any = None) -> None:
+        """OrderedLinqSequenceImpl[T]の新しいインスタンスを初期化します。
 
         Args:
-            value (int): 通常インデックス
+            source (LinqSequence[T]): 読み込むシーケンス
+            levels (SortLevels): 並び替えの条件
+            mode (str): 並び替えの実行方法。"sort"で全体の並び替え，"incremental"でヒープによる逐次の並び替え，
+                "cached"で並び替えた結果の保持，"external"で一時ファイルを用いた外部ソート，"parallel"でプロセスプールによる並列ソート，
+                "assumed"で並び替え済みとみなした先頭の条件を除く並び替え
+            option (Any): 実行方法ごとの設定。"cached"ではSortCache，"external"では一度に並び替える要素数とディレクトリの組，
+                "parallel"ではプロセス数と並列に並び替える最小の要素数の組，"assumed"では並び替え済みとみなす先頭の条件の数
+        """
+        super().__init__()
+        self._source: LinqSequence[T] = source
+        self._levels: SortLevels = levels
+        self._mode: str = mode
+        self._option: Any = option
+
+    def __iter__(self) -> Iterator[T]:
+        mode: str = self._mode
+        if mode == "incremental":
+            yield from iterate_incremental(self._source.to_list(), self._levels)
+        elif mode == "cached":
+            yield from self.__get_cache().values  # type: ignore
+        elif mode == "external":
+            # 一時ファイルを扱うモジュールは読み込みが重いため，使用する時に読み込む
+            from .external_sort import iterate_external
+            yield from iterate_external(self._source, self._levels, *self._option)
+        elif mode == "parallel":
+            # プロセスプールを扱うモジュールは読み込みが重いため，使用する時に読み込む
+            from .parallel_sort import sort_parallel
+            yield from sort_parallel(self._source.to_list(), self._levels, *self._option)
+        elif mode == "assumed":
+            yield from iterate_assumed(self._source, self._levels, self._option)
+        else:
+            yield from sort_values(self._source.to_list(), self._levels)
+
+    def __get_cache(self) -> SortCache[T]:
+        """並び替えた結果を保持するキャッシュを取得します。
+        保持する実行方法でない場合は，呼び出しごとに並び替えた新しいキャッシュを返します。
+
+        Returns:
+            SortCache[T]: 並び替え済みのキャッシュ
+        """
+        cache: SortCache[T] = self._option if self._mode == "cached" else SortCache()
+        if cache.values is None:
+            cache.build(self._source.to_list(), self._levels)
+        return cache
+
+    def __is_presorted(self) -> bool:
+        """全ての条件で並び替え済みとみなし，読み込むシーケンスをそのまま列挙するかどうかを取得します。
 
         Returns:
-            int: 昇順インデックス
+            bool: 読み込むシーケンスをそのまま列挙する場合True
         """
-        return value
+        return self._mode == "assumed" and len(self._levels) == self._option
+
+    def _try_get_count(self) -> int:
+        if self._mode == "cached" and self._option.values is not None:
+            return len(self._option.values)
+        return self._source._try_get_count()
+
+    def _get_max_count(self) -> int:
+        return self._source._get_max_count()
+
+    def _counting_source(self) -> LinqSequence[Any]:
+        return self._source._counting_source()
 
-    def __index_selector_descending(self, value: int) -> int:
-        """降順列挙時のインデックスの導出する関数です。
+    def _get_sort_level(self) -> tuple[Callable[[Any], Any], bool] | None:
+        return self._levels[0]
+
+    def _is_indexable(self) -> bool:
+        if self.__is_presorted():
+            return self._source._is_indexable()
+        # 並び替えた結果を保持した後に限り，列挙せずに任意の位置の要素を取得できる
+        return self._mode == "cached" and self._option.values is not None
+
+    def _get_item(self, index: int) -> T:
+        if self._mode == "assumed":
+            return self._source._get_item(index)
+        return self._option.values[index]
+
+    def seek_after(self, key: Any) -> LinqSequence[T]:
+        levels: SortLevels = self._levels
+        if self.__is_presorted():
+            # 並び替え済みの要素は，keyより後に並ぶ最初の要素まで読み飛ばす
+            keys: list[Any] = [key] if len(levels) == 1 else list(key)
+            return self._source.skip_while(lambda x: compare_keys([key_selector(x) for key_selector, _ in levels], keys, levels) <= 0)
+        cache: SortCache[T] = self.__get_cache()
+        return LinqSequence.from_iterable(cache.values).skip(cache.search_after(key))  # type: ignore
+
+    def __find_edge(self, last: bool) -> tuple[bool, T | None]:
+        """並び替えを行わずに先頭または末尾の要素を検索します。
 
         Args:
-            value (int): 通常インデックス
+            last (bool): 末尾の要素を検索する場合はTrue，先頭の要素を検索する場合はFalse
 
         Returns:
-            int: 降順インデックス
+            tuple[bool, T | None]: 要素が存在するかどうかと検索された要素
         """
-        return len(self.__keys) - value - 1
+        if self._mode == "cached":
+            values: list[T] = self.__get_cache().values  # type: ignore
+            if len(values) == 0:
+                return (False, None)
+            return (True, values[-1 if last else 0])
+        if self.__is_presorted():
+            found: T = self._source.last_or_default(_MISSING) if last else self._source.first_or_default(_MISSING)
+            return (False, None) if found is _MISSING else (True, found)
+        levels: SortLevels = self._levels
+        iterator: Iterator[T] = iter(self._source)
+        result: T
+        try:
+            result = next(iterator)
+        except StopIteration:
+            return (False, None)
+        if len(levels) > 1:
+            best_keys: list[Any] = [key_selector(result) for key_selector, _ in levels]
+            for current in iterator:
+                keys: list[Any] = [key_selector(current) for key_selector, _ in levels]
+                order: int = compare_keys(keys, best_keys, levels)
+                # 同順の要素は安定ソートと同じく，先頭では最初の，末尾では最後の要素を選ぶ
+                if (order >= 0) if last else (order < 0):
+                    result = current
+                    best_keys = keys
+            return (True, result)
 
-    def _in_iteration(self) -> bool:
-        return self.__index > 0
+        key_selector: Callable[[T], Any]
+        descending: bool
+        key_selector, descending = levels[0]
+        best: Any = key_selector(result)
+        if last != descending:
+            for current in iterator:
+                key: Any = key_selector(current)
+                if last and not key < best or not last and best < key:
+                    result = current
+                    best = key
+        else:
+            for current in iterator:
+                key = key_selector(current)
+                if last and not best < key or not last and key < best:
+                    result = current
+                    best = key
+        return (True, result)
 
-    def _start_iteration(self) -> None:
-        values: list[T] = self.__iterated
-        values.extend(self.__source.to_list())
-        keys: list[tuple[TKey, int]] = self.__keys
-        keys.extend(map(lambda x: (self.__key_selector(x), 0), values))
-        for i in range(len(values)):
-            keys[i] = (keys[i][0], i)
+    def element_at(self, index: int) -> T:
+        if index < 0:
+            raise ValueError("parameter 'index' must be 0 or positive value")
+        if self._mode == "cached" or self.__is_presorted():
+            return super().element_at(index)
+        top: list[T] = select_top(self._source, self._levels, index + 1)
+        if index >= len(top):
+            raise IndexError()
+        return top[index]
 
-        keys.sort(key=lambda x: x[0])  # type:ignore
+    def element_at_or_default(self, index: int, default: T) -> T:
+        if index < 0:
+            raise ValueError("parameter 'index' must be 0 or positive value")
+        if self._mode == "cached" or self.__is_presorted():
+            return super().element_at_or_default(index, default)
+        top: list[T] = select_top(self._source, self._levels, index + 1)
+        return top[index] if index < len(top) else default
 
-        self.__index_selector = self.__index_selector_descending if self.__descending else self.__index_selector_ascending
+    def first(self, match: Callable[[T], bool] | None = None) -> T:
+        if match is not None:
+            return super().first(match)
+        found: tuple[bool, T | None] = self.__find_edge(False)
+        if not found[0]:
+            raise ValueError("sequence is empty")
+        return found[1]  # type: ignore
 
-    def _stop_iteration(self) -> None:
-        self.__index = 0
-        self.__iterated.clear()
-        self.__keys.clear()
+    def first_or_default(self, default: T, match: Callable[[T], bool] | None = None) -> T:
+        if match is not None:
+            return super().first_or_default(default, match)
+        found: tuple[bool, T | None] = self.__find_edge(False)
+        return found[1] if found[0] else default  # type: ignore
 
-    def _get_next(self) -> T:
-        if self.__index == len(self.__keys):
-            raise StopIteration()
-        i: int = self.__index_selector(self.__index)
-        self.__index += 1
-        return self.__iterated[self.__keys[i][1]]
+    def last(self, match: Callable[[T], bool] | None = None) -> T:
+        if match is not None:
+            return super().last(match)
+        found: tuple[bool, T | None] = self.__find_edge(True)
+        if not found[0]:
+            raise ValueError("sequence is empty")
+        return found[1]  # type: ignore
+
+    def last_or_default(self, default: T, match: Callable[[T], bool] | None = None) -> T:
+        if match is not None:
+            return super().last_or_default(default, match)
+        found: tuple[bool, T | None] = self.__find_edge(True)
+        return found[1] if found[0] else default  # type: ignore
 
     def _create_oredered_sequence(self, key_selector: Callable[[T], T2], descending: bool) -> OrderedLinqSequence[T]:
-        return OrderedLinqSequenceImpl[T, tuple[TKey, T2]](self.__source, lambda x: (self.__key_selector(x), key_selector(x)), descending, self)
+        # 条件が変わると並び替えの結果も変わるため，キャッシュは引き継がない
+        option: Any = SortCache() if self._mode == "cached" else self._option
+        return OrderedLinqSequenceImpl(self._source, self._levels + ((key_selector, descending),), self._mode, option)
+
+    def _with_mode(self, mode: str, option: Any) -> OrderedLinqSequence[T]:
+        if mode == "cached" and option is None:
+            option = SortCache()
+        return OrderedLinqSequenceImpl(self._source, self._levels, mode, option)
+
+
+@final
+class MergeSequence(LinqSequence[T], Generic[T]):
+    """並び替え済みの複数のシーケンスを，順序を保って併合したシーケンスを表します。
+
+    併合する全ての部分は一つの結合シーケンスとして保持されます。
+    """
+
+    __slots__ = ("_source", "_key_selector", "_descending")
+
+    def __init__(self, source: ConcatSequence[T], key_selector: Callable[[T], Any] | None, descending: bool) -> None:
+        """MergeSequence[T]の新しいインスタンスを初期化します。
+
+        Args:
+            source (ConcatSequence[T]): 併合する部分を結合したシーケンス
+            key_selector (Callable[[T], Any] | None): 各部分が並び替えられているキーを生成する関数。Noneの場合は要素自身
+            descending (bool): 各部分が降順に並んでいる場合はTrue
+        """
+        super().__init__()
+        self._source: ConcatSequence[T] = source
+        self._key_selector: Callable[[T], Any] | None = key_selector
+        self._descending: bool = descending
+
+    def __iter__(self) -> Iterator[T]:
+        # 同じキーの要素は前の部分から取り出される
+        return iter(merge(*self._source._get_parts(), key=self._key_selector, reverse=self._descending))
+
+    def _try_get_count(self) -> int:
+        return self._source._try_get_count()
+
+    def _get_max_count(self) -> int:
+        return self._source._get_max_count()
+
+    def _get_sort_level(self) -> tuple[Callable[[Any], Any], bool] | None:
+        return (identity if self._key_selector is None else self._key_selector, self._descending)
+
+
+@final
+class TopSequence(LinqSequence[T], Generic[T]):
+    """並び替えた先頭から指定した個数の要素を，全体を並び替えずに列挙するシーケンスを表します。
+    """
+
+    __slots__ = ("_source", "_levels", "_count")
+
+    def __init__(self, source: LinqSequence[T], levels: SortLevels, count: int) -> None:
+        """TopSequence[T]の新しいインスタンスを初期化します。
+
+        Args:
+            source (LinqSequence[T]): 読み込むシーケンス
+            levels (SortLevels): 並び替えの条件
+            count (int): 取得する要素数
+        """
+        super().__init__()
+        self._source: LinqSequence[T] = source
+        self._levels: SortLevels = levels
+        self._count: int = count
+
+    def __iter__(self) -> Iterator[T]:
+        count: int = self._source._try_get_count()
+        # 全ての要素を取得する場合はヒープよりも全体の並び替えが速い
+        if 0 <= count <= self._count:
+            yield from sort_values(self._source.to_list(), self._levels)
+        else:
+            yield from select_top(self._source, self._levels, self._count)
+
+    def _try_get_count(self) -> int:
+        count: int = self._source._try_get_count()
+        if count < 0:
+            return -1
+        return max(0, min(count, self._count))
+
+    def _get_max_count(self) -> int:
+        count: int = self._source._get_max_count()
+        if count < 0:
+            return max(0, self._count)
+        return max(0, min(count, self._count))
+
+    def _get_sort_level(self) -> tuple[Callable[[Any], Any], bool] | None:
+        return self._levels[0]
+
+
+@final
+class ReverseSequence(LinqSequence[T], Generic[T]):
+    """逆順のシーケンスを表します。
+    """
+
+    __slots__ = ("_source",)
+
+    def __init__(self, source: LinqSequence[T]) -> None:
+        """ReverseSequence[T]の新しいインスタンスを初期化します。
+
+        Args:
+            source (LinqSequence[T]): 読み込むシーケンス
+        """
+        super().__init__()
+        self._source: LinqSequence[T] = source
+
+    def __iter__(self) -> Iterator[T]:
+        source: LinqSequence[T] = self._source
+        if isinstance(source, SizedFromSequence) and source._is_indexable():
+            return reversed(source._source)  # type: ignore
+        if source._is_indexable():
+            return map(source._get_item, range(source._try_get_count() - 1, -1, -1))
+        return reversed(source.to_list())
+
+    def _try_get_count(self) -> int:
+        return self._source._try_get_count()
+
+    def _get_max_count(self) -> int:
+        return self._source._get_max_count()
+
+    def _counting_source(self) -> LinqSequence[Any]:
+        return self._source._counting_source()
+
+    def _is_indexable(self) -> bool:
+        return self._source._is_indexable()
+
+    def _get_item(self, index: int) -> T:
+        return self._source._get_item(self._source._try_get_count() - 1 - index)
@@ -0,0 +1,66 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pickle import PicklingError, dumps
+from typing import Any
+
+from ..type_variants import *
+from .ordering_sequence import SortLevels, sort_values, to_comparable
+
+
+def _sort_run(values: list[Any], levels: SortLevels) -> tuple[list[int], list[list[Any]]]:
+    """ワーカーのプロセスで要素のキーを生成し，並び替えた順序を求めます。
+
+    Args:
+        values (list[Any]): 並び替える要素
+        levels (SortLevels): 並び替えの条件
+
+    Returns:
+        tuple[list[int], list[list[Any]]]: 並び替えた順序の位置と，その順序に並べた条件ごとのキー
+    """
+    columns: list[list[Any]] = [list(map(key_selector, values)) for key_selector, _ in levels]
+    order: list[int] = list(range(len(values)))
+    for column, (_, descending) in zip(reversed(columns), reversed(levels)):
+        order.sort(key=column.__getitem__, reverse=descending)
+    return (order, [list(map(column.__getitem__, order)) for column in columns])
+
+
+def sort_parallel(values: list[T], levels: SortLevels, workers: int | None, min_size: int) -> list[T]:
+    """要素を分割してプロセスプールで並び替え，並び替えた部分を併合します。
+    結果は安定ソートと一致します。並列化できない場合や要素が少ない場合は現在のプロセスで並び替えます。
+
+    Args:
+        values (list[T]): 並び替えるリスト
+        levels (SortLevels): 並び替えの条件
+        workers (int | None): プロセス数。Noneの場合はCPUの数
+        min_size (int): 並列に並び替える最小の要素数
+
+    Returns:
+        list[T]: 並び替えられたリスト
+    """
+    count: int = workers if workers is not None else (os.cpu_count() or 1)
+    if count <= 1 or len(values) < max(min_size, 2):
+        return sort_values(values, levels)
+    try:
+        # ラムダ式などのワーカーに送れないキーの関数は現在のプロセスで扱う
+        dumps(levels)
+    except (PicklingError, AttributeError, TypeError):
+        return sort_values(values, levels)
+
+    size: int = -(-len(values) // count)
+    starts: range = range(0, len(values), size)
+    try:
+        with ProcessPoolExecutor(count) as executor:
+            runs: list[tuple[list[int], list[list[Any]]]] = list(executor.map(_sort_run, (values[start:start + size] for start in starts), [levels] * len(starts)))
+    except (PicklingError, AttributeError, TypeError):
+        return sort_values(values, levels)
+
+    # 並び替えた部分を元の順に連結し，組み込みのソートで併合する。連結した列は整列済みの部分からなるため，併合はO(n log k)で済む
+    order: list[int] = [start + i for start, (run, _) in zip(starts, runs) for i in run]
+    columns: list[list[Any]] = [[key for _, run_columns in runs for key in run_columns[level]] for level in range(len(levels))]
+    if len(levels) == 1:
+        keys: list[Any] = columns[0]
+        positions: list[int] = sorted(range(len(order)), key=keys.__getitem__, reverse=levels[0][1])
+    else:
+        tuples: list[tuple[Any, ...]] = list(zip(*(to_comparable(column, descending)[0] for column, (_, descending) in zip(columns, levels))))
+        positions = sorted(range(len(order)), key=tuples.__getitem__)
+    return [values[order[position]] for position in positions]
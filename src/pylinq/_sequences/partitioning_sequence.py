@@ -1,15 +1,27 @@
+import sys
 from collections import deque
-from typing import Callable, Generic, Iterator, final
+from itertools import dropwhile, islice, takewhile
+from typing import Any, Callable, Generic, Iterator, final
 
-from .. import LinqSequence
+from .. import optimization
+from ..linq_sequence import LinqSequence
 from ..type_variants import *
+from .planned_sequence import PlannedSequence
+
+if sys.version_info >= (3, 12):
+    from itertools import batched
+else:
+    # Python 3.11ではisliceで代用する
+    batched = None
 
 
 @final
-class TakeSequence(LinqSequence[T], Generic[T]):
+class TakeSequence(PlannedSequence[T], Generic[T]):
     """先頭から指定した個数の要素を列挙するシーケンスを表します。
     """
 
+    __slots__ = ("_source", "_count")
+
     def __init__(self, source: LinqSequence[T], count: int) -> None:
         """TakeSequence[T]の新しいインスタンスを初期化します。
 
@@ -18,25 +30,45 @@ class TakeSequence(LinqSequence[T], Generic[T]):
             count (int): 取得する要素数
         """
         super().__init__()
-        self.__source: LinqSequence[T] = source
-        self.__index: int = 0
-        self.__count: int = count
+        self._source: LinqSequence[T] = source
+        self._count: int = count
 
-    def _in_iteration(self) -> bool:
-        return self.__index > 0
+    def _enumerate(self) -> Iterator[T]:
+        if not optimization._rules["use_itertools"]:
+            return self._enumerate_fallback()
+        return islice(self._source, max(0, self._count))
 
-    def _start_iteration(self) -> None:
-        self.__source._start_iteration()
+    def _enumerate_fallback(self) -> Iterator[T]:
+        count: int = self._count
+        if count <= 0:
+            return
+        index: int = 0
+        for current in self._source:
+            yield current
+            index += 1
+            if index == count:
+                return
 
-    def _stop_iteration(self) -> None:
-        self.__source._stop_iteration()
-        self.__index = 0
+    def _try_get_count(self) -> int:
+        count: int = self._source._try_get_count()
+        if count < 0:
+            return -1
+        return max(0, min(count, self._count))
 
-    def _get_next(self) -> T:
-        if self.__index == self.__count:
-            raise StopIteration()
-        self.__index += 1
-        return next(self.__source)
+    def _get_max_count(self) -> int:
+        count: int = self._source._get_max_count()
+        if count < 0:
+            return max(0, self._count)
+        return max(0, min(count, self._count))
+
+    def _is_indexable(self) -> bool:
+        return self._source._is_indexable()
+
+    def _get_item(self, index: int) -> T:
+        return self._source._get_item(index)
+
+    def _get_sort_level(self) -> tuple[Callable[[Any], Any], bool] | None:
+        return self._source._get_sort_level()
 
 
 @final
@@ -44,6 +76,8 @@ class TakeLastSequence(LinqSequence[T], Generic[T]):
     """末尾から指定した個数の要素を列挙するシーケンスを表します。
     """
 
+    __slots__ = ("__source", "__count")
+
     def __init__(self, source: LinqSequence[T], count: int) -> None:
         """TakeLastSequence[T]の新しいインスタンスを初期化します。
 
@@ -53,47 +87,229 @@ class TakeLastSequence(LinqSequence[T], Generic[T]):
         """
         super().__init__()
         self.__source: LinqSequence[T] = source
-        self.__iterator: Iterator[T] | None = None
         self.__count: int = count
 
-    def _in_iteration(self) -> bool:
-        return not self.__iterator is None
+    def __iter__(self) -> Iterator[T]:
+        queue: deque = deque(self.__source, maxlen=self.__count)
+        return iter(queue)
 
-    def _start_iteration(self) -> None:
-        queue: deque = deque[T](self.__source, maxlen=self.__count)
-        self.__iterator = iter(queue)
+    def _try_get_count(self) -> int:
+        count: int = self.__source._try_get_count()
+        if count < 0:
+            return -1
+        return max(0, min(count, self.__count))
 
-    def _stop_iteration(self) -> None:
-        self.__iterator = None
+    def _get_max_count(self) -> int:
+        count: int = self.__source._get_max_count()
+        if count < 0:
+            return max(0, self.__count)
+        return max(0, min(count, self.__count))
 
-    def _get_next(self) -> T:
-        return next(self.__iterator)  # type: ignore
+    def _get_sort_level(self) -> tuple[Callable[[Any], Any], bool] | None:
+        return self.__source._get_sort_level()
 
 
 @final
-class TakeWhileSequence(LinqSequence[T], Generic[T]):
+class TakeWhileSequence(PlannedSequence[T], Generic[T]):
     """指定した条件を満たす間列挙を続けるシーケンスを表します。
     """
 
-    def __init__(self, source: LinqSequence[T], match: Callable[[T, int], bool]) -> None:
+    __slots__ = ("_match", "_indexed", "_source")
+
+    def __init__(self, source: LinqSequence[T], match: Callable[[T], bool] | Callable[[T, int], bool], indexed: bool) -> None:
+        """TakeWhileSequence[T]の新しいインスタンスを初期化します。
+
+        Args:
+            source (LinqSequence[T]): 読み込むシーケンス
+            match (Callable[[T], bool] | Callable[[T, int], bool]): 列挙の継続条件
+            indexed (bool): matchがインデックスを受け取る場合はTrue，それ以外でFalse
+        """
         super().__init__()
-        self.__index: int = 0
-        self.__match: Callable[[T, int], bool] = match
-        self.__source: LinqSequence[T] = source
+        self._match: Callable[[T], bool] | Callable[[T, int], bool] = match
+        self._indexed: bool = indexed
+        self._source: LinqSequence[T] = source
+
+    def _enumerate(self) -> Iterator[T]:
+        if optimization._rules["use_itertools"] and not self._indexed:
+            return takewhile(self._match, self._source)  # type: ignore
+        return self._enumerate_fallback()
+
+    def _enumerate_fallback(self) -> Iterator[T]:
+        if not self._indexed:
+            match1: Callable[[T], bool] = self._match  # type: ignore
+            for current in self._source:
+                if not match1(current):
+                    return
+                yield current
+            return
+        match2: Callable[[T, int], bool] = self._match  # type: ignore
+        index: int = 0
+        for current in self._source:
+            if not match2(current, index):
+                return
+            yield current
+            index += 1
+
+    def _get_max_count(self) -> int:
+        return self._source._get_max_count()
+
+    def _get_sort_level(self) -> tuple[Callable[[Any], Any], bool] | None:
+        return self._source._get_sort_level()
+
+
+@final
+class SkipWhileSequence(LinqSequence[T], Generic[T]):
+    """指定した条件を満たす間要素をスキップするシーケンスを表します。
+    """
+
+    __slots__ = ("_source", "_match", "_indexed")
+
+    def __init__(self, source: LinqSequence[T], match: Callable[[T], bool] | Callable[[T, int], bool], indexed: bool) -> None:
+        """SkipWhileSequence[T]の新しいインスタンスを初期化します。
+
+        Args:
+            source (LinqSequence[T]): 読み込むシーケンス
+            match (Callable[[T], bool] | Callable[[T, int], bool]): スキップの継続条件
+            indexed (bool): matchがインデックスを受け取る場合はTrue，それ以外でFalse
+        """
+        super().__init__()
+        self._source: LinqSequence[T] = source
+        self._match: Callable[[T], bool] | Callable[[T, int], bool] = match
+        self._indexed: bool = indexed
+
+    def __iter__(self) -> Iterator[T]:
+        if optimization._rules["use_itertools"] and not self._indexed:
+            return dropwhile(self._match, self._source)  # type: ignore
+        return self._iterate_fallback()
+
+    def _iterate_fallback(self) -> Iterator[T]:
+        iterator: Iterator[T] = iter(self._source)
+        if not self._indexed:
+            match1: Callable[[T], bool] = self._match  # type: ignore
+            for current in iterator:
+                if not match1(current):
+                    yield current
+                    break
+        else:
+            match2: Callable[[T, int], bool] = self._match  # type: ignore
+            index: int = 0
+            for current in iterator:
+                if not match2(current, index):
+                    yield current
+                    break
+                index += 1
+        yield from iterator
+
+    def _get_max_count(self) -> int:
+        return self._source._get_max_count()
+
+    def _get_sort_level(self) -> tuple[Callable[[Any], Any], bool] | None:
+        return self._source._get_sort_level()
+
+
+@final
+class SkipSequence(PlannedSequence[T], Generic[T]):
+    """先頭から指定した個数の要素をスキップするシーケンスを表します。
+    """
+
+    __slots__ = ("_source", "_count")
+
+    def __init__(self, source: LinqSequence[T], count: int) -> None:
+        """SkipSequence[T]の新しいインスタンスを初期化します。
+
+        Args:
+            source (LinqSequence[T]): 読み込むシーケンス
+            count (int): スキップする要素数
+        """
+        super().__init__()
+        self._source: LinqSequence[T] = source
+        self._count: int = count
+
+    def _enumerate(self) -> Iterator[T]:
+        source: LinqSequence[T] = self._source
+        if source._is_indexable() and self._count > 0:
+            # 読み飛ばす要素を列挙せずに開始位置から読み込む
+            return map(source._get_item, range(self._count, source._try_get_count()))
+        if not optimization._rules["use_itertools"]:
+            return self._enumerate_fallback()
+        return islice(source, max(0, self._count), None)
+
+    def _enumerate_fallback(self) -> Iterator[T]:
+        iterator: Iterator[T] = iter(self._source)
+        try:
+            for _ in range(self._count):
+                next(iterator)
+        except StopIteration:
+            return
+        yield from iterator
+
+    def _try_get_count(self) -> int:
+        count: int = self._source._try_get_count()
+        if count < 0:
+            return -1
+        return max(0, count - max(0, self._count))
+
+    def _get_max_count(self) -> int:
+        count: int = self._source._get_max_count()
+        if count < 0:
+            return -1
+        return max(0, count - max(0, self._count))
+
+    def _is_indexable(self) -> bool:
+        return self._source._is_indexable()
+
+    def _get_item(self, index: int) -> T:
+        return self._source._get_item(index + max(0, self._count))
+
+    def _get_sort_level(self) -> tuple[Callable[[Any], Any], bool] | None:
+        return self._source._get_sort_level()
+
+
+@final
+class ChunkSequence(LinqSequence[list[T]], Generic[T]):
+    """指定したサイズごとに分割された要素を列挙するシーケンスを表します。
+    """
+
+    __slots__ = ("_source", "_size")
+
+    def __init__(self, source: LinqSequence[T], size: int) -> None:
+        """ChunkSequence[T]の新しいインスタンスを初期化します。
+
+        Args:
+            source (LinqSequence[T]): 読み込むシーケンス
+            size (int): 分割するサイズ
+        """
+        super().__init__()
+        self._source: LinqSequence[T] = source
+        self._size: int = size
 
-    def _in_iteration(self) -> bool:
-        return self.__index > 0
+    def __iter__(self) -> Iterator[list[T]]:
+        if not optimization._rules["use_itertools"]:
+            return self._iterate_fallback()
+        if batched is not None:
+            return map(list, batched(self._source, self._size))
+        iterator: Iterator[T] = iter(self._source)
+        return iter(lambda: list(islice(iterator, self._size)), [])
 
-    def _start_iteration(self) -> None:
-        self.__source._start_iteration()
+    def _iterate_fallback(self) -> Iterator[list[T]]:
+        size: int = self._size
+        result: list[T] = []
+        for current in self._source:
+            result.append(current)
+            if len(result) == size:
+                yield result
+                result = []
+        if len(result) > 0:
+            yield result
 
-    def _stop_iteration(self) -> None:
-        self.__source._stop_iteration()
-        self.__index = 0
+    def _try_get_count(self) -> int:
+        count: int = self._source._try_get_count()
+        if count < 0:
+            return -1
+        return -(-count // self._size)
 
-    def _get_next(self) -> T:
-        result: T = next(self.__source)
-        if not self.__match(result, self.__index):
-            raise StopIteration()
-        self.__index += 1
-        return result
+    def _get_max_count(self) -> int:
+        count: int = self._source._get_max_count()
+        if count < 0:
+            return -1
+        return -(-count // self._size)
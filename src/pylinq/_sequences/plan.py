@@ -0,0 +1,284 @@
+from typing import Any, Callable, cast
+
+from .. import optimization
+from ..linq_sequence import LinqSequence
+from .create_sequence import EmptySequence, RangeSequence, RepeatSequence
+from .filtering_sequence import WhereSequence
+from .from_sequence import FromSequence
+from .ordering_sequence import OrderedLinqSequenceImpl, TopSequence
+from .partitioning_sequence import SkipSequence, TakeSequence, TakeWhileSequence
+from .planned_sequence import PlannedSequence
+from .projection_sequence import SelectSequence
+
+
+_IMMUTABLE_SIZED_TYPES: tuple[type, ...] = (tuple, range, str, bytes, frozenset)
+
+_combinators: dict[tuple[str, tuple[bool, ...]], Callable[..., Callable[..., Any]]] = dict[tuple[str, tuple[bool, ...]], Callable[..., Callable[..., Any]]]()
+
+
+def get_known_count(sequence: LinqSequence[Any]) -> int:
+    """列挙せずに確定している要素数を取得します。
+    要素数が変化しうるシーケンスについては不明として扱います。
+
+    Args:
+        sequence (LinqSequence[Any]): 対象のシーケンス
+
+    Returns:
+        int: 要素数。不明な場合は-1
+    """
+    sequence_type: type = type(sequence)
+    if sequence_type is EmptySequence:
+        return 0
+    if sequence_type is RangeSequence:
+        return sequence._end - sequence._start  # type: ignore
+    if sequence_type is RepeatSequence:
+        return sequence._count  # type: ignore
+    if isinstance(sequence, FromSequence) and type(sequence._source) in _IMMUTABLE_SIZED_TYPES:
+        return len(sequence._source)  # type: ignore
+    return -1
+
+
+def _fold_empty(node: Any) -> LinqSequence[Any] | None:
+    if type(node._source) is EmptySequence:
+        return node._source
+    return None
+
+
+def _fold_known_count(node: Any) -> LinqSequence[Any] | None:
+    node_type: type = type(node)
+    if node_type is TakeSequence:
+        if node._count <= 0:
+            return EmptySequence()
+        count: int = get_known_count(node._source)
+        if 0 <= count <= node._count:
+            return node._source
+    elif node_type is SkipSequence:
+        if node._count <= 0:
+            return node._source
+        count = get_known_count(node._source)
+        if 0 <= count <= node._count:
+            return EmptySequence()
+    return None
+
+
+def _get_combinator(kind: str, shape: tuple[bool, ...]) -> Callable[..., Callable[..., Any]]:
+    """複数の関数を単一の関数にまとめる関数を取得します。
+
+    Args:
+        kind (str): "where"で条件の論理積，"select"で関数の合成
+        shape (tuple[bool, ...]): 各関数がインデックスを受け取るかどうか
+
+    Returns:
+        Callable[..., Callable[..., Any]]: 関数を受け取りまとめた関数を返す関数
+    """
+    key: tuple[str, tuple[bool, ...]] = (kind, shape)
+    result: Callable[..., Callable[..., Any]] | None = _combinators.get(key)
+    if result is not None:
+        return result
+
+    indexed: bool = any(shape)
+    calls: list[str] = []
+    body: str = "x"
+    for i, current in enumerate(shape):
+        argument: str = "x" if kind == "where" else body
+        call: str = f"a{i}({argument}, i)" if current else f"a{i}({argument})"
+        calls.append(call)
+        body = call
+    expression: str = " and ".join(calls) if kind == "where" else body
+    params: str = ", ".join(f"a{i}" for i in range(len(shape)))
+    source: str = f"def combinator({params}):\n    def combined(x{', i' if indexed else ''}):\n        return {expression}\n    return combined"
+    namespace: dict[str, Any] = {}
+    exec(compile(source, f"<pylinq {kind} {len(shape)}>", "exec"), namespace)
+    result = namespace["combinator"]
+    _combinators[key] = result
+    return result
+
+
+def _combine(kind: str, parts: tuple[tuple[Callable[..., Any], bool], ...]) -> Callable[..., Any]:
+    """関数を単一の関数にまとめます。
+
+    Args:
+        kind (str): "where"で条件の論理積，"select"で関数の合成
+        parts (tuple[tuple[Callable[..., Any], bool], ...]): 関数とインデックスを受け取るかどうかの組
+
+    Returns:
+        Callable[..., Any]: まとめられた関数
+    """
+    combinator: Callable[..., Callable[..., Any]] = _get_combinator(kind, tuple(indexed for _, indexed in parts))
+    result: Callable[..., Any] = combinator(*(function for function, _ in parts))
+    result._parts = parts  # type: ignore
+    return result
+
+
+def _get_parts(function: Callable[..., Any], indexed: bool) -> tuple[tuple[Callable[..., Any], bool], ...]:
+    """まとめられた関数を構成する関数の一覧を取得します。
+
+    Args:
+        function (Callable[..., Any]): 対象の関数
+        indexed (bool): functionがインデックスを受け取るかどうか
+
+    Returns:
+        tuple[tuple[Callable[..., Any], bool], ...]: 関数とインデックスを受け取るかどうかの組
+    """
+    parts: tuple[tuple[Callable[..., Any], bool], ...] | None = getattr(function, "_parts", None)
+    if parts is None:
+        return ((function, indexed),)
+    return parts
+
+
+def _fuse_where(node: Any) -> LinqSequence[Any] | None:
+    source: Any = node._source
+    if type(node) is not WhereSequence or type(source) is not WhereSequence or node._indexed or source._indexed:
+        return None
+    parts: tuple[tuple[Callable[..., Any], bool], ...] = _get_parts(source._match, False) + _get_parts(node._match, False)
+    return WhereSequence(source._source, _combine("where", parts), False)
+
+
+def _fuse_select(node: Any) -> LinqSequence[Any] | None:
+    source: Any = node._source
+    if type(node) is not SelectSequence or type(source) is not SelectSequence:
+        return None
+    parts: tuple[tuple[Callable[..., Any], bool], ...] = _get_parts(source._selector, source._indexed) + _get_parts(node._selector, node._indexed)
+    return SelectSequence(source._source, _combine("select", parts), source._indexed or node._indexed)
+
+
+def _merge_take(node: Any) -> LinqSequence[Any] | None:
+    source: Any = node._source
+    if type(node) is not TakeSequence or type(source) is not TakeSequence:
+        return None
+    return TakeSequence(source._source, min(node._count, source._count))
+
+
+def _merge_skip(node: Any) -> LinqSequence[Any] | None:
+    source: Any = node._source
+    if type(node) is not SkipSequence or type(source) is not SkipSequence:
+        return None
+    return SkipSequence(source._source, max(node._count, 0) + max(source._count, 0))
+
+
+def _push_take(node: Any) -> LinqSequence[Any] | None:
+    source: Any = node._source
+    if type(node) is not TakeSequence or type(source) is not SelectSequence:
+        return None
+    return SelectSequence(_rewrite(TakeSequence(source._source, node._count)), source._selector, source._indexed)
+
+
+def _push_skip(node: Any) -> LinqSequence[Any] | None:
+    source: Any = node._source
+    if type(node) is not SkipSequence or type(source) is not SelectSequence:
+        return None
+    count: int = max(node._count, 0)
+    skipped: LinqSequence[Any] = _rewrite(SkipSequence(source._source, count))
+    if not source._indexed:
+        return SelectSequence(skipped, source._selector, False)
+    selector: Callable[[Any], Any] | Callable[[Any, int], Any] = source._selector
+    return SelectSequence(skipped, lambda x, i: selector(x, i + count), True)  # type: ignore
+
+
+# 先頭の要素を選び出さずに読み込む並び替えの実行方法
+_TOP_K_EXCLUDED_MODES: frozenset[str] = frozenset(("cached", "assumed"))
+
+
+def _top_k(node: Any) -> LinqSequence[Any] | None:
+    source: Any = node._source
+    if type(node) is not TakeSequence or node._count <= 0:
+        return None
+    # 並び替えた結果を保持するシーケンスは保持した結果から，並び替え済みとみなすシーケンスは先頭から順に読み込む
+    if type(source) is OrderedLinqSequenceImpl and source._mode not in _TOP_K_EXCLUDED_MODES:
+        return TopSequence(source._source, source._levels, node._count)
+    if type(source) is SkipSequence and type(source._source) is OrderedLinqSequenceImpl and source._source._mode not in _TOP_K_EXCLUDED_MODES:
+        # 読み飛ばす要素を含めた先頭だけを並び替える
+        skipped: int = max(source._count, 0)
+        ordered: Any = source._source
+        return SkipSequence(TopSequence(ordered._source, ordered._levels, skipped + node._count), skipped)
+    return None
+
+
+# 書き換え対象のノードの型。いずれも派生クラスを持たない
+_PLANNED_TYPES: frozenset[type] = frozenset((SelectSequence, SkipSequence, TakeSequence, TakeWhileSequence, WhereSequence))
+
+_RULES: tuple[tuple[str, Callable[[Any], LinqSequence[Any] | None], frozenset[type]], ...] = (
+    ("fold_empty", _fold_empty, _PLANNED_TYPES),
+    ("fold_known_count", _fold_known_count, frozenset((SkipSequence, TakeSequence))),
+    ("fuse_where", _fuse_where, frozenset((WhereSequence,))),
+    ("fuse_select", _fuse_select, frozenset((SelectSequence,))),
+    ("merge_take", _merge_take, frozenset((TakeSequence,))),
+    ("merge_skip", _merge_skip, frozenset((SkipSequence,))),
+    ("push_take", _push_take, frozenset((TakeSequence,))),
+    ("push_skip", _push_skip, frozenset((SkipSequence,))),
+    ("top_k", _top_k, frozenset((TakeSequence,))),
+)
+
+_rules_by_type: tuple[int, dict[type, tuple[Callable[[Any], LinqSequence[Any] | None], ...]]] = (-1, {})
+
+
+def _get_rules_by_type() -> dict[type, tuple[Callable[[Any], LinqSequence[Any] | None], ...]]:
+    """ノードの型ごとに適用する有効な規則を取得します。
+    結果は有効な規則が変更されるまでキャッシュされます。
+
+    Returns:
+        dict[type, tuple[Callable[[Any], LinqSequence[Any] | None], ...]]: ノードの型と規則の対応
+    """
+    global _rules_by_type
+    version: int = optimization._version
+    if _rules_by_type[0] != version:
+        enabled: dict[str, bool] = optimization._rules
+        table: dict[type, tuple[Callable[[Any], LinqSequence[Any] | None], ...]] = {
+            node_type: tuple(rule for name, rule, node_types in _RULES if enabled[name] and node_type in node_types)
+            for node_type in _PLANNED_TYPES
+        }
+        _rules_by_type = (version, table)
+    return _rules_by_type[1]
+
+
+def _rewrite(node: LinqSequence[Any]) -> LinqSequence[Any]:
+    """読み込むシーケンスが書き換え済みのノードに規則を適用します。
+
+    Args:
+        node (LinqSequence[Any]): 書き換えるノード
+
+    Returns:
+        LinqSequence[Any]: 書き換え後のノード
+    """
+    table: dict[type, tuple[Callable[[Any], LinqSequence[Any] | None], ...]] = _get_rules_by_type()
+    while True:
+        rules: tuple[Callable[[Any], LinqSequence[Any] | None], ...] | None = table.get(type(node))
+        if rules is None:
+            return node
+        for rule in rules:
+            result: LinqSequence[Any] | None = rule(node)
+            if result is not None:
+                node = result
+                break
+        else:
+            node._plan = (optimization._version, node)  # type: ignore
+            return node
+
+
+def optimize(sequence: LinqSequence[Any]) -> LinqSequence[Any]:
+    """シーケンスの連なりに書き換え規則を適用した実行計画を取得します。
+    結果は有効な規則が変更されるまでキャッシュされます。
+
+    Args:
+        sequence (LinqSequence[Any]): 対象のシーケンス
+
+    Returns:
+        LinqSequence[Any]: 書き換え後のシーケンス
+    """
+    version: int = optimization._version
+    chain: list[PlannedSequence[Any]] = []
+    node: LinqSequence[Any] = sequence
+    while type(node) in _PLANNED_TYPES:
+        plan: tuple[int, Any] | None = node._plan  # type: ignore
+        if plan is not None and plan[0] == version:
+            node = plan[1]
+            break
+        chain.append(cast(PlannedSequence[Any], node))
+        node = node._source  # type: ignore
+
+    current: LinqSequence[Any] = node
+    for original in reversed(chain):
+        rebuilt: PlannedSequence[Any] = original if original._source is current else original._with_source(current)  # type: ignore
+        current = _rewrite(rebuilt)
+        original._plan = (version, current)
+    return current
@@ -0,0 +1,69 @@
+from abc import abstractmethod
+from copy import copy
+from typing import Any, Generic, Iterator
+
+from .. import optimization
+from ..linq_sequence import LinqSequence
+from ..type_variants import *
+
+
+class PlannedSequence(LinqSequence[T], Generic[T]):
+    """列挙前に実行計画の書き換えを受けるシーケンスを表します。
+    """
+
+    __slots__ = ("_plan",)
+
+    def __init__(self) -> None:
+        """PlannedSequence[T]の新しいインスタンスを初期化します。
+        """
+        super().__init__()
+        self._plan: tuple[int, Any] | None = None
+
+    def __iter__(self) -> Iterator[T]:
+        cached: tuple[int, Any] | None = self._plan
+        # 書き換え済みのノードは計画の探索を省略する
+        plan: LinqSequence[T] = cached[1] if cached is not None and cached[0] == optimization._version else optimize(self)
+        if plan is self:
+            return self._enumerate()
+        return iter(plan)
+
+    def _counting_source(self) -> LinqSequence[Any]:
+        plan: LinqSequence[T] = optimize(self)
+        if plan is self:
+            return self
+        return plan._counting_source()
+
+    def _optimize(self) -> LinqSequence[T]:
+        """書き換え後の実行計画を取得します。
+
+        Returns:
+            LinqSequence[T]: 書き換え後の実行計画
+        """
+        return optimize(self)
+
+    @abstractmethod
+    def _enumerate(self) -> Iterator[T]:
+        """書き換え後の実行計画として列挙を行います。
+
+        Returns:
+            Iterator[T]: 新しい列挙子
+        """
+        ...
+
+    def _with_source(self, source: LinqSequence[Any]) -> "PlannedSequence[T]":
+        """読み込むシーケンスを置き換えた複製を生成します。
+
+        Args:
+            source (LinqSequence[Any]): 新しく読み込むシーケンス
+
+        Returns:
+            PlannedSequence[T]: 生成された複製
+        """
+        result: PlannedSequence[T] = copy(self)
+        result._source = source  # type: ignore
+        result._plan = None
+        return result
+
+
+# 書き換え規則はPlannedSequenceの派生クラスを参照するため，クラスの定義後に読み込む
+from .plan import optimize  # noqa: E402
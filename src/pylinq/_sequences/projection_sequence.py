@@ -1,37 +1,207 @@
-from typing import Callable, Generic, final
+from collections.abc import Sequence
+from itertools import chain, count
+from typing import Any, Callable, Generic, Iterator, final
 
-from .. import LinqSequence
+from .. import optimization
+from ..linq_sequence import LinqSequence
+from .._common import get_count, get_max_count
 from ..type_variants import *
+from .planned_sequence import PlannedSequence
 
 
 @final
-class SelectSequence(LinqSequence[TResult], Generic[T, TResult]):
+class SelectSequence(PlannedSequence[TResult], Generic[T, TResult]):
     """要素の変換を行うシーケンスを表します。
     """
 
-    def __init__(self, source: LinqSequence[T], selector: Callable[[T, int], TResult]) -> None:
+    __slots__ = ("_source", "_selector", "_indexed")
+
+    def __init__(self, source: LinqSequence[T], selector: Callable[[T], TResult] | Callable[[T, int], TResult], indexed: bool) -> None:
         """SelectSequence[T, TResult]の新しいインスタンスを初期化します。
 
         Args:
             source (LinqSequence[T]): 読み込むシーケンス
-            selector (Callable[[T, int], TResult]): 要素の変換を行う関数
+            selector (Callable[[T], TResult] | Callable[[T, int], TResult]): 要素の変換を行う関数
+            indexed (bool): selectorがインデックスを受け取る場合はTrue，それ以外でFalse
+        """
+        super().__init__()
+        self._source: LinqSequence[T] = source
+        self._selector: Callable[[T], TResult] | Callable[[T, int], TResult] = selector
+        self._indexed: bool = indexed
+
+    def _try_get_count(self) -> int:
+        return self._source._try_get_count()
+
+    def _get_max_count(self) -> int:
+        return self._source._get_max_count()
+
+    def _is_indexable(self) -> bool:
+        return self._source._is_indexable()
+
+    def _get_item(self, index: int) -> TResult:
+        if self._indexed:
+            return self._selector(self._source._get_item(index), index)  # type: ignore
+        return self._selector(self._source._get_item(index))  # type: ignore
+
+    def _counting_source(self) -> LinqSequence[Any]:
+        plan: LinqSequence[TResult] = self._optimize()
+        if plan is not self:
+            return plan._counting_source()
+        # 変換は要素数に影響しないため読み込むシーケンスを数える
+        return self._source._counting_source()
+
+    def _enumerate(self) -> Iterator[TResult]:
+        if not optimization._rules["use_itertools"]:
+            return self._enumerate_fallback()
+        if not self._indexed:
+            return map(self._selector, self._source)  # type: ignore
+        return map(self._selector, self._source, count())  # type: ignore
+
+    def _enumerate_fallback(self) -> Iterator[TResult]:
+        if not self._indexed:
+            selector1: Callable[[T], TResult] = self._selector  # type: ignore
+            for current in self._source:
+                yield selector1(current)
+            return
+        selector2: Callable[[T, int], TResult] = self._selector  # type: ignore
+        index: int = 0
+        for current in self._source:
+            yield selector2(current, index)
+            index += 1
+
+
+
+@final
+class SelectManySequence(LinqSequence[TResult], Generic[T, T2, TResult]):
+    """平坦化を行うシーケンスを表します。
+    """
+
+    __slots__ = ("_source", "_collection_selector", "_indexed", "_result_selector")
+
+    def __init__(
+        self,
+        source: LinqSequence[T],
+        collection_selector: Callable[[T], Iterable[T2]] | Callable[[T, int], Iterable[T2]],
+        indexed: bool,
+        result_selector: Callable[[T2], TResult] | None
+    ) -> None:
+        """SelectManySequence[T, T2, TResult]の新しいインスタンスを初期化します。
+
+        Args:
+            source (LinqSequence[T]): 読み込むシーケンス
+            collection_selector (Callable[[T], Iterable[T2]] | Callable[[T, int], Iterable[T2]]): 要素を基にコレクションを導出する関数
+            indexed (bool): collection_selectorがインデックスを受け取る場合はTrue，それ以外でFalse
+            result_selector (Callable[[T2], TResult] | None): コレクションの要素を変換する関数。変換しない場合はNone
+        """
+        super().__init__()
+        self._source: LinqSequence[T] = source
+        self._collection_selector: Callable[[T], Iterable[T2]] | Callable[[T, int], Iterable[T2]] = collection_selector
+        self._indexed: bool = indexed
+        self._result_selector: Callable[[T2], TResult] | None = result_selector
+
+    def __iter__(self) -> Iterator[TResult]:
+        if not optimization._rules["use_itertools"]:
+            return self._iterate_fallback()
+        collections: Iterator[Iterable[T2]]
+        if not self._indexed:
+            collections = map(self._collection_selector, self._source)  # type: ignore
+        else:
+            collections = map(self._collection_selector, self._source, count())  # type: ignore
+        if self._result_selector is None:
+            return chain.from_iterable(collections)  # type: ignore
+        return map(self._result_selector, chain.from_iterable(collections))
+
+    def _iterate_fallback(self) -> Iterator[TResult]:
+        result_selector: Callable[[T2], TResult] | None = self._result_selector
+        if not self._indexed:
+            collection_selector1: Callable[[T], Iterable[T2]] = self._collection_selector  # type: ignore
+            if result_selector is None:
+                for current in self._source:
+                    yield from collection_selector1(current)  # type: ignore
+                return
+            for current in self._source:
+                for intermediate in collection_selector1(current):
+                    yield result_selector(intermediate)
+            return
+        collection_selector2: Callable[[T, int], Iterable[T2]] = self._collection_selector  # type: ignore
+        index: int = 0
+        for current in self._source:
+            if result_selector is None:
+                yield from collection_selector2(current, index)  # type: ignore
+            else:
+                for intermediate in collection_selector2(current, index):
+                    yield result_selector(intermediate)
+            index += 1
+
+
+@final
+class ZipSequence(LinqSequence[TResult], Generic[T, T2, TResult]):
+    """2つのシーケンスの要素同士を結合するシーケンスを表します。
+    """
+
+    __slots__ = ("_first", "_second", "_result_selector")
+
+    def __init__(self, first: LinqSequence[T], second: Iterable[T2], result_selector: Callable[[T, T2], TResult] | None) -> None:
+        """ZipSequence[T, T2, TResult]の新しいインスタンスを初期化します。
+
+        Args:
+            first (LinqSequence[T]): 読み込むシーケンス
+            second (Iterable[T2]): 結合するシーケンス
+            result_selector (Callable[[T, T2], TResult] | None): 要素を結合する関数。タプルにする場合はNone
         """
         super().__init__()
-        self.__index: int = 0
-        self.__source: LinqSequence[T] = source
-        self.__selector: Callable[[T, int], TResult] = selector
+        self._first: LinqSequence[T] = first
+        self._second: Iterable[T2] = second
+        self._result_selector: Callable[[T, T2], TResult] | None = result_selector
+
+    def __iter__(self) -> Iterator[TResult]:
+        if not optimization._rules["use_itertools"]:
+            return self._iterate_fallback()
+        if self._result_selector is None:
+            return zip(self._first, self._second)  # type: ignore
+        return map(self._result_selector, self._first, self._second)
+
+    def _iterate_fallback(self) -> Iterator[TResult]:
+        result_selector: Callable[[T, T2], TResult] = self._result_selector or _make_tuple  # type: ignore
+        iter1: Iterator[T] = iter(self._first)
+        iter2: Iterator[T2] = iter(self._second)
+        while True:
+            try:
+                yield result_selector(next(iter1), next(iter2))
+            except StopIteration:
+                return
+
+    def _try_get_count(self) -> int:
+        count1: int = self._first._try_get_count()
+        count2: int = get_count(self._second)
+        if count1 < 0 or count2 < 0:
+            return -1
+        return min(count1, count2)
+
+    def _get_max_count(self) -> int:
+        count1: int = self._first._get_max_count()
+        count2: int = get_max_count(self._second)
+        if count1 < 0:
+            return count2
+        if count2 < 0:
+            return count1
+        return min(count1, count2)
 
-    def _in_iteration(self) -> bool:
-        return self.__source._in_iteration()
+    def _is_indexable(self) -> bool:
+        if not self._first._is_indexable():
+            return False
+        second: Iterable[T2] = self._second
+        if isinstance(second, LinqSequence):
+            return second._is_indexable()
+        return isinstance(second, Sequence)
 
-    def _start_iteration(self) -> None:
-        self.__source._start_iteration()
+    def _get_item(self, index: int) -> TResult:
+        result_selector: Callable[[T, T2], TResult] = self._result_selector or _make_tuple  # type: ignore
+        second: Iterable[T2] = self._second
+        if isinstance(second, LinqSequence):
+            return result_selector(self._first._get_item(index), second._get_item(index))
+        return result_selector(self._first._get_item(index), second[index])  # type: ignore
 
-    def _stop_iteration(self) -> None:
-        self.__source._stop_iteration()
-        self.__index = 0
 
-    def _get_next(self) -> TResult:
-        i: int = self.__index
-        self.__index += 1
-        return self.__selector(next(self.__source), i)
+def _make_tuple(first: T, second: T2) -> tuple[T, T2]:
+    return first, second
@@ -1,112 +1,99 @@
-from typing import Callable, Generic, Iterator, final
+from itertools import groupby
+from operator import gt, itemgetter, lt
+from typing import Any, Callable, Generic, Iterator, final
 
-from .. import LinqSequence
+from ..linq_sequence import LinqSequence
+from .concatination_sequence import ConcatSequence
 from ..type_variants import *
 
 
+# 比較集合を読み終えたことを表す値
+_MISSING: Any = object()
+
+
+def get_merge_direction(source: LinqSequence[Any], target: Iterable[Any], key_selector: Callable[[Any], Any]) -> bool | None:
+    """二つのシーケンスが共に指定したキーで並んでいることが分かる場合に，その向きを取得します。
+
+    Args:
+        source (LinqSequence[Any]): 読み込むシーケンス
+        target (Iterable[Any]): 比較集合
+        key_selector (Callable[[Any], Any]): 比較時のキーを生成する関数
+
+    Returns:
+        bool | None: 降順の場合はTrue，昇順の場合はFalse。並びが不明な場合や向きが異なる場合はNone
+    """
+    if not isinstance(target, LinqSequence):
+        return None
+    level: tuple[Callable[[Any], Any], bool] | None = source._get_sort_level()
+    if level is None or level[0] is not key_selector or target._get_sort_level() != level:
+        return None
+    return level[1]
+
+
 @final
 class UnionSequence(LinqSequence[T], Generic[T]):
     """和集合のシーケンスを表します。
+
+    和集合を取る全ての部分は一つの結合シーケンスとして保持され，一つの集合で重複を除きます。
     """
 
-    def __init__(self, first: LinqSequence[T], second: Iterable[T]) -> None:
+    __slots__ = ("_source",)
+
+    def __init__(self, source: ConcatSequence[T]) -> None:
         """UnionSequence[T]の新しいインスタンスを初期化します。
 
         Args:
-            first (LinqSequence[T]): 読み込むシーケンス
-            second (Iterable[T]): 比較集合
+            source (ConcatSequence[T]): 和集合を取る部分を結合したシーケンス
         """
         super().__init__()
-        self.__first: LinqSequence[T] = first
-        self.__second: Iterable[T] = second
-        self.__set: set[T] = set[T]()
-        self.__iterator: Iterator[T] | None = None
-        self.__is_second: bool = False
-
-    def _in_iteration(self) -> bool:
-        return not self.__iterator is None
-
-    def _start_iteration(self) -> None:
-        self.__first._start_iteration()
-        self.__iterator = iter(self.__first)
-
-    def _stop_iteration(self) -> None:
-        self.__first._stop_iteration()
-        self.__iterator = None
-        self.__is_second = False
-        self.__set.clear()
-
-    def _get_next(self) -> T:
-        current: T
-        try:
-            while True:
-                current = next(
-                    self.__iterator  # type: ignore
-                )
-                if current in self.__set:
-                    continue
-                self.__set.add(current)
-                return current
-        except StopIteration:
-            if self.__is_second:
-                raise
-        self.__is_second = True
-        self.__iterator = iter(self.__second)
-        return self._get_next()
+        self._source: ConcatSequence[T] = source
+
+    def __iter__(self) -> Iterator[T]:
+        already_iterated: set[T] = set()
+        add: Callable[[T], None] = already_iterated.add
+        for current in self._source:
+            if current in already_iterated:
+                continue
+            add(current)
+            yield current
+
+    def _get_max_count(self) -> int:
+        return self._source._get_max_count()
 
 
 @final
 class UnionBySequence(LinqSequence[T], Generic[T, TKey]):
     """和集合のシーケンスを表します。
+
+    同じキーを生成する関数で和集合を取る全ての部分は一つの結合シーケンスとして保持されます。
     """
 
-    def __init__(self, first: LinqSequence[T], second: Iterable[T], key_selector: Callable[[T], TKey]) -> None:
-        """UnionVySequence[T]の新しいインスタンスを初期化します。
+    __slots__ = ("_source", "_key_selector")
+
+    def __init__(self, source: ConcatSequence[T], key_selector: Callable[[T], TKey]) -> None:
+        """UnionBySequence[T]の新しいインスタンスを初期化します。
 
         Args:
-            first (LinqSequence[T]): 読み込むシーケンス
-            second (Iterable[T]): 比較集合
+            source (ConcatSequence[T]): 和集合を取る部分を結合したシーケンス
             key_selector (Callable[[T], TKey]): 比較時のキーを生成する関数
         """
         super().__init__()
-        self.__first: LinqSequence[T] = first
-        self.__second: Iterable[T] = second
-        self.__key_selector: Callable[[T], TKey] = key_selector
-        self.__set: set[TKey] = set[TKey]()
-        self.__iterator: Iterator[T] | None = None
-        self.__is_second: bool = False
-
-    def _in_iteration(self) -> bool:
-        return not self.__iterator is None
-
-    def _start_iteration(self) -> None:
-        self.__first._start_iteration()
-        self.__iterator = iter(self.__first)
-
-    def _stop_iteration(self) -> None:
-        self.__first._stop_iteration()
-        self.__iterator = None
-        self.__is_second = False
-        self.__set.clear()
-
-    def _get_next(self) -> T:
-        current: T
-        try:
-            while True:
-                current = next(
-                    self.__iterator  # type: ignore
-                )
-                key: TKey = self.__key_selector(current)
-                if key in self.__set:
-                    continue
-                self.__set.add(key)
-                return current
-        except StopIteration:
-            if self.__is_second:
-                raise
-        self.__is_second = True
-        self.__iterator = iter(self.__second)
-        return self._get_next()
+        self._source: ConcatSequence[T] = source
+        self._key_selector: Callable[[T], TKey] = key_selector
+
+    def __iter__(self) -> Iterator[T]:
+        key_selector: Callable[[T], TKey] = self._key_selector
+        already_iterated: set[TKey] = set()
+        add: Callable[[TKey], None] = already_iterated.add
+        for current in self._source:
+            key: TKey = key_selector(current)
+            if key in already_iterated:
+                continue
+            add(key)
+            yield current
+
+    def _get_max_count(self) -> int:
+        return self._source._get_max_count()
 
 
 @final
@@ -114,6 +101,8 @@ class ExceptSequence(LinqSequence[T], Generic[T]):
     """差集合のシーケンスを表します。
     """
 
+    __slots__ = ("__source", "__target")
+
     def __init__(self, source: LinqSequence[T], target: Iterable[T]) -> None:
         """ExceptSequence[T]の新しいインスタンスを初期化します。
 
@@ -124,31 +113,16 @@ class ExceptSequence(LinqSequence[T], Generic[T]):
         super().__init__()
         self.__source: LinqSequence[T] = source
         self.__target: Iterable[T] = target
-        self.__set: set[T] = set[T]()
-        self.__iterator: Iterator[T] | None = None
-
-    def _in_iteration(self) -> bool:
-        return not self.__iterator is None
-
-    def _start_iteration(self) -> None:
-        self.__source._start_iteration()
-        self.__iterator = iter(self.__source)
-        self.__set.update(self.__target)
-
-    def _stop_iteration(self) -> None:
-        self.__source._stop_iteration()
-        self.__iterator = None
-        self.__set.clear()
-
-    def _get_next(self) -> T:
-        current: T
-        while True:
-            current = next(
-                self.__iterator  # type: ignore
-            )
-            if current in self.__set:
+
+    def __iter__(self) -> Iterator[T]:
+        excluded: set[T] = set(self.__target)
+        for current in self.__source:
+            if current in excluded:
                 continue
-            return current
+            yield current
+
+    def _get_max_count(self) -> int:
+        return self.__source._get_max_count()
 
 
 @final
@@ -156,6 +130,8 @@ class ExceptBySequence(LinqSequence[T], Generic[T, TKey]):
     """差集合のシーケンスを表します。
     """
 
+    __slots__ = ("__source", "__target", "__key_selector")
+
     def __init__(self, source: LinqSequence[T], target: Iterable[T], key_selector: Callable[[T], TKey]) -> None:
         """ExceptBySequence[T]の新しいインスタンスを初期化します。
 
@@ -168,32 +144,17 @@ class ExceptBySequence(LinqSequence[T], Generic[T, TKey]):
         self.__source: LinqSequence[T] = source
         self.__target: Iterable[T] = target
         self.__key_selector: Callable[[T], TKey] = key_selector
-        self.__set: set[TKey] = set[TKey]()
-        self.__iterator: Iterator[T] | None = None
-
-    def _in_iteration(self) -> bool:
-        return not self.__iterator is None
-
-    def _start_iteration(self) -> None:
-        self.__source._start_iteration()
-        self.__iterator = iter(self.__source)
-        self.__set.update(map(self.__key_selector, self.__target))
-
-    def _stop_iteration(self) -> None:
-        self.__source._stop_iteration()
-        self.__iterator = None
-        self.__set.clear()
-
-    def _get_next(self) -> T:
-        current: T
-        while True:
-            current = next(
-                self.__iterator  # type: ignore
-            )
-            key: TKey = self.__key_selector(current)
-            if key in self.__set:
+
+    def __iter__(self) -> Iterator[T]:
+        key_selector: Callable[[T], TKey] = self.__key_selector
+        excluded: set[TKey] = set(map(key_selector, self.__target))
+        for current in self.__source:
+            if key_selector(current) in excluded:
                 continue
-            return current
+            yield current
+
+    def _get_max_count(self) -> int:
+        return self.__source._get_max_count()
 
 
 @final
@@ -201,6 +162,8 @@ class InterceptSequence(LinqSequence[T], Generic[T]):
     """積集合のシーケンスを表します。
     """
 
+    __slots__ = ("__source", "__target")
+
     def __init__(self, source: LinqSequence[T], target: Iterable[T]) -> None:
         """InterceptSequence[T]の新しいインスタンスを初期化します。
 
@@ -211,32 +174,17 @@ class InterceptSequence(LinqSequence[T], Generic[T]):
         super().__init__()
         self.__source: LinqSequence[T] = source
         self.__target: Iterable[T] = target
-        self.__set: set[T] = set[T]()
-        self.__iterator: Iterator[T] | None = None
-
-    def _in_iteration(self) -> bool:
-        return not self.__iterator is None
-
-    def _start_iteration(self) -> None:
-        self.__source._start_iteration()
-        self.__iterator = iter(self.__source)
-        self.__set.update(self.__target)
-
-    def _stop_iteration(self) -> None:
-        self.__source._stop_iteration()
-        self.__iterator = None
-        self.__set.clear()
-
-    def _get_next(self) -> T:
-        current: T
-        while True:
-            current = next(
-                self.__iterator  # type: ignore
-            )
-            if not current in self.__set:
+
+    def __iter__(self) -> Iterator[T]:
+        remaining: set[T] = set(self.__target)
+        for current in self.__source:
+            if not current in remaining:
                 continue
-            self.__set.remove(current)
-            return current
+            remaining.remove(current)
+            yield current
+
+    def _get_max_count(self) -> int:
+        return self.__source._get_max_count()
 
 
 @final
@@ -244,6 +192,8 @@ class InterceptBySequence(LinqSequence[T], Generic[T, TKey]):
     """積集合のシーケンスを表します。
     """
 
+    __slots__ = ("__source", "__target", "__key_selector")
+
     def __init__(self, source: LinqSequence[T], target: Iterable[T], key_selector: Callable[[T], TKey]) -> None:
         """InterceptBySequence[T]の新しいインスタンスを初期化します。
 
@@ -256,30 +206,150 @@ class InterceptBySequence(LinqSequence[T], Generic[T, TKey]):
         self.__source: LinqSequence[T] = source
         self.__target: Iterable[T] = target
         self.__key_selector: Callable[[T], TKey] = key_selector
-        self.__set: set[TKey] = set[TKey]()
-        self.__iterator: Iterator[T] | None = None
-
-    def _in_iteration(self) -> bool:
-        return not self.__iterator is None
-
-    def _start_iteration(self) -> None:
-        self.__source._start_iteration()
-        self.__iterator = iter(self.__source)
-        self.__set.update(map(self.__key_selector, self.__target))
-
-    def _stop_iteration(self) -> None:
-        self.__source._stop_iteration()
-        self.__iterator = None
-        self.__set.clear()
-
-    def _get_next(self) -> T:
-        current: T
-        while True:
-            current = next(
-                self.__iterator  # type: ignore
-            )
-            key: TKey = self.__key_selector(current)
-            if not key in self.__set:
+
+    def __iter__(self) -> Iterator[T]:
+        key_selector: Callable[[T], TKey] = self.__key_selector
+        remaining: set[TKey] = set(map(key_selector, self.__target))
+        for current in self.__source:
+            key: TKey = key_selector(current)
+            if not key in remaining:
+                continue
+            remaining.remove(key)
+            yield current
+
+    def _get_max_count(self) -> int:
+        return self.__source._get_max_count()
+
+
+@final
+class DistinctAdjacentSequence(LinqSequence[T], Generic[T, TKey]):
+    """連続して等しいキーを持つ要素を，先頭の要素にまとめたシーケンスを表します。
+
+    キーの等しい要素が連続して並ぶ場合は，重複を除いたシーケンスと一致します。保持するのは直前のキーのみです。
+    """
+
+    __slots__ = ("_source", "_key_selector")
+
+    def __init__(self, source: LinqSequence[T], key_selector: Callable[[T], TKey] | None) -> None:
+        """DistinctAdjacentSequence[T]の新しいインスタンスを初期化します。
+
+        Args:
+            source (LinqSequence[T]): 読み込むシーケンス
+            key_selector (Callable[[T], TKey] | None): 比較時のキーを生成する関数。Noneの場合は要素自身
+        """
+        super().__init__()
+        self._source: LinqSequence[T] = source
+        self._key_selector: Callable[[T], TKey] | None = key_selector
+
+    def __iter__(self) -> Iterator[T]:
+        # 各グループの先頭の要素を，groupbyが次のグループに進む前に取り出す
+        return map(next, map(itemgetter(1), groupby(self._source, self._key_selector)))
+
+    def _get_max_count(self) -> int:
+        return self._source._get_max_count()
+
+    def _get_sort_level(self) -> tuple[Callable[[Any], Any], bool] | None:
+        return self._source._get_sort_level()
+
+
+@final
+class OrderedExceptSequence(LinqSequence[T], Generic[T, TKey]):
+    """同じキーで並んだ二つのシーケンスの差集合を，併合しながら求めるシーケンスを表します。
+    """
+
+    __slots__ = ("__source", "__target", "__key_selector", "__descending")
+
+    def __init__(self, source: LinqSequence[T], target: Iterable[T], key_selector: Callable[[T], TKey], descending: bool) -> None:
+        """OrderedExceptSequence[T]の新しいインスタンスを初期化します。
+
+        Args:
+            source (LinqSequence[T]): 読み込むシーケンス
+            target (Iterable[T]): sourceと同じキーで並んだ比較集合
+            key_selector (Callable[[T], TKey]): 比較時のキーを生成する関数
+            descending (bool): 降順に並んでいる場合はTrue
+        """
+        super().__init__()
+        self.__source: LinqSequence[T] = source
+        self.__target: Iterable[T] = target
+        self.__key_selector: Callable[[T], TKey] = key_selector
+        self.__descending: bool = descending
+
+    def __iter__(self) -> Iterator[T]:
+        key_selector: Callable[[T], TKey] = self.__key_selector
+        before: Callable[[Any, Any], bool] = gt if self.__descending else lt
+        targets: Iterator[TKey] = map(key_selector, self.__target)
+        target: Any = next(targets, _MISSING)
+        iterator: Iterator[T] = iter(self.__source)
+        for current in iterator:
+            if target is _MISSING:
+                yield current
+                # 比較集合を読み終えた後の要素は全て残る
+                yield from iterator
+                return
+            key: TKey = key_selector(current)
+            while before(target, key):
+                target = next(targets, _MISSING)
+                if target is _MISSING:
+                    break
+            if target is not _MISSING and not before(key, target):
+                continue
+            yield current
+
+    def _get_max_count(self) -> int:
+        return self.__source._get_max_count()
+
+    def _get_sort_level(self) -> tuple[Callable[[Any], Any], bool] | None:
+        return self.__source._get_sort_level()
+
+
+@final
+class OrderedInterceptSequence(LinqSequence[T], Generic[T, TKey]):
+    """同じキーで並んだ二つのシーケンスの積集合を，併合しながら求めるシーケンスを表します。
+    """
+
+    __slots__ = ("__source", "__target", "__key_selector", "__descending")
+
+    def __init__(self, source: LinqSequence[T], target: Iterable[T], key_selector: Callable[[T], TKey], descending: bool) -> None:
+        """OrderedInterceptSequence[T]の新しいインスタンスを初期化します。
+
+        Args:
+            source (LinqSequence[T]): 読み込むシーケンス
+            target (Iterable[T]): sourceと同じキーで並んだ比較集合
+            key_selector (Callable[[T], TKey]): 比較時のキーを生成する関数
+            descending (bool): 降順に並んでいる場合はTrue
+        """
+        super().__init__()
+        self.__source: LinqSequence[T] = source
+        self.__target: Iterable[T] = target
+        self.__key_selector: Callable[[T], TKey] = key_selector
+        self.__descending: bool = descending
+
+    def __iter__(self) -> Iterator[T]:
+        key_selector: Callable[[T], TKey] = self.__key_selector
+        before: Callable[[Any, Any], bool] = gt if self.__descending else lt
+        targets: Iterator[TKey] = map(key_selector, self.__target)
+        target: Any = next(targets, _MISSING)
+        for current in self.__source:
+            if target is _MISSING:
+                return
+            key: TKey = key_selector(current)
+            if before(key, target):
+                continue
+            while before(target, key):
+                target = next(targets, _MISSING)
+                if target is _MISSING:
+                    return
+            if before(key, target):
                 continue
-            self.__set.remove(key)
-            return current
+            yield current
+            # 同じキーの比較集合の要素を読み飛ばし，以降の同じキーの要素を除く
+            while not before(key, target):
+                target = next(targets, _MISSING)
+                if target is _MISSING:
+                    return
+
+    def _get_max_count(self) -> int:
+        return self.__source._get_max_count()
+
+    def _get_sort_level(self) -> tuple[Callable[[Any], Any], bool] | None:
+        return self.__source._get_sort_level()
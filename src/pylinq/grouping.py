@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod, abstractproperty
-from typing import Generic, Sized
+from typing import Callable, Generic, Sized
 
 from .linq_sequence import LinqSequence
 from .type_variants import *
@@ -8,6 +8,9 @@ from .type_variants import *
 class Grouping(LinqSequence[T], Generic[TKey, T], metaclass=ABCMeta):
     """キーを基にグループ化されたシーケンスを表します。
     """
+
+    __slots__ = ()
+
     @abstractproperty
     def key(self) -> TKey:
         """キーを取得します。
@@ -19,6 +22,8 @@ class Lookup(LinqSequence[Grouping[TKey, TValue]], Generic[TKey, TValue], Sized,
     """1つ以上の値がマップされたキーのシーケンスを表します。
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def contains_key(self, key: TKey) -> bool:
         """指定したキーが格納されているかどうかを検証します。
@@ -32,8 +37,9 @@ class Lookup(LinqSequence[Grouping[TKey, TValue]], Generic[TKey, TValue], Sized,
         ...
 
     @abstractmethod
-    def __getitem__(self, key: TKey) -> LinqSequence[TValue]:
+    def __getitem__(self, key: TKey) -> LinqSequence[TValue]:  # type: ignore[override]
         """キーに対応するGrouping[TKey, T]のインスタンスを取得します。
+        Lookupは位置ではなくキーで参照します。位置で参照する場合はelement_atを使用します。
 
         Args:
             key (TKey): 検索するキー
@@ -42,3 +48,84 @@ class Lookup(LinqSequence[Grouping[TKey, TValue]], Generic[TKey, TValue], Sized,
             LinqSequence[TValue]: keyに対応するGrouping[TKey, T]のインスタンス
         """
         ...
+
+    @abstractmethod
+    def add(self, key: TKey, value: TValue) -> None:
+        """キーに値を追加します。
+
+        Args:
+            key (TKey): キー
+            value (TValue): 追加する値
+        """
+        ...
+
+    def add_range(self, source: Iterable[T], key_selector: Callable[[T], TKey], value_selector: Callable[[T], TValue] | None = None) -> None:
+        """シーケンスの要素をキーごとに追加します。
+        to_look_upで構築したLookupに，変更された要素のみを反映する場合に使用します。
+
+        Args:
+            source (Iterable[T]): 追加する要素のシーケンス
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            value_selector (Callable[[T], TValue] | None): 要素を値に変換する関数。Noneの場合は要素自身
+        """
+        add: Callable[[TKey, TValue], None] = self.add
+        if value_selector is None:
+            for current in source:
+                add(key_selector(current), current)  # type: ignore
+            return
+        for current in source:
+            add(key_selector(current), value_selector(current))
+
+    @abstractmethod
+    def remove(self, key: TKey, value: TValue) -> bool:
+        """キーから最初に一致する値を削除します。
+        値が無くなったキーはLookupから削除されます。
+
+        Args:
+            key (TKey): キー
+            value (TValue): 削除する値
+
+        Returns:
+            bool: 値を削除した場合True，keyまたはvalueが存在しない場合False
+        """
+        ...
+
+    def remove_range(self, source: Iterable[T], key_selector: Callable[[T], TKey], value_selector: Callable[[T], TValue] | None = None) -> None:
+        """シーケンスの要素をキーごとに削除します。
+        存在しない要素は無視されます。
+
+        Args:
+            source (Iterable[T]): 削除する要素のシーケンス
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            value_selector (Callable[[T], TValue] | None): 要素を値に変換する関数。Noneの場合は要素自身
+        """
+        remove: Callable[[TKey, TValue], bool] = self.remove
+        if value_selector is None:
+            for current in source:
+                remove(key_selector(current), current)  # type: ignore
+            return
+        for current in source:
+            remove(key_selector(current), value_selector(current))
+
+    def merge(self, other: "Lookup[TKey, TValue]") -> None:
+        """他のLookupの値をキーごとに末尾に追加します。
+
+        Args:
+            other (Lookup[TKey, TValue]): 追加する値を持つLookup
+        """
+        # 自身を併合する場合に，追加中の値を読み込まないよう先に取り出す
+        values: list[tuple[TKey, list[TValue]]] = [(grouping.key, grouping.to_list()) for grouping in other]
+        for key, group in values:
+            for value in group:
+                self.add(key, value)
+
+    @abstractmethod
+    def snapshot(self) -> "Lookup[TKey, TValue]":
+        """現在の内容を保持する複製を取得します。
+        複製と元のLookupの変更は互いに影響しないため，更新中も読み込み側は複製を使い続けられます。
+        to_look_upで構築したLookupの複製は値を共有し，いずれかを変更する際に変更する部分のみを複製します。
+
+        Returns:
+            Lookup[TKey, TValue]: 現在の内容の複製
+        """
+        ...
@@ -1,66 +1,176 @@
 from abc import ABCMeta, abstractmethod
-from typing import TYPE_CHECKING, Callable, Generator, Generic, Iterable, Iterator, Literal, Sized, overload
+from collections import Counter, deque
+from collections.abc import Sized
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Generator, Generic, Iterable, Iterator, Literal, overload
 
 from .type_variants import *
 if TYPE_CHECKING:
-    from .grouping import Grouping, Lookup
     from .ordering import OrderedLinqSequence
 
 
-class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
+class LinqSequence(Generic[T], Iterable[T], metaclass=ABCMeta):
     """LINQのシーケンスを表します。
+    インスタンスは列挙の状態を持たず，列挙の度に独立した列挙子が生成されます。
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """LinqSequence[T]の新しいインスタンスを初期化します。
         """
         pass
 
+    @abstractmethod
     def __iter__(self) -> Iterator[T]:
-        if self._in_iteration() is not None:
-            self._stop_iteration()
+        """新しい列挙子を生成します。
+        呼び出し毎に独立した列挙子を返すため，同一のインスタンスを入れ子や複数のスレッドで同時に列挙できます。
+
+        Returns:
+            Iterator[T]: 新しい列挙子
+        """
+        ...
+
+    def _try_get_count(self) -> int:
+        """列挙せずに要素数を取得します。
+
+        Returns:
+            int: 要素数。不明な場合は-1
+        """
+        if isinstance(self, Sized):
+            return len(self)
+        return -1
+
+    def _get_max_count(self) -> int:
+        """列挙せずに要素数の上限を取得します。
+
+        Returns:
+            int: 要素数の上限。不明な場合は-1
+        """
+        return self._try_get_count()
+
+    def __length_hint__(self) -> int:
+        # 上限を返すと絞り込み後の少数の要素のために元の要素数分の領域が確保されるため，確定した要素数のみを返す
+        count: int = self._try_get_count()
+        if count < 0:
+            return NotImplemented
+        return count
+
+    def _counting_source(self) -> "LinqSequence[Any]":
+        """要素数を数える際に代わりに列挙できる，要素数の等しいシーケンスを取得します。
+
+        Returns:
+            LinqSequence[Any]: 要素数を数える際に列挙するシーケンス
+        """
         return self
 
-    def __next__(self) -> T:
-        if not self._in_iteration():
-            self._start_iteration()
-        try:
-            current: T = self._get_next()
-            return current
-        except StopIteration:
-            self._stop_iteration()
-            raise
+    def _get_sort_level(self) -> "tuple[Callable[[Any], Any], bool] | None":
+        """要素が並んでいる順序を，列挙せずに取得します。
+        キーが等しい要素は連続して並ぶため，集合演算を隣り合う要素の比較で行えます。
 
-    @abstractmethod
-    def _in_iteration(self) -> bool:
-        """インスタンスが列挙中かどうかを取得します。
+        Returns:
+            tuple[Callable[[Any], Any], bool] | None: 並び替えのキーを生成する関数と降順かどうかの組。不明な場合はNone
+        """
+        return None
+
+    def _is_indexable(self) -> bool:
+        """列挙せずに任意の位置の要素を取得できるかを判定します。
+        Trueを返すシーケンスは_try_get_countで要素数を返し，_get_itemを実装します。
 
         Returns:
-            bool: インスタンスが列挙中の場合はTrue，それ以外でFalse
+            bool: インデックスで要素を取得できる場合はTrue，それ以外でFalse
         """
-        ...
+        return False
 
-    @abstractmethod
-    def _start_iteration(self) -> None:
-        """列挙を開始します。
+    def _get_item(self, index: int) -> T:
+        """列挙せずに指定した位置の要素を取得します。
+        _is_indexableでTrueを返すシーケンスで上書きします。上書きしない場合は先頭から列挙して取得します。
+
+        Args:
+            index (int): 0以上要素数未満のインデックス
+
+        Raises:
+            IndexError: indexが要素数以上
+
+        Returns:
+            T: indexに対応する要素
         """
-        ...
+        for current in islice(self, index, None):
+            return current
+        raise IndexError("sequence index out of range")
 
-    @abstractmethod
-    def _stop_iteration(self) -> None:
-        """列挙を停止します。
+    @overload
+    def __getitem__(self, index: int) -> T:
+        """指定したインデックスの要素を取得します。
+        負のインデックスは末尾からの位置を表します。
+
+        Args:
+            index (int): 検索インデックス
+
+        Raises:
+            IndexError: indexが範囲外
+
+        Returns:
+            T: indexに対応する要素
         """
         ...
 
-    @abstractmethod
-    def _get_next(self) -> T:
-        """次に列挙する値を取得します。
+    @overload
+    def __getitem__(self, index: slice) -> "LinqSequence[T]":
+        """指定した範囲の要素を列挙するシーケンスを取得します。
+        負の位置や負の増分はlistのスライスと同じ意味を持ちます。
+
+        Args:
+            index (slice): 取得する範囲
+
+        Raises:
+            ValueError: 増分が0
 
         Returns:
-            T: 次に列挙する値
+            LinqSequence[T]: 範囲内の要素を列挙するシーケンス
         """
         ...
 
+    def __getitem__(self, index: int | slice) -> "T | LinqSequence[T]":
+        if isinstance(index, slice):
+            if index.step == 0:
+                raise ValueError("slice step cannot be zero")
+
+            def inner(source: LinqSequence[T], index: slice) -> Generator[T, None, None]:
+                if source._is_indexable():
+                    yield from map(source._get_item, range(source._try_get_count())[index])
+                elif (index.start is None or index.start >= 0) and (index.stop is None or index.stop >= 0) and (index.step is None or index.step > 0):
+                    yield from islice(source, index.start, index.stop, index.step)
+                else:
+                    # 末尾からの位置は要素数が分かるまで決まらない
+                    yield from list(source)[index]
+
+            sliced: LinqSequence[T] = LinqSequence.from_generator(inner, self, index)
+            return sliced
+        if self._is_indexable():
+            count: int = self._try_get_count()
+            if index < 0:
+                index += count
+            if index < 0 or index >= count:
+                raise IndexError("sequence index out of range")
+            return self._get_item(index)
+        if index < 0:
+            buffer: deque[T] = deque(self, maxlen=-index)
+            if len(buffer) < -index:
+                raise IndexError("sequence index out of range")
+            return buffer[0]
+        for current in islice(self, index, None):
+            return current
+        raise IndexError("sequence index out of range")
+
+    def __reversed__(self) -> Iterator[T]:
+        """逆順に列挙する新しい列挙子を生成します。
+
+        Returns:
+            Iterator[T]: 新しい列挙子
+        """
+        return iter(self.reverse())
+
     # From
 
     @classmethod
@@ -73,10 +183,9 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: sourceを持つシーケンスのインスタンス
         """
-        from ._sequences import FromSequence, SizedFromSequence
-        if isinstance(source, Sized):
-            return SizedFromSequence[T](source)
-        return FromSequence[T](source)
+        if type(source) in SEQUENCE_TYPES or isinstance(source, Sized):
+            return SizedFromSequence(source)
+        return FromSequence(source)
 
     @classmethod
     def from_dict(cls, source: dict[TKey, TValue]) -> "LinqSequence[tuple[TKey, TValue]]":
@@ -88,8 +197,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[tuple[TKey, TValue]]: sourceを持つシーケンスのインスタンス
         """
-        from ._sequences import DictSequence
-        return DictSequence[TKey, TValue](source)
+        return DictSequence(source)
 
     @classmethod
     def from_generator(cls, func: Callable[*TArgs, Generator[T, None, None]], *args: *TArgs) -> "LinqSequence[T]":  # type: ignore
@@ -102,8 +210,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: funcによるGeneratorを持つシーケンスのインスタンス
         """
-        from ._sequences import GeneratorSequence
-        return GeneratorSequence[T](func, *args)
+        return GeneratorSequence(func, *args)
 
     # Create
 
@@ -114,8 +221,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 空のシーケンス
         """
-        from ._sequences import EmptySequence
-        return EmptySequence[T]()
+        return EmptySequence()
 
     @classmethod
     def range(cls, start: int, count: int) -> "LinqSequence[int]":
@@ -131,11 +237,10 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[int]: 指定した範囲の整数を列挙するシーケンス
         """
-        from ._sequences import RangeSequence
         if count < 0:
             raise ValueError("parameter 'count' must be 0 or positive value")
         if count == 0:
-            return LinqSequence[int].empty()
+            return LinqSequence.empty()
         return RangeSequence(start, count)
 
     @classmethod
@@ -152,7 +257,6 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 単一の値を繰り返し列挙するシーケンス
         """
-        from ._sequences import RepeatSequence
         if count < 0:
             raise ValueError("parameter 'count' must be 0 or positive value")
         if count == 0:
@@ -169,19 +273,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
             LinqSequence[T]: シーケンスが空の場合に既定値を一つ与えるシーケンス
         """
 
-        def inner(source: LinqSequence[T], default: T) -> Generator[T, None, None]:
-            iterator: Iterator[T] = iter(source)
-            try:
-                yield next(iterator)
-            except StopIteration:
-                yield default
-            while True:
-                try:
-                    yield next(iterator)
-                except StopIteration:
-                    return
-
-        return self.from_generator(inner, self, default)
+        return DefaultIfEmptySequence(self, default)
 
     # Concatination
 
@@ -194,8 +286,25 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 結合のシーケンス
         """
-        from ._sequences import ConcatSequence
-        return ConcatSequence[T](self, iterable)
+        if type(self) is ConcatSequence:
+            return ConcatSequence(self, (iterable,), False)
+        return ConcatSequence(None, (self, iterable), False)
+
+    def concat_all(self, iterables: Iterable[Iterable[T]]) -> "LinqSequence[T]":
+        """末尾に複数のシーケンスを順に結合します。
+
+        iterablesはこのメソッドの呼び出し時に読み込まれます。結合するシーケンスの数によらず，
+        要素あたりの処理は一つのconcatと同じです。
+
+        Args:
+            iterables (Iterable[Iterable[T]]): 末尾に結合するシーケンスの並び
+
+        Returns:
+            LinqSequence[T]: 結合のシーケンス
+        """
+        if type(self) is ConcatSequence:
+            return ConcatSequence(self, tuple(iterables), False)
+        return ConcatSequence(None, (self, *iterables), False)
 
     def append(self, value: T) -> "LinqSequence[T]":
         """シーケンスの末尾に要素を追加します。
@@ -206,8 +315,9 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 追加後のシーケンス
         """
-        from ._sequences import ApPrependSequence
-        return ApPrependSequence[T](self, value, True)
+        if type(self) is ConcatSequence:
+            return ConcatSequence(self, ((value,),), False)
+        return ConcatSequence(None, (self, (value,)), False)
 
     def prepend(self, value: T) -> "LinqSequence[T]":
         """シーケンスの先頭に要素を追加します。
@@ -218,8 +328,9 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 追加後のシーケンス
         """
-        from ._sequences import ApPrependSequence
-        return ApPrependSequence[T](self, value, False)
+        if type(self) is ConcatSequence:
+            return ConcatSequence(self, ((value,),), True)
+        return ConcatSequence(None, ((value,), self), False)
 
     # Joining
 
@@ -248,24 +359,19 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
                 inner_key_selector: Callable[[T2], TKey],
                 result_selector: Callable[[T, T2], TResult]
         ) -> Generator[TResult, None, None]:
-            from ._sequences import LookupImpl, GroupingImpl
 
-            look_up = LookupImpl[TKey, T2]()
-            key: TKey
-            for current_inner in inner:
-                key = inner_key_selector(current_inner)
-                look_up.get_or_add_grouping(key).add(current_inner)
+            look_up: LookupImpl[TKey, T2] = LookupImpl.create(inner, inner_key_selector)
             if len(look_up) == 0:
                 return
+            get_values: Callable[[TKey], list[T2] | None] = look_up.get_values
             for current_outer in outer:
-                key = outer_key_selector(current_outer)
-                group: GroupingImpl[TKey, T2] | None = look_up.get_grouping(key)
+                group: list[T2] | None = get_values(outer_key_selector(current_outer))
                 if group is None:
                     continue
                 for current_group in group:
                     yield result_selector(current_outer, current_group)
 
-        return LinqSequence[TResult].from_generator(inner_func, self, inner, outer_key_selector, inner_key_selector, result_selector)
+        return LinqSequence.from_generator(inner_func, self, inner, outer_key_selector, inner_key_selector, result_selector)
 
     def group_join(
             self,
@@ -292,17 +398,11 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
                 inner_key_selector: Callable[[T2], TKey],
                 result_selector: Callable[[T, LinqSequence[T2]], TResult]
         ) -> Generator[TResult, None, None]:
-            from ._sequences import LookupImpl, GroupingImpl
-            look_up = LookupImpl[TKey, T2]()
-            key: TKey
-            for current_inner in inner:
-                key = inner_key_selector(current_inner)
-                look_up.get_or_add_grouping(key).add(current_inner)
+            look_up: LookupImpl[TKey, T2] = LookupImpl.create(inner, inner_key_selector)
             for current_outer in outer:
-                key = outer_key_selector(current_outer)
-                yield result_selector(current_outer, look_up[key])
+                yield result_selector(current_outer, look_up[outer_key_selector(current_outer)])
 
-        return LinqSequence[TResult].from_generator(inner_func, self, inner, outer_key_selector, inner_key_selector, result_selector)
+        return LinqSequence.from_generator(inner_func, self, inner, outer_key_selector, inner_key_selector, result_selector)
 
     # Check (Sequence)
 
@@ -322,10 +422,14 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
             except StopIteration:
                 return (False,)
 
+
         if id(self) == id(other):
             return True
-        if isinstance(self, Sized) and isinstance(other, Sized) and len(self) != len(other):
-            return False
+        count1: int = self._try_get_count()
+        if count1 >= 0:
+            count2: int = get_count(other)
+            if count2 >= 0 and count1 != count2:
+                return False
         iterator1: Iterator[T] = iter(self)
         iterator2: Iterator[T] = iter(other)
         while True:
@@ -364,7 +468,11 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
 
     def any(self, match: Callable[[T], bool] | None = None) -> bool:
         if match is None:
-            iterator: Iterator[T] = iter(self)
+            source: LinqSequence[Any] = self._counting_source()
+            count: int = source._try_get_count()
+            if count >= 0:
+                return count > 0
+            iterator: Iterator[Any] = iter(source)
             try:
                 next(iterator)
                 return True
@@ -420,6 +528,10 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         """
         if index < 0:
             raise ValueError("parameter 'index' must be 0 or positive value")
+        if self._is_indexable():
+            if index >= self._try_get_count():
+                raise IndexError()
+            return self._get_item(index)
         i: int = 0
         for current in self:
             if i == index:
@@ -442,6 +554,10 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         """
         if index < 0:
             raise ValueError("parameter 'index' must be 0 or positive value")
+        if self._is_indexable():
+            if index >= self._try_get_count():
+                return default
+            return self._get_item(index)
         i: int = 0
         for current in self:
             if i == index:
@@ -553,6 +669,18 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         ...
 
     def last(self, match: Callable[[T], bool] | None = None) -> T:
+        if self._is_indexable():
+            get_item: Callable[[int], T] = self._get_item
+            count: int = self._try_get_count()
+            if match is None:
+                if count == 0:
+                    raise ValueError("sequence is empty")
+                return get_item(count - 1)
+            for i in range(count - 1, -1, -1):
+                current: T = get_item(i)
+                if match(current):
+                    return current
+            raise ValueError("the element which matches the condition is not found")
         iterator: Iterator[T] = iter(self)
         result: T
         if match is None:
@@ -600,6 +728,16 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         ...
 
     def last_or_default(self, default: T, match: Callable[[T], bool] | None = None) -> T:
+        if self._is_indexable():
+            get_item: Callable[[int], T] = self._get_item
+            count: int = self._try_get_count()
+            if match is None:
+                return get_item(count - 1) if count > 0 else default
+            for i in range(count - 1, -1, -1):
+                current: T = get_item(i)
+                if match(current):
+                    return current
+            return default
         iterator: Iterator[T] = iter(self)
         result: T
         if match is None:
@@ -754,13 +892,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         ...
 
     def where(self, match: Callable[[T], bool] | Callable[[T, int], bool]) -> "LinqSequence[T]":
-        from ._sequences import WhereSequence
-        from ._common import get_parameter_count
-        if get_parameter_count(match) == 1:
-            match1: Callable[[T], bool] = match  # type: ignore
-            return WhereSequence[T](self, lambda x, _: match1(x))
-        match2: Callable[[T, int], bool] = match  # type: ignore
-        return WhereSequence[T](self, match2)
+        return WhereSequence(self, match, get_parameter_count(match) != 1)
 
     def of_type(self, target: type[TResult]) -> "LinqSequence[TResult]":
         """指定した型で絞り込みを行います。
@@ -802,23 +934,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         ...
 
     def to_look_up(self, key_selector: Callable[[T], TKey], value_selector: Callable[[T], TValue] | None = None) -> "Lookup[TKey, T] | Lookup[TKey, TValue]":
-        from ._sequences import GroupingImpl, LookupImpl
-        result: LookupImpl[TKey, T] | LookupImpl[TKey, TValue]
-        current_key: TKey
-        if value_selector is None:
-            result = LookupImpl[TKey, T]()
-            for current in self:
-                current_key = key_selector(current)
-                grouping1: GroupingImpl[TKey, T] = result.get_or_add_grouping(current_key)
-                grouping1.add(current)
-            return result
-
-        result = LookupImpl[TKey, TValue]()
-        for current in self:
-            current_key = key_selector(current)
-            grouping2: GroupingImpl[TKey, TValue] = result.get_or_add_grouping(current_key)
-            grouping2.add(value_selector(current))
-        return result
+        return LookupImpl.create(self, key_selector, value_selector)
 
     @overload
     def group_by(self, key_selector: Callable[[T], TKey], element_selector: None = None) -> "LinqSequence[Grouping[TKey, T]]":
@@ -879,8 +995,10 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         element_selector: Callable[[T], T2] | None = None,
         result_selector: "Callable[[TKey, LinqSequence[T]], TResult] | Callable[[TKey, LinqSequence[T2]], TResult] | None" = None
     ) -> "LinqSequence[Grouping[TKey, T]] | LinqSequence[Grouping[TKey, T2]] | LinqSequence[TResult]":
-        if not TYPE_CHECKING:
-            from .grouping import Grouping, Lookup
+        level: tuple[Callable[[Any], Any], bool] | None = self._get_sort_level()
+        if level is not None and level[0] is key_selector:
+            # キーで並んでいる場合は同じキーの要素が連続するため，キーが変わるたびにグループを返す
+            return AdjacentGroupingSequence(self, key_selector, element_selector, result_selector)
 
         if result_selector is None:
             # group_by(self, key_selector: Callable[[T], TKey]) -> "LinqSequence[Grouping[TKey, T]]"
@@ -889,14 +1007,16 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
                     look_up: Lookup[TKey, T] = source.to_look_up(key_selector)
                     yield from look_up
 
-                return LinqSequence[Grouping[TKey, T]].from_generator(inner1, self, key_selector)
+                groups1: LinqSequence[Grouping[TKey, T]] = LinqSequence.from_generator(inner1, self, key_selector)
+                return groups1
             # group_by(self, key_selector: Callable[[T], TKey], element_selector: Callable[[T], T2]) -> "LinqSequence[Grouping[TKey, T2]]":
             else:
                 def inner2(source: LinqSequence[T], key_selector: Callable[[T], TKey], element_selector: Callable[[T], T2]) -> Generator[Grouping[TKey, T2], None, None]:
                     look_up: Lookup[TKey, T2] = source.to_look_up(key_selector, element_selector)
                     yield from look_up
 
-                return LinqSequence[Grouping[TKey, T2]].from_generator(inner2, self, key_selector, element_selector)
+                groups2: LinqSequence[Grouping[TKey, T2]] = LinqSequence.from_generator(inner2, self, key_selector, element_selector)
+                return groups2
         else:
             # group_by(self, key_selector: Callable[[T], TKey], result_selector: Callable[[TKey, LinqSequence[T]], TResult]) -> "LinqSequence[TResult]":
             if element_selector is None:
@@ -905,7 +1025,8 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
                     for current in look_up:
                         yield result_selector(current.key, current)
 
-                return LinqSequence[TResult].from_generator(inner3, self, key_selector, result_selector)
+                results3: LinqSequence[TResult] = LinqSequence.from_generator(inner3, self, key_selector, result_selector)
+                return results3
             # group_by(self, key_selector: Callable[[T], TKey], element_selector: Callable[[T], T2], result_selector: Callable[[TKey, LinqSequence[T2]], TResult]) -> "LinqSequence[TResult]":
             else:
                 def inner4(source: LinqSequence[T], key_selector: Callable[[T], TKey], element_selector: Callable[[T], T2], result_selector: Callable[[TKey, LinqSequence[T2]], TResult]) -> Generator[TResult, None, None]:
@@ -913,7 +1034,214 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
                     for current in look_up:
                         yield result_selector(current.key, current)
 
-                return LinqSequence[TResult].from_generator(inner4, self, key_selector, element_selector, result_selector)
+                results4: LinqSequence[TResult] = LinqSequence.from_generator(inner4, self, key_selector, element_selector, result_selector)
+                return results4
+
+    @overload
+    def group_adjacent(self, key_selector: Callable[[T], TKey], element_selector: None = None) -> "LinqSequence[Grouping[TKey, T]]":
+        """キーが等しい連続した要素ごとにグループ化を行います。
+
+        Args:
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+
+        Returns:
+            LinqSequence[Grouping[TKey, T]]: グループ化後のシーケンス
+        """
+        ...
+
+    @overload
+    def group_adjacent(self, key_selector: Callable[[T], TKey], element_selector: Callable[[T], T2]) -> "LinqSequence[Grouping[TKey, T2]]":
+        """キーが等しい連続した要素ごとにグループ化を行います。
+
+        Args:
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            element_selector (Callable[[T], T2]): 要素を変換する関数
+
+        Returns:
+            LinqSequence[Grouping[TKey, T2]]: グループ化後のシーケンス
+        """
+        ...
+
+    @overload
+    def group_adjacent(self, key_selector: Callable[[T], TKey], element_selector: None, result_selector: "Callable[[TKey, LinqSequence[T]], TResult]") -> "LinqSequence[TResult]":
+        """キーが等しい連続した要素ごとにグループ化を行います。
+
+        Args:
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            element_selector None: 必ずNoneにすること
+            result_selector (Callable[[TKey, LinqSequence[T]], TResult]): キーとグループ化された要素を最終的に変換する関数
+
+        Returns:
+            LinqSequence[TResult]: グループ化後のシーケンス
+        """
+        ...
+
+    @overload
+    def group_adjacent(self, key_selector: Callable[[T], TKey], element_selector: Callable[[T], T2], result_selector: "Callable[[TKey, LinqSequence[T2]], TResult]") -> "LinqSequence[TResult]":
+        """キーが等しい連続した要素ごとにグループ化を行います。
+
+        Args:
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            element_selector (Callable[[T], T2]): 要素を変換する関数
+            result_selector (Callable[[TKey, LinqSequence[T2]], TResult]): キーとグループ化された要素を最終的に変換する関数
+
+        Returns:
+            LinqSequence[TResult]: グループ化後のシーケンス
+        """
+        ...
+
+    def group_adjacent(
+        self,
+        key_selector: Callable[[T], TKey],
+        element_selector: Callable[[T], T2] | None = None,
+        result_selector: "Callable[[TKey, LinqSequence[T]], TResult] | Callable[[TKey, LinqSequence[T2]], TResult] | None" = None
+    ) -> "LinqSequence[Grouping[TKey, T]] | LinqSequence[Grouping[TKey, T2]] | LinqSequence[TResult]":
+        """キーが等しい連続した要素ごとにグループ化を行います。
+        キーが変わるたびにグループを返すため，保持するのは現在のグループの要素のみです。
+        同じキーの要素が離れて現れた場合は，別のグループになります。
+
+        Args:
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            element_selector (Callable[[T], T2] | None): 要素を変換する関数
+            result_selector (Callable[[TKey, LinqSequence[T]], TResult] | Callable[[TKey, LinqSequence[T2]], TResult] | None): キーとグループ化された要素を最終的に変換する関数
+
+        Returns:
+            LinqSequence[Grouping[TKey, T]] | LinqSequence[Grouping[TKey, T2]] | LinqSequence[TResult]: グループ化後のシーケンス
+        """
+        return AdjacentGroupingSequence(self, key_selector, element_selector, result_selector)  # type: ignore
+
+    def top_k_by_group(self, key_selector: Callable[[T], TKey], order_key: Callable[[T], Any], k: int, descending: bool = False) -> "LinqSequence[Grouping[TKey, T]]":
+        """キーごとに，並び替えた先頭から指定した個数の要素をグループ化します。
+        結果はgroup_by(key_selector)の各グループをorder_keyで並び替えてk個取得したものと一致し，
+        キーごとに2k個程度までの要素のみを保持するため，メモリはO(キーの数 * k)です。
+
+        Args:
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            order_key (Callable[[T], Any]): グループ内の並び替えのキーを生成する関数
+            k (int): グループごとに取得する要素数
+            descending (bool): 降順に並び替える場合はTrue
+
+        Raises:
+            ValueError: kが0以下
+
+        Returns:
+            LinqSequence[Grouping[TKey, T]]: グループ化後のシーケンス
+        """
+        if k <= 0:
+            raise ValueError("parameter 'k' must be positive value")
+        return TopByGroupSequence(self, key_selector, order_key, k, descending)
+
+    def count_by(self, key_selector: Callable[[T], TKey]) -> "LinqSequence[tuple[TKey, int]]":
+        """キーごとの要素数を数えます。
+        グループを生成せずにキーごとの要素数のみを保持します。
+
+        Args:
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+
+        Returns:
+            LinqSequence[tuple[TKey, int]]: 最初に現れた順のキーと要素数の組のシーケンス
+        """
+        def inner(source: LinqSequence[T], key_selector: Callable[[T], TKey]) -> Generator[tuple[TKey, int], None, None]:
+            # Counterはキーの数え上げをCで行う
+            yield from Counter(map(key_selector, source)).items()
+
+        counts: LinqSequence[tuple[TKey, int]] = LinqSequence.from_generator(inner, self, key_selector)
+        return counts
+
+    def aggregate_by(self, key_selector: Callable[[T], TKey], seed: TAccumulate, func: Callable[[TAccumulate, T], TAccumulate]) -> "LinqSequence[tuple[TKey, TAccumulate]]":
+        """キーごとに累積の計算を行います。
+        グループを生成せずにキーごとの累積値のみを保持します。
+
+        Args:
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            seed (TAccumulate): 各キーの累積値の初期値
+            func (Callable[[TAccumulate, T], TAccumulate]): 累積値と要素から次の累積値を計算する関数
+
+        Returns:
+            LinqSequence[tuple[TKey, TAccumulate]]: 最初に現れた順のキーと累積値の組のシーケンス
+        """
+        def inner(source: LinqSequence[T], key_selector: Callable[[T], TKey], seed: TAccumulate, func: Callable[[TAccumulate, T], TAccumulate]) -> Generator[tuple[TKey, TAccumulate], None, None]:
+            accumulates: dict[TKey, TAccumulate] = {}
+            get: Callable[[TKey, TAccumulate], TAccumulate] = accumulates.get
+            for current in source:
+                key: TKey = key_selector(current)
+                accumulates[key] = func(get(key, seed), current)
+            yield from accumulates.items()
+
+        results: LinqSequence[tuple[TKey, TAccumulate]] = LinqSequence.from_generator(inner, self, key_selector, seed, func)
+        return results
+
+    def sum_by(self, key_selector: Callable[[T], TKey], value_selector: Callable[[T], int | bool | float]) -> "LinqSequence[tuple[TKey, float]]":
+        """キーごとの合計値を算出します。
+        グループを生成せずにキーごとの合計値のみを保持します。
+
+        Args:
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            value_selector (Callable[[T], int | bool | float]): 計算する値を導出する関数
+
+        Returns:
+            LinqSequence[tuple[TKey, float]]: 最初に現れた順のキーと合計値の組のシーケンス
+        """
+        def inner(source: LinqSequence[T], key_selector: Callable[[T], TKey], value_selector: Callable[[T], int | bool | float]) -> Generator[tuple[TKey, float], None, None]:
+            totals: dict[TKey, float] = {}
+            get: Callable[[TKey, float], float] = totals.get
+            for current in source:
+                key: TKey = key_selector(current)
+                totals[key] = get(key, .0) + value_selector(current)
+            yield from totals.items()
+
+        sums: LinqSequence[tuple[TKey, float]] = LinqSequence.from_generator(inner, self, key_selector, value_selector)
+        return sums
+
+    def max_by_group(self, key_selector: Callable[[T], TKey], value_selector: Callable[[T], int | bool | float]) -> "LinqSequence[tuple[TKey, T]]":
+        """キーごとに最大値を取る要素を取得します。
+        グループを生成せずにキーごとの最大値と要素のみを保持します。値が等しい場合は先に現れた要素を選びます。
+
+        Args:
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            value_selector (Callable[[T], int | bool | float]): 要素から値を導出する関数
+
+        Returns:
+            LinqSequence[tuple[TKey, T]]: 最初に現れた順のキーと最大値を取る要素の組のシーケンス
+        """
+        def inner(source: LinqSequence[T], key_selector: Callable[[T], TKey], value_selector: Callable[[T], int | bool | float]) -> Generator[tuple[TKey, T], None, None]:
+            maximums: dict[TKey, float] = {}
+            results: dict[TKey, T] = {}
+            for current in source:
+                key: TKey = key_selector(current)
+                value: float = value_selector(current)
+                if key not in maximums or value > maximums[key]:
+                    maximums[key] = value
+                    results[key] = current
+            yield from results.items()
+
+        elements: LinqSequence[tuple[TKey, T]] = LinqSequence.from_generator(inner, self, key_selector, value_selector)
+        return elements
+
+    def min_by_group(self, key_selector: Callable[[T], TKey], value_selector: Callable[[T], int | bool | float]) -> "LinqSequence[tuple[TKey, T]]":
+        """キーごとに最小値を取る要素を取得します。
+        グループを生成せずにキーごとの最小値と要素のみを保持します。値が等しい場合は先に現れた要素を選びます。
+
+        Args:
+            key_selector (Callable[[T], TKey]): 要素からキーを選択する関数
+            value_selector (Callable[[T], int | bool | float]): 要素から値を導出する関数
+
+        Returns:
+            LinqSequence[tuple[TKey, T]]: 最初に現れた順のキーと最小値を取る要素の組のシーケンス
+        """
+        def inner(source: LinqSequence[T], key_selector: Callable[[T], TKey], value_selector: Callable[[T], int | bool | float]) -> Generator[tuple[TKey, T], None, None]:
+            minimums: dict[TKey, float] = {}
+            results: dict[TKey, T] = {}
+            for current in source:
+                key: TKey = key_selector(current)
+                value: float = value_selector(current)
+                if key not in minimums or value < minimums[key]:
+                    minimums[key] = value
+                    results[key] = current
+            yield from results.items()
+
+        elements: LinqSequence[tuple[TKey, T]] = LinqSequence.from_generator(inner, self, key_selector, value_selector)
+        return elements
 
     # Ordering
 
@@ -923,7 +1251,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             OrderedLinqSequence[T]: 並び替えられたシーケンス
         """
-        return self.order_by(lambda x: x)
+        return self.order_by(identity)
 
     def order_by(self, key_selector: Callable[[T], TKey]) -> "OrderedLinqSequence[T]":
         """並び替えられたシーケンスを取得します。
@@ -934,8 +1262,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             OrderedLinqSequence[T]: 並び替えられたシーケンス
         """
-        from ._sequences import OrderedLinqSequenceImpl
-        return OrderedLinqSequenceImpl[T, TKey](self, key_selector, False, None)
+        return OrderedLinqSequenceImpl(self, ((key_selector, False),))
 
     def order_descending(self) -> "OrderedLinqSequence[T]":
         """逆順に並び替えられたシーケンスを取得します。
@@ -943,7 +1270,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             OrderedLinqSequence[T]: 並び替えられたシーケンス
         """
-        return self.order_by_descending(lambda x: x)
+        return self.order_by_descending(identity)
 
     def order_by_descending(self, key_selector: Callable[[T], TKey]) -> "OrderedLinqSequence[T]":
         """逆順に並び替えられたシーケンスを取得します。
@@ -954,8 +1281,36 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             OrderedLinqSequence[T]: 並び替えられたシーケンス
         """
-        from ._sequences import OrderedLinqSequenceImpl
-        return OrderedLinqSequenceImpl[T, TKey](self, key_selector, True, None)
+        return OrderedLinqSequenceImpl(self, ((key_selector, True),))
+
+    def assume_sorted(self, key_selector: Callable[[T], TKey], descending: bool = False) -> "OrderedLinqSequence[T]":
+        """既に並び替えられているシーケンスを，並び替えずに並び替えられたシーケンスとして取得します。
+        then_byで条件を加えた場合は，キーが等しい連続した要素ごとに並び替えます。順序は検査されません。
+
+        Args:
+            key_selector (Callable[[T], TKey]): シーケンスが並び替えられているキーを生成する関数
+            descending (bool): 降順に並んでいる場合はTrue
+
+        Returns:
+            OrderedLinqSequence[T]: 並び替えられたシーケンス
+        """
+        return OrderedLinqSequenceImpl(self, ((key_selector, descending),), "assumed", 1)
+
+    def merge_ordered(self, others: Iterable[Iterable[T]], key_selector: Callable[[T], TKey], descending: bool = False) -> "OrderedLinqSequence[T]":
+        """並び替えられた複数のシーケンスを，順序を保ったまま併合します。
+        othersはこのメソッドの呼び出し時に読み込まれます。k個のシーケンスの併合はO(n log k)で，各シーケンスの先頭の要素のみを保持します。
+        キーが等しい要素は前のシーケンスのものから順に並びます。
+
+        Args:
+            others (Iterable[Iterable[T]]): 併合する，同じキーで並び替えられたシーケンスの並び
+            key_selector (Callable[[T], TKey]): 各シーケンスが並び替えられているキーを生成する関数
+            descending (bool): 各シーケンスが降順に並んでいる場合はTrue
+
+        Returns:
+            OrderedLinqSequence[T]: 併合したシーケンス
+        """
+        merged: MergeSequence[T] = MergeSequence(ConcatSequence(None, (self, *others), False), key_selector, descending)
+        return OrderedLinqSequenceImpl(merged, ((key_selector, descending),), "assumed", 1)
 
     def reverse(self) -> "LinqSequence[T]":
         """逆順のシーケンスを取得します。
@@ -963,10 +1318,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 逆順のシーケンス
         """
-        def inner(source: LinqSequence[T]) -> Generator[T, None, None]:
-            yield from reversed(source.to_list())
-
-        return self.from_generator(inner, self)
+        return ReverseSequence(self)
 
     # Set operation
 
@@ -976,8 +1328,13 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 一意の要素からなるシーケンス
         """
+        level: tuple[Callable[[Any], Any], bool] | None = self._get_sort_level()
+        if level is not None and level[0] is identity:
+            # 要素自身で並んでいる場合は，等しい要素が連続するため直前の要素とのみ比較する
+            return DistinctAdjacentSequence(self, None)
+
         def inner(source: LinqSequence[T]) -> Generator[T, None, None]:
-            already_iterated = set[T]()
+            already_iterated: set[T] = set()
             for current in source:
                 if current in already_iterated:
                     continue
@@ -994,8 +1351,12 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 一意の要素からなるシーケンス
         """
+        level: tuple[Callable[[Any], Any], bool] | None = self._get_sort_level()
+        if level is not None and level[0] is key_selector:
+            return DistinctAdjacentSequence(self, key_selector)
+
         def inner(source: LinqSequence[T], key_selector: Callable[[T], TKey]) -> Generator[T, None, None]:
-            already_iterated = set[TKey]()
+            already_iterated: set[TKey] = set()
             for current in source:
                 key: TKey = key_selector(current)
                 if key in already_iterated:
@@ -1004,6 +1365,18 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
                 already_iterated.add(key)
         return self.from_generator(inner, self, key_selector)
 
+    def distinct_ordered(self, key_selector: Callable[[T], TKey] | None = None) -> "LinqSequence[T]":
+        """キーの等しい要素が連続して並ぶシーケンスから，一意の要素からなるシーケンスに変換します。
+        直前の要素のキーとのみ比較するため，集合を用いずに一度の列挙で重複を除きます。並びは検査されません。
+
+        Args:
+            key_selector (Callable[[T], TKey] | None): 要素の比較に用いる値を導出する関数。Noneの場合は要素自身
+
+        Returns:
+            LinqSequence[T]: 一意の要素からなるシーケンス
+        """
+        return DistinctAdjacentSequence(self, key_selector)
+
     def union(self, source: Iterable[T]) -> "LinqSequence[T]":
         """和集合を取得します。
 
@@ -1013,8 +1386,25 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 和集合を表すシーケンス
         """
-        from ._sequences import UnionSequence
-        return UnionSequence[T](self, source)
+        if type(self) is UnionSequence:
+            return UnionSequence(ConcatSequence(self._source, (source,), False))
+        return UnionSequence(ConcatSequence(None, (self, source), False))
+
+    def union_all(self, sources: Iterable[Iterable[T]]) -> "LinqSequence[T]":
+        """複数の比較集合との和集合を取得します。
+
+        sourcesはこのメソッドの呼び出し時に読み込まれます。比較集合の数によらず，
+        重複は一つの集合で除かれます。
+
+        Args:
+            sources (Iterable[Iterable[T]]): 比較集合の並び
+
+        Returns:
+            LinqSequence[T]: 和集合を表すシーケンス
+        """
+        if type(self) is UnionSequence:
+            return UnionSequence(ConcatSequence(self._source, tuple(sources), False))
+        return UnionSequence(ConcatSequence(None, (self, *sources), False))
 
     def union_by(self, source: Iterable[T], key_selector: Callable[[T], TKey]) -> "LinqSequence[T]":
         """和集合を取得します。
@@ -1026,8 +1416,28 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 和集合を表すシーケンス
         """
-        from ._sequences import UnionBySequence
-        return UnionBySequence[T, TKey](self, source, key_selector)
+        # 同じ関数で和集合を取る場合のみ一つのノードにまとめる
+        if type(self) is UnionBySequence and self._key_selector is key_selector:
+            return UnionBySequence(ConcatSequence(self._source, (source,), False), key_selector)
+        return UnionBySequence(ConcatSequence(None, (self, source), False), key_selector)
+
+    def union_ordered(self, source: Iterable[T], key_selector: Callable[[T], TKey] | None = None, descending: bool = False) -> "LinqSequence[T]":
+        """同じキーで並んだシーケンスの和集合を，併合しながら取得します。
+        結果はキーの順に並び，集合を用いずに一度の列挙で求めます。並びは検査されません。
+
+        Args:
+            source (Iterable[T]): このシーケンスと同じキーで並んだ比較集合
+            key_selector (Callable[[T], TKey] | None): 比較時のキーを生成する関数。Noneの場合は要素自身
+            descending (bool): 降順に並んでいる場合はTrue
+
+        Returns:
+            LinqSequence[T]: 和集合を表すシーケンス
+        """
+        # 同じ条件で和集合を取る場合のみ一つの併合にまとめる
+        if type(self) is DistinctAdjacentSequence and type(self._source) is MergeSequence and self._key_selector is key_selector\
+                and self._source._key_selector is key_selector and self._source._descending == descending:
+            return DistinctAdjacentSequence(MergeSequence(ConcatSequence(self._source._source, (source,), False), key_selector, descending), key_selector)
+        return DistinctAdjacentSequence(MergeSequence(ConcatSequence(None, (self, source), False), key_selector, descending), key_selector)
 
     def excepted(self, source: Iterable[T]) -> "LinqSequence[T]":
         """差集合を取得します。
@@ -1038,8 +1448,10 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 差集合を表すシーケンス
         """
-        from ._sequences import ExceptSequence
-        return ExceptSequence[T](self, source)
+        descending: bool | None = get_merge_direction(self, source, identity)
+        if descending is not None:
+            return OrderedExceptSequence(self, source, identity, descending)
+        return ExceptSequence(self, source)
 
     def excepted_by(self, source: Iterable[T], key_selector: Callable[[T], TKey]) -> "LinqSequence[T]":
         """差集合を取得します。
@@ -1051,8 +1463,24 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 差集合を表すシーケンス
         """
-        from ._sequences import ExceptBySequence
-        return ExceptBySequence[T, TKey](self, source, key_selector)
+        descending: bool | None = get_merge_direction(self, source, key_selector)
+        if descending is not None:
+            return OrderedExceptSequence(self, source, key_selector, descending)
+        return ExceptBySequence(self, source, key_selector)
+
+    def excepted_ordered(self, source: Iterable[T], key_selector: Callable[[T], TKey] | None = None, descending: bool = False) -> "LinqSequence[T]":
+        """同じキーで並んだシーケンスとの差集合を，併合しながら取得します。
+        集合を用いずに一度の列挙で求めます。並びは検査されません。
+
+        Args:
+            source (Iterable[T]): このシーケンスと同じキーで並んだ比較集合
+            key_selector (Callable[[T], TKey] | None): 比較時のキーを生成する関数。Noneの場合は要素自身
+            descending (bool): 降順に並んでいる場合はTrue
+
+        Returns:
+            LinqSequence[T]: 差集合を表すシーケンス
+        """
+        return OrderedExceptSequence(self, source, identity if key_selector is None else key_selector, descending)
 
     def intercept(self, source: Iterable[T]) -> "LinqSequence[T]":
         """積集合を取得します。
@@ -1063,8 +1491,10 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 積集合を表すシーケンス
         """
-        from ._sequences import InterceptSequence
-        return InterceptSequence[T](self, source)
+        descending: bool | None = get_merge_direction(self, source, identity)
+        if descending is not None:
+            return OrderedInterceptSequence(self, source, identity, descending)
+        return InterceptSequence(self, source)
 
     def intercept_by(self, source: Iterable[T], key_selector: Callable[[T], TKey]) -> "LinqSequence[T]":
         """積集合を取得します。
@@ -1076,8 +1506,24 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 積集合を表すシーケンス
         """
-        from ._sequences import InterceptBySequence
-        return InterceptBySequence[T, TKey](self, source, key_selector)
+        descending: bool | None = get_merge_direction(self, source, key_selector)
+        if descending is not None:
+            return OrderedInterceptSequence(self, source, key_selector, descending)
+        return InterceptBySequence(self, source, key_selector)
+
+    def intercept_ordered(self, source: Iterable[T], key_selector: Callable[[T], TKey] | None = None, descending: bool = False) -> "LinqSequence[T]":
+        """同じキーで並んだシーケンスとの積集合を，併合しながら取得します。
+        集合を用いずに一度の列挙で求めます。並びは検査されません。
+
+        Args:
+            source (Iterable[T]): このシーケンスと同じキーで並んだ比較集合
+            key_selector (Callable[[T], TKey] | None): 比較時のキーを生成する関数。Noneの場合は要素自身
+            descending (bool): 降順に並んでいる場合はTrue
+
+        Returns:
+            LinqSequence[T]: 積集合を表すシーケンス
+        """
+        return OrderedInterceptSequence(self, source, identity if key_selector is None else key_selector, descending)
 
     # Partitioning
 
@@ -1090,17 +1536,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: スキップ後のシーケンス
         """
-        def inner(source: LinqSequence[T], count: int) -> Generator[T, None, None]:
-            iterator: Iterator[T] = iter(source)
-            try:
-                for _ in range(count):
-                    next(iterator)
-                while True:
-                    yield next(iterator)
-            except StopIteration:
-                return
-
-        return self.from_generator(inner, self, count)
+        return SkipSequence(self, count)
 
     def skip_last(self, count: int) -> "LinqSequence[T]":
         """末尾から指定した要素数をスキップするシーケンスを取得します。
@@ -1142,28 +1578,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         ...
 
     def skip_while(self, match: Callable[[T], bool] | Callable[[T, int], bool]) -> "LinqSequence[T]":
-        from ._common import get_parameter_count
-
-        def inner(source: LinqSequence[T], match: Callable[[T, int], bool]) -> Generator[T, None, None]:
-            iterator: Iterator[T] = iter(source)
-            try:
-                index: int = 0
-                while True:
-                    current: T = next(iterator)
-                    if not match(current, index):
-                        yield current
-                        break
-                    index += 1
-                while True:
-                    yield next(iterator)
-            except StopIteration:
-                return
-
-        if get_parameter_count(match) == 1:
-            match1: Callable[[T], bool] = match  # type: ignore
-            return self.from_generator(inner, self, lambda x, _: match1(x))
-        match2: Callable[[T, int], bool] = match  # type: ignore
-        return self.from_generator(inner, self, match2)
+        return SkipWhileSequence(self, match, get_parameter_count(match) != 1)
 
     def take(self, count: int) -> "LinqSequence[T]":
         """先頭から指定した個数分要素を取得します。
@@ -1174,10 +1589,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 指定した個数分の要素を持つシーケンス
         """
-        from ._sequences import TakeSequence
-        if count <= 0:
-            return self.empty()
-        return TakeSequence[T](self, count)
+        return TakeSequence(self, count)
 
     def take_last(self, count: int) -> "LinqSequence[T]":
         """末尾から指定した個数分要素を取得します。
@@ -1188,10 +1600,9 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[T]: 指定した個数分の要素を持つシーケンス
         """
-        from ._sequences import TakeLastSequence
         if count <= 0:
             return self.empty()
-        return TakeLastSequence[T](self, count)
+        return TakeLastSequence(self, count)
 
     @overload
     def take_while(self, match: Callable[[T], bool]) -> "LinqSequence[T]":
@@ -1218,14 +1629,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         ...
 
     def take_while(self, match: Callable[[T], bool] | Callable[[T, int], bool]) -> "LinqSequence[T]":
-        from ._common import get_parameter_count
-        from ._sequences import TakeWhileSequence
-
-        if get_parameter_count(match) == 1:
-            match1: Callable[[T], bool] = match  # type: ignore
-            return TakeWhileSequence[T](self, lambda x, _: match1(x))
-        match2: Callable[[T, int], bool] = match  # type: ignore
-        return TakeWhileSequence[T](self, match2)
+        return TakeWhileSequence(self, match, get_parameter_count(match) != 1)
 
     def chunk(self, size: int) -> "LinqSequence[list[T]]":
         """指定したサイズごとに分割します。
@@ -1239,19 +1643,9 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             LinqSequence[list[T]]: 分割されたシーケンス
         """
-        def inner(source: LinqSequence[T], size: int) -> Generator[list[T], None, None]:
-            result = list[T]()
-            for current in source:
-                result.append(current)
-                if len(result) == size:
-                    yield result
-                    result = list[T]()
-            if len(result) > 0:
-                yield result
-
         if size <= 0:
             raise ValueError("parameter 'size' must be bigger than 0")
-        return LinqSequence.from_generator(inner, self, size)
+        return ChunkSequence(self, size)
 
     # Projection
 
@@ -1280,13 +1674,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         ...
 
     def select(self, selector: Callable[[T], TResult] | Callable[[T, int], TResult]) -> "LinqSequence[TResult]":
-        from ._common import get_parameter_count
-        from ._sequences import SelectSequence
-        if get_parameter_count(selector) == 1:
-            selector1: Callable[[T], TResult] = selector  # type:ignore
-            return SelectSequence[T, TResult](self, lambda x, _: selector1(x))
-        selector2: Callable[[T, int], TResult] = selector  # type:ignore
-        return SelectSequence[T, TResult](self, selector2)
+        return SelectSequence(self, selector, get_parameter_count(selector) != 1)
 
     @overload
     def select_many(self, collection_selector: Callable[[T], Iterable[T2]], result_selector: None = None) -> "LinqSequence[T2]":
@@ -1339,48 +1727,10 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         ...
 
     def select_many(self, collection_selector: Callable[[T], Iterable[T2]] | Callable[[T, int], Iterable[T2]], result_selector: Callable[[T2], TResult] | None = None) -> "LinqSequence[T2] | LinqSequence[TResult]":
-        from ._common import get_parameter_count
-        c_selector1: Callable[[T], Iterable[T2]]
-        c_selector2: Callable[[T, int], Iterable[T2]]
         if result_selector is None:
-            # select_many(collection_selector: Callable[[T], Iterable[T2]]) -> LinqSequence[T2]
-            if get_parameter_count(collection_selector) == 1:
-                def inner1(source: LinqSequence[T], collection_selector: Callable[[T], Iterable[T2]]) -> Generator[T2, None, None]:
-                    for current in source:
-                        yield from collection_selector(current)
-                c_selector1 = collection_selector  # type: ignore
-                return LinqSequence[T2].from_generator(inner1, self, c_selector1)
-            # select_many(collection_selector: Callable[[T, int], Iterable[T2]]) -> LinqSequence[T2]
-            else:
-                def inner2(source: LinqSequence[T], collection_selector: Callable[[T, int], Iterable[T2]]) -> Generator[T2, None, None]:
-                    index: int = 0
-                    for current in source:
-                        yield from collection_selector(current, index)
-                        index += 1
-
-                c_selector2 = collection_selector  # type: ignore
-                return LinqSequence[T2].from_generator(inner2, self, c_selector2)
-        else:
-            # select_many(collection_selector: Callable[[T], Iterable[T2]], result_selector: Callable[[T2], TResults]) -> LinqSequence[TResult]
-            if get_parameter_count(collection_selector) == 1:
-                def inner3(source: LinqSequence[T], collection_selector: Callable[[T], Iterable[T2]], result_selector: Callable[[T2], TResult]) -> Generator[TResult, None, None]:
-                    for current in source:
-                        for intermediate in collection_selector(current):
-                            yield result_selector(intermediate)
-
-                c_selector1 = collection_selector  # type: ignore
-                return LinqSequence[TResult].from_generator(inner3, self, c_selector1, result_selector)
-            # select_many(collection_selector: Callable[[T], Iterable[T2, int]], result_selector: Callable[[T2], TResults]) -> LinqSequence[TResult]
-            else:
-                def inner4(source: LinqSequence[T], collection_selector: Callable[[T, int], Iterable[T2]], result_selector: Callable[[T2], TResult]) -> Generator[TResult, None, None]:
-                    index: int = 0
-                    for current in source:
-                        for intermediate in collection_selector(current, index):
-                            yield result_selector(intermediate)
-                        index += 1
-
-                c_selector2 = collection_selector  # type: ignore
-                return LinqSequence[TResult].from_generator(inner4, self, c_selector2, result_selector)
+            flattened: LinqSequence[T2] = SelectManySequence(self, collection_selector, get_parameter_count(collection_selector) != 1, None)
+            return flattened
+        return SelectManySequence(self, collection_selector, get_parameter_count(collection_selector) != 1, result_selector)
 
     @overload
     def zip(self, after: Iterable[T2], result_selector: None = None) -> "LinqSequence[tuple[T, T2]]":
@@ -1408,18 +1758,36 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         ...
 
     def zip(self, after: Iterable[T2], result_selector: Callable[[T, T2], TResult] | None = None) -> "LinqSequence[tuple[T, T2]] | LinqSequence[TResult]":
-        def inner(first: LinqSequence[T], second: LinqSequence[T2], result_selector: Callable[[T, T2], TResult]) -> Generator[TResult, None, None]:
-            iter1: Iterator[T] = iter(first)
-            iter2: Iterator[T2] = iter(second)
-            while True:
-                try:
-                    yield result_selector(next(iter1), next(iter2))
-                except StopIteration:
-                    return
-
         if result_selector is None:
-            return LinqSequence[tuple[T, T2]].from_generator(inner, self, after, lambda x, y: (x, y))
-        return LinqSequence[TResult].from_generator(inner, self, after, result_selector)
+            pairs: LinqSequence[tuple[T, T2]] = ZipSequence(self, after, None)
+            return pairs
+        return ZipSequence(self, after, result_selector)
+
+    # Compilation
+
+    def compile(self) -> "LinqSequence[T]":
+        """where，select，skip，take，take_whileの連なりを単一のループに融合したシーケンスを取得します。
+        列挙結果は融合前のシーケンスと同じです。
+
+        Returns:
+            LinqSequence[T]: 融合されたシーケンス
+        """
+        return compile_sequence(self)
+
+    @classmethod
+    def prepare(cls, template: Callable[..., "LinqSequence[TResult]"]) -> "PreparedQuery[Any, TResult]":
+        """読み込むシーケンスと引数を実行ごとに与えるクエリを準備します。
+
+        templateは準備時にプレースホルダーを与えて一度だけ呼び出されます。引数はtemplateが生成する関数に
+        捕捉されるか，演算子に直接与えられる必要があります。
+
+        Args:
+            template (Callable[..., LinqSequence[TResult]]): 読み込むシーケンスと引数を受け取りクエリを組み立てる関数
+
+        Returns:
+            PreparedQuery[Any, TResult]: 読み込むシーケンスと引数を受け取りクエリを返す呼び出し可能なオブジェクト
+        """
+        return PreparedQuery(template)
 
     # Convert to collection
 
@@ -1429,7 +1797,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             list[T]: インスタンスの要素を格納するリストの新しいインスタンス
         """
-        return list[T](self)
+        return list(self)
 
     @overload
     def to_dict(self, key_selector: Callable[[T], TKey], value_selector: None = None) -> dict[TKey, T]:
@@ -1457,18 +1825,16 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         ...
 
     def to_dict(self, key_selector: Callable[[T], TKey], value_selector: Callable[[T], TValue] | None = None) -> dict[TKey, T] | dict[TKey, TValue]:
-        result: dict[TKey, T] | dict[TKey, TValue]
-
         if value_selector is None:
-            result = dict[TKey, T]()
+            result1: dict[TKey, T] = {}
             for current in self:
-                result[key_selector(current)] = current
-            return result
+                result1[key_selector(current)] = current
+            return result1
         else:
-            result = dict[TKey, TValue]()
+            result2: dict[TKey, TValue] = {}
             for current in self:
-                result[key_selector(current)] = value_selector(current)
-            return result
+                result2[key_selector(current)] = value_selector(current)
+            return result2
 
     def to_set(self) -> set[T]:
         """集合に変換します。
@@ -1476,7 +1842,7 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             set[T]: インスタンスの要素を格納する集合の新しいインスタンス
         """
-        return set[T](self)
+        return set(self)
 
     # Statistics
 
@@ -1504,10 +1870,12 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
     def count(self, match: Callable[[T], bool] | None = None) -> int:
         result: int
         if match is None:
-            if isinstance(self, Sized):
-                return len(self)
+            source: LinqSequence[Any] = self._counting_source()
+            result = source._try_get_count()
+            if result >= 0:
+                return result
             result = 0
-            for _ in self:
+            for _ in source:
                 result += 1
             return result
         result = 0
@@ -1593,14 +1961,15 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         Returns:
             float: 平均値
         """
-        if isinstance(self, Sized):
-            return self.sum(key_selector) / len(self)
+        count: int = self._try_get_count()
+        if count >= 0:
+            return self.sum(key_selector) / count
 
-        count: int = 0
+        count = 0
         result: float = .0
         for current in self:
             result += key_selector(current)
-            count += 0
+            count += 1
         return result / count
 
     @overload
@@ -1637,3 +2006,48 @@ class LinqSequence(Generic[T], Iterator[T], metaclass=ABCMeta):
         if result_selector is None:
             return accumulate
         return result_selector(accumulate)
+
+
+# ノードのモジュールはLinqSequenceを継承するため，クラスの定義後に読み込む
+from ._common import get_count, get_parameter_count, identity  # noqa: E402
+from .grouping import Grouping, Lookup  # noqa: E402
+from ._compiler import compile_sequence  # noqa: E402
+from .prepared_query import PreparedQuery  # noqa: E402
+from ._sequences.from_sequence import SEQUENCE_TYPES  # noqa: E402
+from ._sequences.set_operation_sequence import get_merge_direction  # noqa: E402
+from ._sequences import (  # noqa: E402
+    AdjacentGroupingSequence,
+    ChunkSequence,
+    ConcatSequence,
+    DefaultIfEmptySequence,
+    DictSequence,
+    DistinctAdjacentSequence,
+    EmptySequence,
+    ExceptBySequence,
+    ExceptSequence,
+    FromSequence,
+    GeneratorSequence,
+    InterceptBySequence,
+    InterceptSequence,
+    LookupImpl,
+    MergeSequence,
+    OrderedExceptSequence,
+    OrderedInterceptSequence,
+    OrderedLinqSequenceImpl,
+    RangeSequence,
+    RepeatSequence,
+    ReverseSequence,
+    SelectManySequence,
+    SelectSequence,
+    SizedFromSequence,
+    SkipSequence,
+    SkipWhileSequence,
+    TakeLastSequence,
+    TakeSequence,
+    TakeWhileSequence,
+    TopByGroupSequence,
+    UnionBySequence,
+    UnionSequence,
+    WhereSequence,
+    ZipSequence,
+)
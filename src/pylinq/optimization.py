@@ -0,0 +1,75 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+
+_rules: dict[str, bool] = {
+    "fold_empty": True,
+    "fold_known_count": True,
+    "fuse_where": True,
+    "fuse_select": True,
+    "merge_take": True,
+    "merge_skip": True,
+    "push_take": True,
+    "push_skip": True,
+    "top_k": True,
+    "use_itertools": True,
+}
+_version: int = 0
+
+
+def get_rule_names() -> list[str]:
+    """書き換え規則の名前の一覧を取得します。
+
+    Returns:
+        list[str]: 書き換え規則の名前の一覧
+    """
+    return list[str](_rules)
+
+
+def is_rule_enabled(name: str) -> bool:
+    """書き換え規則が有効かどうかを取得します。
+
+    Args:
+        name (str): 書き換え規則の名前
+
+    Raises:
+        KeyError: nameに対応する書き換え規則が存在しない
+
+    Returns:
+        bool: 有効な場合はTrue，それ以外でFalse
+    """
+    return _rules[name]
+
+
+def set_rule_enabled(name: str, enabled: bool) -> None:
+    """書き換え規則の有効・無効を設定します。
+
+    Args:
+        name (str): 書き換え規則の名前
+        enabled (bool): 有効にする場合はTrue，無効にする場合はFalse
+
+    Raises:
+        KeyError: nameに対応する書き換え規則が存在しない
+    """
+    global _version
+    if name not in _rules:
+        raise KeyError(name)
+    _rules[name] = enabled
+    _version += 1
+
+
+@contextmanager
+def disabled_rules(*names: str) -> Iterator[None]:
+    """指定した書き換え規則を一時的に無効にします。
+
+    Args:
+        names (str): 無効にする書き換え規則の名前
+    """
+    previous: dict[str, bool] = {name: is_rule_enabled(name) for name in names}
+    for name in names:
+        set_rule_enabled(name, False)
+    try:
+        yield
+    finally:
+        for name, enabled in previous.items():
+            set_rule_enabled(name, enabled)
@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import Callable, Generic
+from typing import Any, Callable, Generic
 
 from .type_variants import *
 from .linq_sequence import LinqSequence
@@ -9,6 +9,8 @@ class OrderedLinqSequence(LinqSequence[T], Generic[T], metaclass=ABCMeta):
     """並び替えられたシーケンスを表します。
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def _create_oredered_sequence(self, key_selector: Callable[[T], TKey], descending: bool) -> "OrderedLinqSequence[T]":
         """二つ目のソート条件で並び替えを行います。
@@ -22,6 +24,32 @@ class OrderedLinqSequence(LinqSequence[T], Generic[T], metaclass=ABCMeta):
         """
         ...
 
+    @abstractmethod
+    def _with_mode(self, mode: str, option: Any) -> "OrderedLinqSequence[T]":
+        """並び替えの条件が同じで，並び替えの実行方法が異なるシーケンスを取得します。
+
+        Args:
+            mode (str): 並び替えの実行方法
+            option (Any): 実行方法ごとの設定
+
+        Returns:
+            OrderedLinqSequence[T]: 並び替え後のシーケンス
+        """
+        ...
+
+    @abstractmethod
+    def seek_after(self, key: Any) -> LinqSequence[T]:
+        """並び替えた順序で，指定したキーより後に並ぶ要素のシーケンスを取得します。
+        cachedで得たシーケンスでは保持した結果を二分探索し，O(log n)で位置を求めます。
+
+        Args:
+            key (Any): 並び替えのキー。条件が複数の場合は条件ごとのキーのタプル
+
+        Returns:
+            LinqSequence[T]: keyより後に並ぶ要素のシーケンス
+        """
+        ...
+
     def then_by(self, key_selector: Callable[[T], TKey]) -> "OrderedLinqSequence[T]":
         """二つ目のソート条件で並び替えを行います。
 
@@ -43,3 +71,72 @@ class OrderedLinqSequence(LinqSequence[T], Generic[T], metaclass=ABCMeta):
             OrderedLinqSequence[T]: ソート後のシーケンス
         """
         return self._create_oredered_sequence(key_selector, True)
+
+    def incremental(self) -> "OrderedLinqSequence[T]":
+        """要素が必要になるたびに並び替えを進めるシーケンスを取得します。
+        先頭の要素はO(n)で得られ，全体の計算量は読み込んだ要素数に比例します。途中で列挙を止める場合に適しています。
+
+        Returns:
+            OrderedLinqSequence[T]: 並び替え後のシーケンス
+        """
+        return self._with_mode("incremental", None)
+
+    def cached(self) -> "OrderedLinqSequence[T]":
+        """最初の列挙で並び替えた結果を保持し，以降の列挙で再利用するシーケンスを取得します。
+        読み込むシーケンスが変化しない場合にのみ使用できます。
+
+        Returns:
+            OrderedLinqSequence[T]: 並び替え後のシーケンス
+        """
+        return self._with_mode("cached", None)
+
+    def page(self, cursor: Any, size: int) -> LinqSequence[T]:
+        """キーを基準に，並び替えた順序で指定した個数の要素を取得します。
+
+        Args:
+            cursor (Any): 前のページの最後の要素のキー。先頭のページではNone
+            size (int): 取得する要素数
+
+        Returns:
+            LinqSequence[T]: cursorより後に並ぶ先頭からsize個の要素のシーケンス
+        """
+        if cursor is None:
+            return self.take(size)
+        return self.seek_after(cursor).take(size)
+
+    def external(self, run_size: int = 1000000, directory: str | None = None) -> "OrderedLinqSequence[T]":
+        """メモリに収まらない要素を一時ファイルに書き出して並び替えるシーケンスを取得します。
+        一定数ずつ並び替えた要素を一時ファイルに書き出し，列挙時にそれらを併合します。要素はpickleで保存できる必要があります。
+
+        Args:
+            run_size (int): 一度にメモリ上で並び替える要素数
+            directory (str | None): 一時ファイルを作成するディレクトリ。Noneの場合は既定の一時ディレクトリ
+
+        Raises:
+            ValueError: run_sizeが0以下
+
+        Returns:
+            OrderedLinqSequence[T]: 並び替え後のシーケンス
+        """
+        if run_size <= 0:
+            raise ValueError("parameter 'run_size' must be positive value")
+        return self._with_mode("external", (run_size, directory))
+
+    def parallel(self, workers: int | None = None, min_size: int = 100000) -> "OrderedLinqSequence[T]":
+        """要素を分割してプロセスプールで並び替えるシーケンスを取得します。
+        キーはワーカーのプロセスで生成され，並び替えた部分は安定に併合されます。キーを生成する関数と要素はpickleで送れる必要があり，
+        送れない場合や要素数がmin_size未満の場合は現在のプロセスで並び替えます。
+
+        Args:
+            workers (int | None): プロセス数。Noneの場合はCPUの数
+            min_size (int): 並列に並び替える最小の要素数
+
+        Raises:
+            ValueError: workersが0以下
+
+        Returns:
+            OrderedLinqSequence[T]: 並び替え後のシーケンス
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError("parameter 'workers' must be positive value")
+        return self._with_mode("parallel", (workers, min_size))
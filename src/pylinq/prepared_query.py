@@ -0,0 +1,253 @@
+from functools import partial
+from operator import attrgetter, itemgetter, methodcaller
+from types import CellType, FunctionType, MethodType, ModuleType
+from typing import Any, Callable, Generator, Generic, Iterator, cast, final
+
+from ._common import get_parameter_count
+from ._compiler import collect_stages, get_fused_function
+from ._sequences import GeneratorSequence
+from .linq_sequence import LinqSequence
+from .type_variants import *
+
+
+@final
+class Parameter:
+    """準備されたクエリの引数の位置を表すプレースホルダーです。
+    """
+
+    __slots__ = ("_index", "_name")
+
+    def __init__(self, index: int, name: str) -> None:
+        """Parameterの新しいインスタンスを初期化します。
+
+        Args:
+            index (int): 実行時に与えられる引数の位置
+            name (str): 引数の名前
+        """
+        self._index: int = index
+        self._name: str = name
+
+    def __repr__(self) -> str:
+        return f"Parameter({self._name!r})"
+
+    def __unbound(self, *args: Any) -> Any:
+        # 組み立て時に値として使われた場合は，融合を諦めて実行ごとに組み立てるため例外を送出する
+        raise TypeError(f"parameter {self._name!r} is not bound while the query is prepared")
+
+    __bool__ = __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = __hash__ = __str__ = __format__ = __unbound
+
+
+@final
+class _SourcePlaceholder(LinqSequence[Any]):
+    """準備されたクエリの読み込むシーケンスの位置を表すプレースホルダーです。
+    """
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[Any]:
+        raise TypeError("the source of a prepared query is not bound")
+
+
+@final
+class _FunctionBinder:
+    """引数を捕捉する関数を，実行時の引数を捕捉する関数に作り直します。
+    """
+
+    __slots__ = ("_function", "_binders")
+
+    def __init__(self, function: FunctionType, binders: list[tuple[int, Callable[[tuple[Any, ...]], Any]]]) -> None:
+        """_FunctionBinderの新しいインスタンスを初期化します。
+
+        Args:
+            function (FunctionType): 準備時に生成された関数
+            binders (list[tuple[int, Callable[[tuple[Any, ...]], Any]]]): 作り直すセルの位置とその中身を生成する関数の組
+        """
+        # FunctionTypeで注釈するとmypyがメソッドへの変換を行う記述子として扱うため，Callableとして保持する
+        self._function: Callable[..., Any] = function
+        self._binders: list[tuple[int, Callable[[tuple[Any, ...]], Any]]] = binders
+
+    def __call__(self, values: tuple[Any, ...]) -> FunctionType:
+        function: FunctionType = cast(FunctionType, self._function)
+        # 引数に依存しないセルは共有し，関数の間で状態を保ったままにする
+        cells: list[CellType] = list(function.__closure__)  # type: ignore
+        for index, binder in self._binders:
+            cells[index] = CellType(binder(values))
+        result: FunctionType = FunctionType(function.__code__, function.__globals__, function.__name__, function.__defaults__, tuple(cells))
+        result.__kwdefaults__ = function.__kwdefaults__
+        return result
+
+
+def _get_cell_contents(function: FunctionType) -> list[Any]:
+    """関数が捕捉している値を取得します。
+
+    Args:
+        function (FunctionType): 対象の関数
+
+    Returns:
+        list[Any]: 値が設定されているセルの中身
+    """
+    result: list[Any] = []
+    for cell in function.__closure__ or ():
+        try:
+            result.append(cell.cell_contents)
+        except ValueError:
+            # 値が設定される前のセル
+            continue
+    return result
+
+
+def _wraps_parameter(value: Any, visited: set[int]) -> bool:
+    """値が引数のプレースホルダーであるか，プレースホルダーを内部に保持しているかを検証します。
+
+    Args:
+        value (Any): 準備時の値
+        visited (set[int]): 調べ終えた値のid
+
+    Returns:
+        bool: プレースホルダーを含む場合True
+    """
+    value_type: type = type(value)
+    if value_type is Parameter:
+        return True
+    if id(value) in visited or isinstance(value, (type, ModuleType)):
+        return False
+    visited.add(id(value))
+    contents: tuple[Any, ...]
+    if value_type in (tuple, list, set, frozenset):
+        contents = tuple(value)
+    elif value_type is dict:
+        contents = (*value.keys(), *value.values())
+    elif value_type is partial:
+        contents = (value.func, *value.args, *value.keywords.values())
+    elif value_type is MethodType:
+        contents = (value.__func__, value.__self__)
+    elif value_type in (attrgetter, itemgetter, methodcaller):
+        contents = value.__reduce__()
+    elif value_type is FunctionType:
+        contents = (*(value.__defaults__ or ()), *(value.__kwdefaults__ or {}).values(), *_get_cell_contents(value))
+    else:
+        # 呼び出し可能なオブジェクトは属性に値を捕捉しうる
+        contents = tuple(getattr(value, "__dict__", {}).values())
+    return any(_wraps_parameter(content, visited) for content in contents)
+
+
+def _get_binder(value: Any, visited: set[int]) -> Callable[[tuple[Any, ...]], Any] | None:
+    """値を実行時の引数で置き換える関数を取得します。
+
+    Args:
+        value (Any): 準備時の値
+        visited (set[int]): 調べ終えた関数のid
+
+    Raises:
+        TypeError: 関数のセル以外の場所に引数を捕捉していて置き換えられない場合
+
+    Returns:
+        Callable[[tuple[Any, ...]], Any] | None: 実行時の引数を受け取り置き換えた値を返す関数。引数に依存しない場合はNone
+    """
+    if type(value) is Parameter:
+        index: int = value._index
+        return lambda values: values[index]
+    if type(value) is not FunctionType:
+        if _wraps_parameter(value, set()):
+            raise TypeError("a parameter is captured by a callable that cannot be rebound")
+        return None
+    if id(value) in visited:
+        return None
+    visited.add(id(value))
+    if _wraps_parameter((*(value.__defaults__ or ()), *(value.__kwdefaults__ or {}).values()), set()):
+        raise TypeError("a parameter is captured by a default argument that cannot be rebound")
+    if value.__closure__ is None:
+        return None
+    binders: list[tuple[int, Callable[[tuple[Any, ...]], Any]]] = []
+    for i, cell in enumerate(value.__closure__):
+        try:
+            contents: Any = cell.cell_contents
+        except ValueError:
+            continue
+        binder: Callable[[tuple[Any, ...]], Any] | None = _get_binder(contents, visited)
+        if binder is not None:
+            binders.append((i, binder))
+    if len(binders) == 0:
+        return None
+    return _FunctionBinder(value, binders)
+
+
+class PreparedQuery(Generic[T, TResult]):
+    """読み込むシーケンスと引数を実行ごとに与えるクエリを表します。
+
+    where，select，skip，take，take_whileのみからなるクエリは準備時に単一のループに融合され，
+    実行時には引数を捕捉する関数のみを作り直します。その他のクエリは実行ごとに組み立て直されます。
+    """
+
+    __slots__ = ("__template", "__parameter_count", "__fused", "__args", "__binders")
+
+    def __init__(self, template: Callable[..., LinqSequence[TResult]]) -> None:
+        """PreparedQuery[T, TResult]の新しいインスタンスを初期化します。
+
+        Args:
+            template (Callable[..., LinqSequence[TResult]]): 読み込むシーケンスと引数を受け取りクエリを組み立てる関数
+        """
+        self.__template: Callable[..., LinqSequence[TResult]] = template
+        self.__parameter_count: int = get_parameter_count(template) - 1
+        self.__fused: Callable[..., Generator[TResult, None, None]] | None = None
+        self.__args: list[Any] = []
+        self.__binders: list[tuple[int, Callable[[tuple[Any, ...]], Any]]] = []
+
+        source: _SourcePlaceholder = _SourcePlaceholder()
+        names: tuple[str, ...] = template.__code__.co_varnames if type(template) is FunctionType else ()
+        parameters: list[Parameter] = [Parameter(i, names[i + 1] if i + 1 < len(names) else f"arg{i}") for i in range(self.__parameter_count)]
+        try:
+            query: LinqSequence[TResult] = template(source, *parameters)
+        except Exception:
+            # 組み立て時に引数の値を調べるクエリは実行ごとに組み立てる
+            return
+        kinds: tuple[str, ...]
+        node: Any
+        kinds, self.__args, node = collect_stages(query)
+        if node is not source or len(kinds) == 0:
+            return
+        visited: set[int] = set()
+        try:
+            for i, arg in enumerate(self.__args):
+                binder: Callable[[tuple[Any, ...]], Any] | None = _get_binder(arg, visited)
+                if binder is not None:
+                    self.__binders.append((i, binder))
+        except TypeError:
+            # 作り直せない場所に引数を捕捉するクエリは実行ごとに組み立てる
+            self.__binders = []
+            return
+        self.__fused = get_fused_function(kinds)
+
+    def __call__(self, source: Iterable[T], *args: Any) -> LinqSequence[TResult]:
+        """読み込むシーケンスと引数を与えてクエリを取得します。
+
+        Args:
+            source (Iterable[T]): 読み込むシーケンス
+            args: テンプレートに与える引数
+
+        Raises:
+            TypeError: 引数の数がテンプレートと一致しない場合
+
+        Returns:
+            LinqSequence[TResult]: クエリの結果を表すシーケンス
+        """
+        if len(args) != self.__parameter_count:
+            raise TypeError(f"prepared query takes {self.__parameter_count} arguments but {len(args)} were given")
+        fused: Callable[..., Generator[TResult, None, None]] | None = self.__fused
+        if fused is None:
+            return self.__template(LinqSequence.from_iterable(source), *args)
+        stage_args: list[Any] = self.__args
+        if len(self.__binders) > 0:
+            stage_args = stage_args.copy()
+            for index, binder in self.__binders:
+                stage_args[index] = binder(args)
+        return GeneratorSequence(fused, source, *stage_args)
+
+    @property
+    def is_compiled(self) -> bool:
+        """準備時に単一のループに融合されたかどうかを取得します。
+
+        Returns:
+            bool: 融合された場合True
+        """
+        return self.__fused is not None
@@ -13,3 +13,13 @@ from .partitioning_test import GetMultiTest
 from .projection_test import ProjectionTest
 from .convert_test import ConverTest
 from .stat_test import StatTest
+from .compile_test import CompileTest
+from .enumeration_test import EnumerationTest
+from .optimization_test import OptimizationTest
+from .length_test import LengthTest
+from .indexing_test import IndexingTest
+from .arity_test import ArityTest
+from .itertools_test import ItertoolsTest
+from .import_test import ImportTest
+from .slots_test import SlotsTest
+from .prepared_test import PreparedTest
@@ -0,0 +1,58 @@
+import unittest
+from functools import partial, wraps
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, cast
+
+from pylinq import LinqSequence
+from pylinq._common import get_parameter_count
+
+
+def _add(x: int, y: int) -> int:
+    return x + y
+
+
+class _Point:
+    def __init__(self, x: int) -> None:
+        self.x: int = x
+
+    def shifted(self, value: int) -> int:
+        return self.x + value
+
+
+class ArityTest(unittest.TestCase):
+    def test_parameter_count(self) -> None:
+        def logged(func: Callable[..., Any]) -> Callable[..., Any]:
+            @wraps(func)
+            def inner(*args: Any) -> Any:
+                return func(*args)
+            return inner
+
+        assert get_parameter_count(lambda x: x) == 1
+        assert get_parameter_count(lambda x, i: x) == 2
+        assert get_parameter_count(lambda x, *, key=None: x) == 1
+        assert get_parameter_count(len) == 1
+        assert get_parameter_count(abs) == 1
+        assert get_parameter_count(str) == 1
+        assert get_parameter_count("abc".startswith) == 1
+        assert get_parameter_count(partial(_add, 1)) == 1
+        assert get_parameter_count(partial(_add, y=1)) == 1
+        assert get_parameter_count(itemgetter(0)) == 1
+        assert get_parameter_count(attrgetter("x")) == 1
+        assert get_parameter_count(_Point(1).shifted) == 1
+        assert get_parameter_count(logged(_add)) == 2
+
+    def test_cache(self) -> None:
+        for i in range(3):
+            assert get_parameter_count(lambda x: x + i) == 1
+            assert get_parameter_count(lambda x, j: x + i) == 2
+
+    def test_operators(self) -> None:
+        source: LinqSequence[tuple[int, int]] = LinqSequence.from_iterable([(1, 2), (3, 4), (5, 6)])
+        assert source.select(itemgetter(0)).to_list() == [1, 3, 5]
+        assert source.select(itemgetter(1)).where(cast(Callable[[int], bool], partial(_add, 0))).to_list() == [2, 4, 6]
+        assert source.select(itemgetter(0)).select(partial(_add, y=10)).to_list() == [11, 13, 15]
+        assert source.select(itemgetter(0)).select(_Point).select(attrgetter("x")).to_list() == [1, 3, 5]
+        assert source.skip_while(lambda x: x[0] < 3).to_list() == [(3, 4), (5, 6)]
+        assert source.skip_while(lambda x, i: i < 2).to_list() == [(5, 6)]
+        assert source.select_many(cast(Callable[[tuple[int, int]], list[int]], list)).to_list() == [1, 2, 3, 4, 5, 6]
+        assert source.select_many(lambda x, i: x[:i], str).to_list() == ["3", "5", "6"]
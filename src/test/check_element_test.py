@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, cast
 import unittest
 
 from pylinq import LinqSequence
@@ -24,3 +24,21 @@ class CheckElementTest(unittest.TestCase):
         sequence: LinqSequence[int] = LinqSequence.from_iterable(range(10))
         assert sequence.contains(3)
         assert not sequence.contains(100)
+
+    def test_contains2(self) -> None:
+        sequence: LinqSequence[Any] = LinqSequence.from_iterable({1, 2, 3})
+        assert sequence.contains(3)
+        assert not sequence.contains([3])
+        dictionary: LinqSequence[tuple[str, int]] = LinqSequence.from_dict({"a": 1, "b": 2})
+        assert dictionary.contains(("b", 2))
+        assert not dictionary.contains(("b", 1))
+        assert not dictionary.contains(cast(tuple[str, int], "b"))
+
+    def test_contains3(self) -> None:
+        text: LinqSequence[str] = LinqSequence.from_iterable("abc")
+        assert text.contains("b")
+        assert not text.contains("bc")
+        assert text.contains("bc") == text.where(lambda c: True).contains("bc")
+        data: LinqSequence[int] = LinqSequence.from_iterable(b"abc")
+        assert data.contains(98)
+        assert not data.contains(cast(int, b"bc"))
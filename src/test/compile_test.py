@@ -0,0 +1,42 @@
+import unittest
+
+from pylinq import LinqSequence
+
+
+class CompileTest(unittest.TestCase):
+    def test_compile1(self) -> None:
+        sequence: LinqSequence[str] = LinqSequence.from_iterable(range(100))\
+            .where(lambda x: x % 3 == 0)\
+            .select(lambda x: x * 2)\
+            .where(lambda x, i: i % 2 == 0)\
+            .select(lambda x, i: f"{i}:{x}")\
+            .take(5)
+        assert sequence.compile().to_list() == sequence.to_list()
+
+    def test_compile2(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.from_iterable(range(100))\
+            .take(50)\
+            .where(lambda x: x % 2 == 0)\
+            .take(10)\
+            .take_while(lambda x, i: x < 15 or i < 3)
+        assert sequence.compile().to_list() == sequence.to_list()
+
+    def test_compile3(self) -> None:
+        pulled: list[int] = list[int]()
+
+        def record(x: int) -> int:
+            pulled.append(x)
+            return x
+
+        sequence: LinqSequence[int] = LinqSequence.from_iterable(range(100))\
+            .select(record)\
+            .take(3)\
+            .compile()
+        assert sequence.to_list() == [0, 1, 2]
+        assert pulled == [0, 1, 2]
+        assert sequence.to_list() == [0, 1, 2]
+
+    def test_compile4(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.range(0, 10).reverse()
+        assert sequence.compile() is sequence
+        assert sequence.select(lambda x: x + 1).compile().to_list() == sequence.select(lambda x: x + 1).to_list()
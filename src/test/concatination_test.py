@@ -18,3 +18,43 @@ class ConcatinationTest(unittest.TestCase):
         sequence: LinqSequence = LinqSequence.from_iterable(range(10))\
             .prepend(-1)
         assert sequence.to_list() == list[int](range(-1, 10))
+
+    def test_mixed_chain(self) -> None:
+        head: LinqSequence[float] = LinqSequence.from_iterable(range(3, 6))
+        tail: LinqSequence[float] = LinqSequence.from_iterable([9])
+        sequence: LinqSequence = head\
+            .prepend(2)\
+            .append(6)\
+            .concat(range(7, 9))\
+            .prepend(1)\
+            .concat(tail.append(10).prepend(8.5))
+        assert sequence.to_list() == [1, 2, 3, 4, 5, 6, 7, 8, 8.5, 9, 10]
+        assert sequence.count() == 11
+        assert sequence.to_list() == [1, 2, 3, 4, 5, 6, 7, 8, 8.5, 9, 10]
+
+    def test_branching_chain(self) -> None:
+        base: LinqSequence = LinqSequence.from_iterable(range(3)).append(3)
+        assert base.append(4).to_list() == [0, 1, 2, 3, 4]
+        assert base.prepend(-1).to_list() == [-1, 0, 1, 2, 3]
+        assert base.to_list() == [0, 1, 2, 3]
+
+    def test_long_chain(self) -> None:
+        sequence: LinqSequence = LinqSequence.empty()
+        for i in range(10000):
+            sequence = sequence.append(i) if i % 2 == 0 else sequence.prepend(i)
+        expected: list[int] = list[int](range(9999, 0, -2)) + list[int](range(0, 10000, 2))
+        assert sequence.to_list() == expected
+        assert sequence.count() == 10000
+
+        nested: LinqSequence = LinqSequence.empty()
+        for i in range(10000):
+            nested = LinqSequence.from_iterable([i]).concat(nested)
+        assert nested.to_list() == list[int](range(9999, -1, -1))
+
+    def test_concat_all(self) -> None:
+        sequence: LinqSequence = LinqSequence.from_iterable(range(2))\
+            .concat_all([range(2, 4), [4], (5, 6)])\
+            .concat_all(iter([[7], range(8, 10)]))
+        assert sequence.to_list() == list[int](range(10))
+        assert sequence.count() == 10
+        assert LinqSequence.empty().concat_all([]).to_list() == []
@@ -0,0 +1,41 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pylinq import LinqSequence
+
+
+class EnumerationTest(unittest.TestCase):
+    def test_nested(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.from_iterable(range(5))\
+            .where(lambda x: x % 2 == 0)\
+            .select(lambda x: x * 10)
+        pairs: list[tuple[int, int]] = [(x, y) for x in sequence for y in sequence]
+        assert pairs == [(x, y) for x in [0, 20, 40] for y in [0, 20, 40]]
+
+    def test_interleaved(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.range(0, 10).take(5)
+        iterator1 = iter(sequence)
+        iterator2 = iter(sequence)
+        assert next(iterator1) == 0
+        assert next(iterator1) == 1
+        assert next(iterator2) == 0
+        assert list(iterator1) == [2, 3, 4]
+        assert list(iterator2) == [1, 2, 3, 4]
+
+    def test_sequence_equal_derived(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.from_iterable(range(10)).select(lambda x: x * 2)
+        assert sequence.sequence_equal(sequence.where(lambda _: True))
+
+    def test_range(self) -> None:
+        assert LinqSequence.range(1, 5).to_list() == [1, 2, 3, 4, 5]
+
+    def test_threads(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.from_iterable(range(10000))\
+            .where(lambda x: x % 3 == 0)\
+            .select(lambda x: x + 1)\
+            .order_by_descending(lambda x: x)\
+            .take(1000)
+        expected: list[int] = sequence.to_list()
+        with ThreadPoolExecutor(8) as executor:
+            results: list[list[int]] = list(executor.map(lambda _: sequence.to_list(), range(32)))
+        assert all(map(lambda x: x == expected, results))
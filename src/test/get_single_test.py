@@ -87,3 +87,9 @@ class GetSingleTest(unittest.TestCase):
     def test_single_or_default4(self) -> None:
         sequence: LinqSequence[str] = LinqSequence.from_iterable(["A", "AA", "AAA", "AAAA", "AAAAA"])
         assert sequence.single_or_default("Z", lambda x: len(x) == 100) == "Z"
+
+    def test_last_indexable(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.from_iterable(range(1000000))
+        assert sequence.last() == 999999
+        assert sequence.last(lambda x: x % 7 == 0) == 999999
+        assert sequence.last_or_default(-1, lambda x: x < 0) == -1
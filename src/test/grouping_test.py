@@ -1,6 +1,43 @@
 import unittest
+from typing import Callable, Iterator
 
 from pylinq import Grouping, LinqSequence, Lookup
+from pylinq._sequences import GroupingImpl
+
+
+class _DictLookup(Lookup[int, str]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.values: dict[int, list[str]] = {}
+
+    def contains_key(self, key: int) -> bool:
+        return key in self.values
+
+    def __getitem__(self, key: int) -> LinqSequence[str]:  # type: ignore[override]
+        return LinqSequence.from_iterable(self.values.get(key, []))
+
+    def __iter__(self) -> Iterator[Grouping[int, str]]:
+        return (GroupingImpl(key, values) for key, values in self.values.items())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, key: int, value: str) -> None:
+        self.values.setdefault(key, []).append(value)
+
+    def remove(self, key: int, value: str) -> bool:
+        values: list[str] | None = self.values.get(key)
+        if values is None or value not in values:
+            return False
+        values.remove(value)
+        if len(values) == 0:
+            del self.values[key]
+        return True
+
+    def snapshot(self) -> "_DictLookup":
+        result: _DictLookup = _DictLookup()
+        result.values = {key: values.copy() for key, values in self.values.items()}
+        return result
 
 
 class GroupingTest(unittest.TestCase):
@@ -106,3 +143,138 @@ class GroupingTest(unittest.TestCase):
         assert sequence.single(lambda x: x[0] == "Tanaka")[1] == [2]
         assert sequence.single(lambda x: x[0] == "Takahashi")[1] == [3]
         assert sequence.single(lambda x: x[0] == "Ito")[1] == [5]
+
+    def test_group_adjacent(self) -> None:
+        source: list[tuple[int, str]] = [
+            (1, "Sato"),
+            (2, "Sato"),
+            (3, "Tanaka"),
+            (4, "Sato"),
+            (5, "Ito"),
+            (6, "Ito"),
+        ]
+        sequence: LinqSequence[Grouping[str, tuple[int, str]]] = LinqSequence.from_iterable(source)\
+            .group_adjacent(lambda x: x[1])
+        groupings: list[Grouping[str, tuple[int, str]]] = sequence.to_list()
+        assert [x.key for x in groupings] == ["Sato", "Tanaka", "Sato", "Ito"]
+        assert groupings[0].to_list() == [(1, "Sato"), (2, "Sato")]
+        assert groupings[3].select(lambda x: x[0]).to_list() == [5, 6]
+        assert groupings[0].count() == 2 and groupings[0][-1] == (2, "Sato")
+
+        assert LinqSequence.from_iterable(source).group_adjacent(lambda x: x[1], lambda x: x[0]).select(lambda x: x.to_list()).to_list() == [[1, 2], [3], [4], [5, 6]]
+        counts: Callable[[str, LinqSequence[tuple[int, str]]], tuple[str, int]] = lambda k, g: (k, g.count())
+        assert LinqSequence.from_iterable(source).group_adjacent(lambda x: x[1], None, counts).to_list() == [("Sato", 2), ("Tanaka", 1), ("Sato", 1), ("Ito", 2)]
+        assert LinqSequence.from_iterable(source).group_adjacent(lambda x: x[1], lambda x: x[0], lambda k, g: g.sum(lambda x: x)).to_list() == [3, 3, 4, 11]
+        assert LinqSequence[int].empty().group_adjacent(lambda x: x).count() == 0
+
+        reads: list[int] = [0]
+
+        def generate() -> Iterator[int]:
+            while True:
+                reads[0] += 1
+                yield reads[0] // 3
+
+        generated: LinqSequence[int] = LinqSequence.from_generator(generate)
+        first: Grouping[int, int] = generated.group_adjacent(lambda x: x).first()
+        assert first.to_list() == [0, 0] and reads[0] == 3
+
+    def test_group_by_sorted(self) -> None:
+        source: list[tuple[int, str]] = [(i, str(i % 3)) for i in range(10)]
+        key: Callable[[tuple[int, str]], str] = lambda x: x[1]
+        ordered: LinqSequence[Grouping[str, tuple[int, str]]] = LinqSequence.from_iterable(source).order_by(key).group_by(key)
+        expected: list[tuple[str, list[tuple[int, str]]]] = LinqSequence.from_iterable(source).group_by(key)\
+            .select(lambda x: (x.key, x.to_list())).to_list()
+        assert ordered.select(lambda x: (x.key, x.to_list())).to_list() == expected
+        assert LinqSequence.from_iterable(source).assume_sorted(lambda x: x[0]).group_by(key).count() == 3
+
+    def test_top_k_by_group(self) -> None:
+        source: list[tuple[str, int, int]] = [(("a", "b", "c")[i * 7 % 3], i * 5 % 11, i) for i in range(60)]
+        for descending in (False, True):
+            for k in (1, 3, 25):
+                expected: list[tuple[str, list[tuple[str, int, int]]]] = LinqSequence.from_iterable(source).group_by(lambda x: x[0])\
+                    .select(lambda g: (g.key, (g.order_by_descending(lambda x: x[1]) if descending else g.order_by(lambda x: x[1])).take(k).to_list()))\
+                    .to_list()
+                actual: list[tuple[str, list[tuple[str, int, int]]]] = LinqSequence.from_iterable(source)\
+                    .top_k_by_group(lambda x: x[0], lambda x: x[1], k, descending)\
+                    .select(lambda g: (g.key, g.to_list()))\
+                    .to_list()
+                assert actual == expected
+        names: LinqSequence[Grouping[int, str]] = LinqSequence.from_iterable(["bb", "a", "cc", "d", "ee"]).top_k_by_group(len, lambda x: x, 2, True)
+        assert names.select(lambda g: (g.key, g.to_list())).to_list() == [(2, ["ee", "cc"]), (1, ["d", "a"])]
+        self.assertRaises(ValueError, LinqSequence.from_iterable(source).top_k_by_group, lambda x: x[0], lambda x: x[1], 0)
+
+    def test_look_up_views(self) -> None:
+        look_up: Lookup[int, str] = LinqSequence.from_iterable(["a", "bb", "c", "dd", "eee"]).to_look_up(len)
+        assert len(look_up) == 3
+        grouping: LinqSequence[str] = look_up[1]
+        assert isinstance(grouping, Grouping) and grouping.key == 1
+        assert grouping.to_list() == ["a", "c"] and grouping[-1] == "c" and grouping.count() == 2
+        assert [(x.key, x.to_list()) for x in look_up] == [(1, ["a", "c"]), (2, ["bb", "dd"]), (3, ["eee"])]
+        assert look_up[4].to_list() == [] and not look_up.contains_key(4)
+        assert look_up[4] is look_up[5]
+
+    def test_look_up_delta(self) -> None:
+        look_up: Lookup[int, str] = LinqSequence.from_iterable(["a", "bb", "c"]).to_look_up(len)
+        look_up.add(1, "d")
+        look_up.add(4, "dddd")
+        look_up.add_range(["ee", "fff"], len)
+        assert [(x.key, x.to_list()) for x in look_up] == [(1, ["a", "c", "d"]), (2, ["bb", "ee"]), (4, ["dddd"]), (3, ["fff"])]
+        assert look_up.remove(1, "c") and not look_up.remove(1, "x") and not look_up.remove(5, "a")
+        assert look_up.remove(4, "dddd") and not look_up.contains_key(4) and len(look_up) == 3
+        look_up.remove_range(["a", "d", "zz"], len, str.upper)
+        assert look_up[1].to_list() == ["a", "d"]
+        look_up.remove_range(["a", "d", "zz"], len)
+        assert not look_up.contains_key(1) and look_up[2].to_list() == ["bb", "ee"]
+
+        other: Lookup[int, str] = LinqSequence.from_iterable(["gg", "h"]).to_look_up(len)
+        look_up.merge(other)
+        assert [(x.key, x.to_list()) for x in look_up] == [(2, ["bb", "ee", "gg"]), (3, ["fff"]), (1, ["h"])]
+        look_up.merge(look_up)
+        assert look_up[2].to_list() == ["bb", "ee", "gg", "bb", "ee", "gg"] and other[2].to_list() == ["gg"]
+
+    def test_look_up_default_updates(self) -> None:
+        look_up: Lookup[int, str] = _DictLookup()
+        look_up.add_range(["a", "bb", "c"], len)
+        look_up.remove_range(["c", "zz"], len)
+        other: Lookup[int, str] = LinqSequence.from_iterable(["d", "eee"]).to_look_up(len)
+        look_up.merge(other)
+        assert [(x.key, x.to_list()) for x in look_up] == [(1, ["a", "d"]), (2, ["bb"]), (3, ["eee"])]
+        look_up.merge(look_up)
+        assert look_up[1].to_list() == ["a", "d", "a", "d"] and len(look_up) == 3
+
+    def test_look_up_snapshot(self) -> None:
+        look_up: Lookup[int, str] = LinqSequence.from_iterable(["a", "bb", "c", "dd"]).to_look_up(len)
+        snapshot: Lookup[int, str] = look_up.snapshot()
+        reader: LinqSequence[str] = snapshot[1]
+        look_up.add(1, "e")
+        look_up.add(3, "fff")
+        look_up.remove(2, "bb")
+        assert [(x.key, x.to_list()) for x in look_up] == [(1, ["a", "c", "e"]), (2, ["dd"]), (3, ["fff"])]
+        assert [(x.key, x.to_list()) for x in snapshot] == [(1, ["a", "c"]), (2, ["bb", "dd"])]
+        assert reader.to_list() == ["a", "c"]
+
+        # 複製への変更も元のLookupに影響しない
+        snapshot.add(2, "gg")
+        assert look_up[2].to_list() == ["dd"] and snapshot[2].to_list() == ["bb", "dd", "gg"]
+        # 複製を取った後に同じキーを繰り返し変更しても，それぞれの結果は独立する
+        second: Lookup[int, str] = look_up.snapshot()
+        look_up.add(1, "h")
+        look_up.add(1, "i")
+        assert look_up[1].to_list() == ["a", "c", "e", "h", "i"] and second[1].to_list() == ["a", "c", "e"]
+        assert snapshot[1].to_list() == ["a", "c"]
+
+    def test_keyed_accumulators(self) -> None:
+        source: list[tuple[str, int]] = [(("a", "b", "c")[i * 7 % 3], i * 5 % 11) for i in range(30)]
+        sequence: LinqSequence[tuple[str, int]] = LinqSequence.from_iterable(source)
+        groups: LinqSequence[Grouping[str, tuple[str, int]]] = sequence.group_by(lambda x: x[0])
+        assert sequence.count_by(lambda x: x[0]).to_list() == groups.select(lambda g: (g.key, g.count())).to_list()
+        assert sequence.sum_by(lambda x: x[0], lambda x: x[1]).to_list() == groups.select(lambda g: (g.key, g.sum(lambda x: x[1]))).to_list()
+        assert sequence.aggregate_by(lambda x: x[0], "", lambda a, x: a + str(x[1])).to_list() == \
+            groups.select(lambda g: (g.key, g.aggregate("", lambda a, x: a + str(x[1])))).to_list()
+        assert sequence.max_by_group(lambda x: x[0], lambda x: x[1]).to_list() == groups.select(lambda g: (g.key, g.max_by(lambda x: x[1]))).to_list()
+        assert sequence.min_by_group(lambda x: x[0], lambda x: x[1]).to_list() == groups.select(lambda g: (g.key, g.min_by(lambda x: x[1]))).to_list()
+
+        ties: LinqSequence[tuple[str, int]] = LinqSequence.from_iterable([("a", 1), ("b", 2), ("a", 1), ("b", 0)])
+        assert ties.min_by_group(lambda x: x[0], lambda x: x[1]).select(lambda x: x[1]).to_list() == [("a", 1), ("b", 0)]
+        assert ties.max_by_group(lambda x: x[0], lambda x: -x[1]).to_list() == [("a", ("a", 1)), ("b", ("b", 0))]
+        assert LinqSequence[int].empty().count_by(lambda x: x).to_list() == []
@@ -0,0 +1,21 @@
+import os
+import subprocess
+import sys
+import unittest
+
+
+# 読み込みの重い標準モジュールのうち，import pylinqで読み込まれてはならないもの
+_HEAVY_MODULES: tuple[str, ...] = ("inspect", "ast", "dis", "tokenize")
+
+
+class ImportTest(unittest.TestCase):
+    def test_heavy_modules(self) -> None:
+        code: str = f"import sys, pylinq; print([name for name in {_HEAVY_MODULES!r} if name in sys.modules])"
+        result: subprocess.CompletedProcess = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        assert result.stdout.strip() == "[]"
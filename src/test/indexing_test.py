@@ -0,0 +1,93 @@
+import unittest
+from array import array
+from typing import Iterator
+
+from pylinq import LinqSequence
+
+
+class _CountingList(list):
+    def __init__(self, source: range) -> None:
+        super().__init__(source)
+        self.reads: int = 0
+
+    def __getitem__(self, index):  # type: ignore
+        self.reads += 1
+        return super().__getitem__(index)
+
+    def __iter__(self) -> Iterator[int]:
+        raise AssertionError("enumerated")
+
+    def __reversed__(self) -> Iterator[int]:
+        raise AssertionError("enumerated")
+
+
+class _IndexableGenerator(LinqSequence[int]):
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(3))
+
+    def _try_get_count(self) -> int:
+        return 3
+
+    def _is_indexable(self) -> bool:
+        return True
+
+
+class IndexingTest(unittest.TestCase):
+    def test_getitem(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.from_iterable([1, 2, 3, 4, 5])
+        assert sequence[0] == 1
+        assert sequence[-1] == 5
+        assert sequence.select(lambda x: x * 10)[-2] == 40
+        assert sequence.skip(1).take(3)[-1] == 4
+        assert sequence.reverse()[0] == 5
+        assert sequence.zip("abcd")[-1] == (4, "d")
+        assert LinqSequence.range(10, 5)[3] == 13
+        assert LinqSequence.repeat("x", 3)[-3] == "x"
+        with self.assertRaises(IndexError):
+            sequence.take(2)[2]
+        with self.assertRaises(IndexError):
+            sequence[-6]
+
+    def test_getitem_not_indexable(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.from_iterable([1, 2, 3, 4, 5]).where(lambda x: x % 2 == 1)
+        assert sequence[1] == 3
+        assert sequence[-1] == 5
+        assert sequence[-3] == 1
+        with self.assertRaises(IndexError):
+            sequence[3]
+        with self.assertRaises(IndexError):
+            sequence[-4]
+
+    def test_slice(self) -> None:
+        source: list[int] = [1, 2, 3, 4, 5, 6]
+        indexable: LinqSequence[int] = LinqSequence.from_iterable(source).select(lambda x: x * 10)
+        filtered: LinqSequence[int] = LinqSequence.from_iterable(source).where(lambda x: True).select(lambda x: x * 10)
+        expected: list[int] = [x * 10 for x in source]
+        for index in (slice(1, 4), slice(None, None, 2), slice(-3, None), slice(None, -2), slice(None, None, -1), slice(4, 0, -2), slice(10, 20)):
+            assert indexable[index].to_list() == expected[index], index
+            assert filtered[index].to_list() == expected[index], index
+        assert indexable[1:5][-1] == 50
+        with self.assertRaises(ValueError):
+            indexable[::0]
+
+    def test_get_item_fallback(self) -> None:
+        sequence: LinqSequence[int] = _IndexableGenerator()
+        assert sequence[1] == 1 and sequence[-1] == 2
+        assert sequence.select(lambda x: x * 2).element_at(2) == 4
+
+    def test_reversed(self) -> None:
+        assert list(reversed(LinqSequence.from_iterable((1, 2, 3)))) == [3, 2, 1]
+        assert LinqSequence.from_iterable(array("i", [1, 2, 3])).select(lambda x: x * 2).reverse().to_list() == [6, 4, 2]
+        assert LinqSequence.from_iterable(iter([1, 2, 3])).reverse().to_list() == [3, 2, 1]
+        assert LinqSequence.range(0, 10).skip(2).take(3).reverse().reverse().to_list() == [2, 3, 4]
+
+    def test_random_access(self) -> None:
+        source: _CountingList = _CountingList(range(1000000))
+        sequence: LinqSequence[int] = LinqSequence.from_iterable(source).select(lambda x, i: x + i)
+        assert sequence.element_at(500000) == 1000000
+        assert sequence.element_at_or_default(1000000, -1) == -1
+        assert sequence.last() == 1999998
+        assert sequence.last(lambda x: x % 7 == 0) == 1999998
+        assert sequence.skip(999990).take(2).to_list() == [1999980, 1999982]
+        assert sequence.reverse().first() == 1999998
+        assert source.reads < 20
@@ -0,0 +1,40 @@
+import unittest
+from typing import Callable
+
+from pylinq import LinqSequence, optimization
+
+
+_SIZE: int = 20000
+
+_OPERATORS: dict[str, Callable[[LinqSequence[int]], LinqSequence]] = {
+    "where": lambda x: x.where(lambda y: y % 3 == 0),
+    "where_indexed": lambda x: x.where(lambda y, i: i % 3 == 0),
+    "select": lambda x: x.select(lambda y: y + 1),
+    "select_indexed": lambda x: x.select(lambda y, i: y + i),
+    "skip": lambda x: x.skip(100),
+    "take": lambda x: x.take(_SIZE - 100),
+    "skip_while": lambda x: x.skip_while(lambda y: y < 100),
+    "take_while": lambda x: x.take_while(lambda y: y < _SIZE - 100),
+    "zip": lambda x: x.zip(range(_SIZE)),
+    "zip_selector": lambda x: x.zip(range(_SIZE), lambda y, z: y + z),
+    "concat": lambda x: x.concat(range(100)),
+    "append": lambda x: x.append(0),
+    "prepend": lambda x: x.prepend(0),
+    "default_if_empty": lambda x: x.default_if_empty(0),
+    "chunk": lambda x: x.chunk(7),
+    "select_many": lambda x: x.select_many(lambda y: (y, y)),
+    "select_many_result": lambda x: x.select_many(lambda y, i: (y, i), lambda y: y * 2),
+}
+
+
+class ItertoolsTest(unittest.TestCase):
+    def test_same_result(self) -> None:
+        for name, operator in _OPERATORS.items():
+            sequence: LinqSequence = operator(LinqSequence.from_iterable(list(range(_SIZE))))
+            expected: list = sequence.to_list()
+            with optimization.disabled_rules("use_itertools"):
+                assert sequence.to_list() == expected, name
+            empty: LinqSequence = operator(LinqSequence.empty())
+            expected = empty.to_list()
+            with optimization.disabled_rules("use_itertools"):
+                assert empty.to_list() == expected, name
@@ -0,0 +1,64 @@
+import operator
+import unittest
+from typing import Iterator
+
+from pylinq import LinqSequence
+
+
+class _NotIterable:
+    def __init__(self, length: int) -> None:
+        self.length: int = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[int]:
+        raise AssertionError("enumerated")
+
+
+class LengthTest(unittest.TestCase):
+    def test_length_hint(self) -> None:
+        source: LinqSequence[int] = LinqSequence.range(0, 10)
+        assert operator.length_hint(source) == 10
+        assert operator.length_hint(source.select(lambda x: x * 2)) == 10
+        assert operator.length_hint(source.take(3)) == 3
+        assert operator.length_hint(source.skip(4)) == 6
+        assert operator.length_hint(source.skip(20)) == 0
+        assert operator.length_hint(source.concat([1, 2])) == 12
+        assert operator.length_hint(source.append(1).prepend(0)) == 12
+        assert operator.length_hint(source.reverse()) == 10
+        assert operator.length_hint(source.order_by(lambda x: -x)) == 10
+        assert operator.length_hint(source.zip(range(4))) == 4
+        assert operator.length_hint(source.chunk(3)) == 4
+        assert operator.length_hint(source.where(lambda x: x > 5), -1) == -1
+        assert operator.length_hint(source.where(lambda x: x > 5).take(2), -1) == -1
+        assert operator.length_hint(source.take_while(lambda x: x < 3), -1) == -1
+        assert operator.length_hint(source.skip_while(lambda x: x < 3), -1) == -1
+        assert operator.length_hint(LinqSequence.from_iterable(iter(range(5))), -1) == -1
+
+    def test_count_without_enumeration(self) -> None:
+        source: LinqSequence[int] = LinqSequence.from_iterable(_NotIterable(7))
+        assert source.select(lambda x: x).skip(2).take(3).count() == 3
+        assert source.chunk(2).count() == 4
+        assert source.zip(range(5)).count() == 5
+        assert source.reverse().any()
+        assert not source.take(0).any()
+
+    def test_count_matches_enumeration(self) -> None:
+        source: LinqSequence[int] = LinqSequence.from_iterable(range(10))
+        sequences: list[LinqSequence] = [
+            source.skip(3).take(4),
+            source.take(20).skip(8),
+            source.concat(source.take(2)),
+            source.chunk(4),
+            source.zip(source.skip(7)),
+            source.append(1),
+        ]
+        for sequence in sequences:
+            assert sequence.count() == len(sequence.to_list())
+
+    def test_average_unsized(self) -> None:
+        assert LinqSequence.from_iterable(iter([1, 2, 3, 6])).average(lambda x: x) == 3
+
+    def test_sequence_equal_count(self) -> None:
+        assert not LinqSequence.from_iterable(_NotIterable(3)).sequence_equal([1, 2])
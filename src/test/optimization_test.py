@@ -0,0 +1,106 @@
+import unittest
+from typing import cast
+
+from pylinq import LinqSequence, optimization
+from pylinq._sequences import SelectSequence, SkipSequence, TakeSequence, TopSequence, WhereSequence
+from pylinq._sequences.plan import optimize
+
+
+class OptimizationTest(unittest.TestCase):
+    def assert_same_with_rules(self, sequence: LinqSequence) -> None:
+        expected: list = sequence.to_list()
+        with optimization.disabled_rules(*optimization.get_rule_names()):
+            assert sequence.to_list() == expected
+        for name in optimization.get_rule_names():
+            with optimization.disabled_rules(name):
+                assert sequence.to_list() == expected
+
+    def test_fuse_where(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.from_iterable(range(100))\
+            .where(lambda x: x % 2 == 0)\
+            .where(lambda x: x % 3 == 0)\
+            .where(lambda x, i: i % 2 == 0)
+        plan = optimize(sequence)
+        assert type(plan) is WhereSequence and type(plan._source) is WhereSequence
+        assert type(plan._source._source) is not WhereSequence
+        self.assert_same_with_rules(sequence)
+
+    def test_fuse_select(self) -> None:
+        sequence: LinqSequence[str] = LinqSequence.from_iterable(range(20))\
+            .select(lambda x: x * 2)\
+            .select(lambda x, i: x + i)\
+            .select(lambda x: x - 1)\
+            .select(lambda x, i: f"{i}:{x}")
+        plan = optimize(sequence)
+        assert type(plan) is SelectSequence and type(plan._source) is not SelectSequence
+        self.assert_same_with_rules(sequence)
+
+    def test_take_skip(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.from_iterable(range(100))\
+            .skip(5)\
+            .skip(10)\
+            .select(lambda x, i: x * i)\
+            .skip(3)\
+            .take(20)\
+            .take(10)
+        plan = optimize(sequence)
+        assert type(plan) is SelectSequence
+        assert type(plan._source) is TakeSequence and plan._source._count == 10
+        assert type(plan._source._source) is SkipSequence and plan._source._source._count == 18
+        self.assert_same_with_rules(sequence)
+
+    def test_push_take(self) -> None:
+        called: list[int] = list[int]()
+
+        def selector(x: int) -> int:
+            called.append(x)
+            return x
+
+        sequence: LinqSequence[int] = LinqSequence.from_iterable(range(100))\
+            .select(selector)\
+            .skip(10)\
+            .take(3)
+        assert sequence.to_list() == [10, 11, 12]
+        assert called == [10, 11, 12]
+
+    def test_fold(self) -> None:
+        assert optimize(LinqSequence[int].empty().where(lambda x: x > 0).select(lambda x: x)).to_list() == []
+        sequence: LinqSequence[int] = LinqSequence.from_iterable((1, 2, 3)).take(5)
+        assert type(optimize(sequence)) is not TakeSequence
+        self.assert_same_with_rules(sequence)
+        self.assert_same_with_rules(LinqSequence.repeat(1, 1).skip(1))
+        self.assert_same_with_rules(LinqSequence.range(0, 10).skip(0).take(3))
+
+    def test_disable(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.from_iterable(range(10))\
+            .where(lambda x: x > 2)\
+            .where(lambda x: x < 8)
+        assert type(cast(WhereSequence[int], optimize(sequence))._source) is not WhereSequence
+        with optimization.disabled_rules("fuse_where"):
+            assert type(cast(WhereSequence[int], optimize(sequence))._source) is WhereSequence
+        assert optimization.is_rule_enabled("fuse_where")
+
+    def test_top_k(self) -> None:
+        source: list[tuple[int, int]] = [(i * 7 % 10, i) for i in range(100)]
+        sequences: list[LinqSequence[tuple[int, int]]] = [
+            LinqSequence.from_iterable(source).order_by(lambda x: x[0]).take(15),
+            LinqSequence.from_iterable(source).order_by_descending(lambda x: x[0]).take(15),
+            LinqSequence.from_iterable(source).order_by(lambda x: x[0] % 3).then_by(lambda x: x[0]).take(25),
+            LinqSequence.from_iterable(source).order_by(lambda x: x[0] % 3).then_by_descending(lambda x: x[0]).take(25),
+            LinqSequence.from_iterable(source).order_by(lambda x: x[0]).skip(12).take(6),
+            LinqSequence.from_iterable(source).order_by(lambda x: x[0]).take(1000),
+        ]
+        for sequence in sequences:
+            plan: LinqSequence[tuple[int, int]] = optimize(sequence)
+            # 先頭を読み飛ばす場合は上位の要素を選んだ後にスキップする
+            assert type(plan) is TopSequence or type(cast(SkipSequence[tuple[int, int]], plan)._source) is TopSequence
+            self.assert_same_with_rules(sequence)
+
+        ordered = LinqSequence.from_iterable(source).order_by_descending(lambda x: x[0]).then_by(lambda x: -x[1])
+        expected: list[tuple[int, int]] = ordered.to_list()
+        assert [ordered.element_at(i) for i in range(len(expected))] == expected
+        assert ordered.element_at_or_default(100, (0, 0)) == (0, 0)
+        self.assertRaises(IndexError, ordered.element_at, 100)
+
+        generated: LinqSequence[int] = LinqSequence.from_iterable(x * 37 % 101 for x in range(101))
+        assert generated.order_by(lambda x: x).take(3).to_list() == [0, 1, 2]
@@ -1,4 +1,8 @@
+import os
+import tempfile
 import unittest
+from operator import itemgetter
+from typing import Callable, Iterator
 
 from pylinq import LinqSequence, OrderedLinqSequence
 
@@ -62,21 +66,231 @@ class OrderingTest(unittest.TestCase):
             (2, "Ando"),
         ]
         expected: list[tuple[int, str]] = [
-            (4, "Sato"),
-            (4, "Ito"),
-            (3, "Takahashi"),
-            (3, "Kino"),
+            (1, "Sato"),
             (2, "Yamada"),
             (2, "Tanaka"),
             (2, "Ando"),
-            (1, "Sato"),
+            (3, "Takahashi"),
+            (3, "Kino"),
+            (4, "Sato"),
+            (4, "Ito"),
         ]
         sequence: OrderedLinqSequence[tuple[int, str]] = LinqSequence.from_iterable(source)\
             .order_by(lambda x: x[0])\
             .then_by_descending(lambda x: x[1])
         assert sequence.to_list() == expected
 
+    def test_stable(self) -> None:
+        source: list[tuple[int, str]] = [(2, "a"), (1, "b"), (2, "c"), (1, "d"), (2, "e")]
+        assert LinqSequence.from_iterable(source).order_by(lambda x: x[0]).to_list() ==\
+            [(1, "b"), (1, "d"), (2, "a"), (2, "c"), (2, "e")]
+        assert LinqSequence.from_iterable(source).order_by_descending(lambda x: x[0]).to_list() ==\
+            [(2, "a"), (2, "c"), (2, "e"), (1, "b"), (1, "d")]
+
+    def test_multi_level(self) -> None:
+        source: list[tuple[int, int, int, int]] = [(i % 3, i % 5, i % 2, i) for i in range(60)]
+        sequence: OrderedLinqSequence[tuple[int, int, int, int]] = LinqSequence.from_iterable(source)\
+            .order_by_descending(lambda x: x[0])\
+            .then_by(lambda x: x[1])\
+            .then_by_descending(lambda x: x[2])
+        expected: list[tuple[int, int, int, int]] = sorted(source, key=lambda x: (-x[0], x[1], -x[2]))
+        assert sequence.to_list() == expected
+        assert sequence.first() == expected[0]
+        assert sequence.last() == expected[-1]
+
+    def test_key_calls(self) -> None:
+        calls: list[int] = [0, 0, 0]
+
+        def key(level: int) -> Callable[[int], int]:
+            def inner(x: int) -> int:
+                calls[level] += 1
+                return x % (level + 2)
+            return inner
+
+        sequence: OrderedLinqSequence[int] = LinqSequence.from_iterable(range(100))\
+            .order_by(key(0))\
+            .then_by_descending(key(1))\
+            .then_by(key(2))
+        assert sequence.to_list() == sorted(range(100), key=lambda x: (x % 2, -(x % 3), x % 4))
+        assert calls == [100, 100, 100]
+
+    def test_incremental(self) -> None:
+        source: list[tuple[int, int]] = [(i * 7 % 10, i) for i in range(100)]
+        sequences: list[OrderedLinqSequence[tuple[int, int]]] = [
+            LinqSequence.from_iterable(source).order_by(lambda x: x[0]),
+            LinqSequence.from_iterable(source).order_by_descending(lambda x: x[0]),
+            LinqSequence.from_iterable(source).order_by(lambda x: x[0] % 3).then_by_descending(lambda x: x[0]),
+            LinqSequence.from_iterable(source).order_by_descending(lambda x: x[0] % 3).then_by(lambda x: x[0] // 2),
+            LinqSequence.from_iterable(source).order_by_descending(lambda x: str(x[0] % 4)).then_by_descending(lambda x: x[0] % 3),
+        ]
+        for sequence in sequences:
+            incremental: OrderedLinqSequence[tuple[int, int]] = sequence.incremental()
+            assert incremental.to_list() == sequence.to_list()
+            assert incremental.then_by(lambda x: -x[1]).to_list() == sequence.then_by(lambda x: -x[1]).to_list()
+
+        iterator: Iterator[int] = iter(LinqSequence.from_iterable(range(100000, 0, -1)).order().incremental())
+        assert [next(iterator) for _ in range(3)] == [1, 2, 3]
+
+    def test_cached(self) -> None:
+        reads: list[int] = [0]
+
+        def generate() -> Iterator[tuple[int, str]]:
+            reads[0] += 1
+            yield from ((i * 7 % 10, str(i)) for i in range(30))
+
+        source: LinqSequence[tuple[int, str]] = LinqSequence.from_generator(generate)
+        sequence: OrderedLinqSequence[tuple[int, str]] = source.order_by_descending(lambda x: x[0]).then_by(lambda x: x[1])
+        cached: OrderedLinqSequence[tuple[int, str]] = sequence.cached()
+        expected: list[tuple[int, str]] = sequence.to_list()
+        reads[0] = 0
+        assert cached.to_list() == expected
+        assert cached.to_list() == expected
+        assert cached.skip(5).take(3).to_list() == expected[5:8]
+        assert cached.element_at(7) == expected[7]
+        assert cached.first() == expected[0] and cached.last() == expected[-1]
+        assert cached[-2] == expected[-2]
+        assert reads[0] == 1
+        assert cached.then_by_descending(lambda x: x[1]).to_list() == sequence.then_by_descending(lambda x: x[1]).to_list()
+
+    def test_seek_after(self) -> None:
+        source: list[tuple[int, str]] = [(i * 7 % 10, str(i)) for i in range(30)]
+        ascending: OrderedLinqSequence[tuple[int, str]] = LinqSequence.from_iterable(source).order_by(lambda x: x[0])
+        descending: OrderedLinqSequence[tuple[int, str]] = LinqSequence.from_iterable(source).order_by_descending(lambda x: x[0])
+        for ordered in (ascending, ascending.cached()):
+            assert ordered.seek_after(4).to_list() == [x for x in ordered.to_list() if x[0] > 4]
+        for ordered in (descending, descending.cached()):
+            assert ordered.seek_after(4).to_list() == [x for x in ordered.to_list() if x[0] < 4]
+
+        sequences: list[OrderedLinqSequence[tuple[int, str]]] = [
+            LinqSequence.from_iterable(source).order_by_descending(lambda x: x[0]).then_by(lambda x: x[1]),
+            LinqSequence.from_iterable(source).order_by(lambda x: x[0]).then_by_descending(lambda x: x[1]),
+        ]
+        for sequence in sequences:
+            for ordered in (sequence, sequence.cached()):
+                pages: list[tuple[int, str]] = []
+                cursor: tuple[int, str] | None = None
+                while True:
+                    page: list[tuple[int, str]] = ordered.page(cursor, 4).to_list()
+                    if len(page) == 0:
+                        break
+                    pages.extend(page)
+                    cursor = page[-1]
+                assert pages == ordered.to_list()
+
+    def test_external(self) -> None:
+        source: list[tuple[int, str]] = [(i * 7 % 10, str(i % 13)) for i in range(100)]
+        sequences: list[OrderedLinqSequence[tuple[int, str]]] = [
+            LinqSequence.from_iterable(source).order_by(lambda x: x[0]),
+            LinqSequence.from_iterable(source).order_by_descending(lambda x: x[0]),
+            LinqSequence.from_iterable(source).order_by(lambda x: x[0]).then_by_descending(lambda x: x[1]),
+            LinqSequence.from_iterable(source).order_by_descending(lambda x: x[1]).then_by(lambda x: -x[0]),
+        ]
+        for sequence in sequences:
+            expected: list[tuple[int, str]] = sequence.to_list()
+            for run_size in (1, 7, 100, 1000):
+                assert sequence.external(run_size).to_list() == expected
+        self.assertRaises(ValueError, sequences[0].external, 0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            fds: str = "/proc/self/fd"
+            opened: int = len(os.listdir(fds)) if os.path.isdir(fds) else 0
+            iterator: Iterator[tuple[int, str]] = iter(sequences[2].external(10, directory))
+            assert next(iterator) == sequences[2].first()
+            if os.path.isdir(fds):
+                assert len(os.listdir(fds)) >= opened + 10
+            del iterator
+            if os.path.isdir(fds):
+                assert len(os.listdir(fds)) == opened
+            assert os.listdir(directory) == []
+
+    def test_parallel(self) -> None:
+        source: list[tuple[int, str]] = [(i * 7 % 10, str(i % 13)) for i in range(200)]
+        sequences: list[OrderedLinqSequence[tuple[int, str]]] = [
+            LinqSequence.from_iterable(source).order_by(itemgetter(0)),
+            LinqSequence.from_iterable(source).order_by_descending(itemgetter(0)),
+            LinqSequence.from_iterable(source).order_by(itemgetter(0)).then_by_descending(itemgetter(1)),
+            LinqSequence.from_iterable(source).order_by_descending(itemgetter(1)).then_by(itemgetter(0)),
+            LinqSequence.from_iterable(source).order_by(lambda x: x[1]).then_by_descending(lambda x: x[0]),
+        ]
+        for sequence in sequences:
+            expected: list[tuple[int, str]] = sequence.to_list()
+            assert sequence.parallel(3, 10).to_list() == expected
+            assert sequence.parallel(2).to_list() == expected
+        self.assertRaises(ValueError, sequences[0].parallel, 0)
+
+    def test_assume_sorted(self) -> None:
+        source: list[tuple[int, str]] = [(i // 4, str(i * 7 % 5)) for i in range(20)]
+        reads: list[int] = [0]
+
+        def generate() -> Iterator[tuple[int, str]]:
+            for current in source:
+                reads[0] += 1
+                yield current
+
+        generated: LinqSequence[tuple[int, str]] = LinqSequence.from_generator(generate)
+        assumed: OrderedLinqSequence[tuple[int, str]] = generated.assume_sorted(lambda x: x[0])
+        assert assumed.to_list() == source
+        assert assumed.take(3).to_list() == source[:3]
+        reads[0] = 0
+        assert assumed.first() == source[0] and reads[0] == 1
+        assert assumed.seek_after(2).to_list() == source[12:]
+        assert assumed.page(None, 2).to_list() == source[:2]
+        assert LinqSequence.from_iterable(source).assume_sorted(lambda x: x[0])[-1] == source[-1]
+        assert LinqSequence[int].empty().assume_sorted(lambda x: x).first_or_default(-1) == -1
+
+        expected: list[tuple[int, str]] = LinqSequence.from_iterable(source).order_by(lambda x: x[0]).then_by_descending(lambda x: x[1]).to_list()
+        then: OrderedLinqSequence[tuple[int, str]] = assumed.then_by_descending(lambda x: x[1])
+        assert then.to_list() == expected
+        assert then.first() == expected[0] and then.last() == expected[-1]
+        assert then.seek_after((3, "2")).to_list() == [x for x in expected if x[0] > 3 or x[0] == 3 and x[1] < "2"]
+
+        descending: list[int] = [5, 3, 3, 1]
+        assert LinqSequence.from_iterable(descending).assume_sorted(lambda x: x, True).last() == 1
+        assert LinqSequence.from_iterable(descending).assume_sorted(lambda x: x, True).seek_after(3).to_list() == [1]
+
+    def test_merge_ordered(self) -> None:
+        sources: list[list[tuple[int, str]]] = [
+            [(1, "a"), (3, "a"), (3, "b"), (8, "a")],
+            [],
+            [(0, "c"), (3, "c"), (9, "c")],
+            [(3, "d")],
+        ]
+        merged: OrderedLinqSequence[tuple[int, str]] = LinqSequence.from_iterable(sources[0]).merge_ordered(sources[1:], lambda x: x[0])
+        expected: list[tuple[int, str]] = LinqSequence.from_iterable(sources).select_many(lambda x: x).order_by(lambda x: x[0]).to_list()
+        assert merged.to_list() == expected
+        assert merged.count() == 8
+        assert merged.then_by_descending(lambda x: x[1]).to_list() == \
+            LinqSequence.from_iterable(expected).order_by(lambda x: x[0]).then_by_descending(lambda x: x[1]).to_list()
+
+        descending: OrderedLinqSequence[int] = LinqSequence.from_iterable([9, 5, 1]).merge_ordered([[8, 5], [7]], lambda x: x, True)
+        assert descending.to_list() == [9, 8, 7, 5, 5, 1]
+
+        def infinite(step: int) -> Iterator[int]:
+            current: int = 0
+            while True:
+                yield current
+                current += step
+
+        evens: LinqSequence[int] = LinqSequence.from_generator(infinite, 2)
+        assert evens.merge_ordered([infinite(3)], lambda x: x).take(6).to_list() == [0, 0, 2, 3, 4, 6]
+
     def test_reverse(self) -> None:
         sequence: LinqSequence[int] = LinqSequence.from_iterable([1, 0, 5, 3, 6, 4, 7])\
             .reverse()
         assert sequence.to_list() == [7, 4, 6, 3, 5, 0, 1]
+
+    def test_first_last(self) -> None:
+        source: list[tuple[int, str]] = [(2, "a"), (1, "b"), (3, "c"), (1, "d"), (3, "e"), (2, "f")]
+        sequences: list[OrderedLinqSequence[tuple[int, str]]] = [
+            LinqSequence.from_iterable(source).order_by(lambda x: x[0]),
+            LinqSequence.from_iterable(source).order_by_descending(lambda x: x[0]),
+        ]
+        for sequence in sequences:
+            expected: list[tuple[int, str]] = sequence.to_list()
+            assert sequence.first() == expected[0]
+            assert sequence.last() == expected[-1]
+            assert sequence.first_or_default((0, "")) == expected[0]
+            assert sequence.last_or_default((0, "")) == expected[-1]
+        empty: OrderedLinqSequence[int] = LinqSequence[int].empty().order()
+        assert empty.first_or_default(-1) == -1
+        self.assertRaises(ValueError, empty.last)
@@ -0,0 +1,118 @@
+import unittest
+from functools import partial
+from operator import gt, itemgetter
+
+from pylinq import LinqSequence, PreparedQuery
+
+
+class PreparedTest(unittest.TestCase):
+    def test_compiled(self) -> None:
+        query: PreparedQuery = LinqSequence.prepare(lambda source, limit, count: source
+                                                    .where(lambda x: x > limit)
+                                                    .select(lambda x, i: (i, x))
+                                                    .skip(1)
+                                                    .take(count))
+        assert query.is_compiled
+        for limit, count in ((0, 3), (5, 2), (8, 5), (3, 0), (3, -1)):
+            expected: list[tuple[int, int]] = LinqSequence.from_iterable(range(10))\
+                .where(lambda x: x > limit)\
+                .select(lambda x, i: (i, x))\
+                .skip(1)\
+                .take(count)\
+                .to_list()
+            assert query(range(10), limit, count).to_list() == expected
+        assert query([10, 20, 30], 15, 10).to_list() == [(1, 30)]
+
+    def test_reusable(self) -> None:
+        query: PreparedQuery = LinqSequence.prepare(lambda source, step: source.select(lambda x: x * step))
+        first: LinqSequence[int] = query([1, 2, 3], 2)
+        second: LinqSequence[int] = query(LinqSequence.range(0, 3), 10)
+        assert first.to_list() == [2, 4, 6]
+        assert second.to_list() == [0, 10, 20]
+        assert first.to_list() == [2, 4, 6]
+
+    def test_nested_function(self) -> None:
+        def template(source: LinqSequence[int], divisor: int) -> LinqSequence[int]:
+            def divisible(x: int) -> bool:
+                return x % divisor == 0
+            return source.where(lambda x: divisible(x))
+
+        query: PreparedQuery = LinqSequence.prepare(template)
+        assert query.is_compiled
+        assert query(range(10), 3).to_list() == [0, 3, 6, 9]
+        assert query(range(10), 4).to_list() == [0, 4, 8]
+
+    def test_shared_state(self) -> None:
+        pulled: list[int] = list[int]()
+
+        def template(source: LinqSequence[int], count: int) -> LinqSequence[int]:
+            def record(x: int) -> int:
+                pulled.append(x)
+                return x
+            return source.select(record).take(count)
+
+        query: PreparedQuery = LinqSequence.prepare(template)
+        assert query(range(100), 2).to_list() == [0, 1]
+        assert query(range(100), 3).to_list() == [0, 1, 2]
+        assert pulled == [0, 1, 0, 1, 2]
+
+    def test_fallback(self) -> None:
+        query: PreparedQuery = LinqSequence.prepare(lambda source, count: source.order_by(lambda x: -x).take(count))
+        assert not query.is_compiled
+        assert query([3, 1, 2], 2).to_list() == [3, 2]
+
+        def inspecting(source: LinqSequence[int], descending: bool) -> LinqSequence[int]:
+            if descending:
+                return source.order_by_descending(lambda x: x)
+            return source.order_by(lambda x: x)
+
+        query = LinqSequence.prepare(inspecting)
+        assert query([3, 1, 2], True).to_list() == [3, 2, 1]
+        assert query([3, 1, 2], False).to_list() == [1, 2, 3]
+
+    def test_wrapped_parameter(self) -> None:
+        rows: list[tuple[int, int]] = [(1, 2), (3, 4)]
+        query: PreparedQuery = LinqSequence.prepare(lambda source, key: source.select(itemgetter(key)))
+        assert not query.is_compiled
+        assert query(rows, 1).to_list() == [2, 4]
+        assert query(rows, 0).to_list() == [1, 3]
+
+        query = LinqSequence.prepare(lambda source, lo: source.where(partial(gt, lo)))
+        assert not query.is_compiled
+        assert query(range(10), 3).to_list() == [0, 1, 2]
+
+        query = LinqSequence.prepare(lambda source, step: source.select(lambda x, *, step=step: x * step))
+        assert not query.is_compiled
+        assert query([1, 2], 5).to_list() == [5, 10]
+
+    def test_captured_container(self) -> None:
+        query: PreparedQuery = LinqSequence.prepare(lambda source, lo, hi: (lambda bounds: source.where(lambda x: bounds[0] <= x <= bounds[1]))([lo, hi]))
+        assert not query.is_compiled
+        assert query(range(10), 2, 5).to_list() == [2, 3, 4, 5]
+
+        def template(source: LinqSequence[int | None], key: int | None) -> LinqSequence[int | None]:
+            options: dict[str, int | None] = {"k": key}
+            return source.where(lambda x: x is not options["k"])
+
+        query = LinqSequence.prepare(template)
+        assert not query.is_compiled
+        assert query([1, None, 2], None).to_list() == [1, 2]
+        assert query([1, None, 2], 1).to_list() == [None, 2]
+
+    def test_arguments(self) -> None:
+        query: PreparedQuery = LinqSequence.prepare(lambda source, count: source.take(count))
+        with self.assertRaises(TypeError):
+            query([1, 2, 3])
+        with self.assertRaises(TypeError):
+            query([1, 2, 3], 1, 2)
+
+    def test_branching_template(self) -> None:
+        def template(source: LinqSequence[int], even: bool) -> LinqSequence[int]:
+            if even:
+                return source.where(lambda x: x % 2 == 0)
+            return source.where(lambda x: x % 2 == 1)
+
+        query: PreparedQuery = LinqSequence.prepare(template)
+        assert not query.is_compiled
+        assert query(range(6), True).to_list() == [0, 2, 4]
+        assert query(range(6), False).to_list() == [1, 3, 5]
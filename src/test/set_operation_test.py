@@ -1,6 +1,8 @@
 import unittest
+from operator import itemgetter
+from typing import Callable
 
-from pylinq import LinqSequence
+from pylinq import LinqSequence, OrderedLinqSequence
 
 
 class SetOperationTest(unittest.TestCase):
@@ -24,6 +26,24 @@ class SetOperationTest(unittest.TestCase):
             .union_by([0, -2, 4, -6, 8], lambda x: abs(x))
         assert sequence.to_list() == [0, 1, 2, 3, 4, -6, 8]
 
+    def test_union_chain(self) -> None:
+        sequence: LinqSequence[int] = LinqSequence.from_iterable([0, 1, 2])
+        for i in range(10000):
+            sequence = sequence.union([i, i + 1])
+        assert sequence.to_list() == list[int](range(10001))
+
+        sequence = LinqSequence.from_iterable([0, 1, 2]).union_all([[2, 3], (3, 4), range(6)])
+        assert sequence.to_list() == [0, 1, 2, 3, 4, 5]
+        assert sequence.union_all([[7], [5, 6]]).to_list() == [0, 1, 2, 3, 4, 5, 7, 6]
+
+    def test_union_by_chain(self) -> None:
+        magnitude: Callable[[int], int] = abs
+        sequence: LinqSequence[int] = LinqSequence.from_iterable([0, 1, -2])\
+            .union_by([2, -3], magnitude)\
+            .union_by([3, 4], magnitude)\
+            .union_by([-4, 5, 1], lambda x: x)
+        assert sequence.to_list() == [0, 1, -2, -3, 4, -4, 5]
+
     def test_excepted(self) -> None:
         sequence: LinqSequence[int] = LinqSequence.from_iterable([0, 1, 2, 3, 4])\
             .excepted([0, 2, 4, 6, 8])
@@ -43,3 +63,41 @@ class SetOperationTest(unittest.TestCase):
         sequence: LinqSequence[int] = LinqSequence.from_iterable([0, 1, 2, 3, 4])\
             .intercept_by([0, -2, 4, -6, 8], lambda x: abs(x))
         assert sequence.to_list() == [0, 2, 4]
+
+    def test_ordered(self) -> None:
+        first: list[tuple[int, str]] = [(0, "a"), (1, "a"), (1, "b"), (3, "a"), (5, "a"), (5, "b"), (8, "a")]
+        second: list[tuple[int, str]] = [(1, "c"), (1, "d"), (2, "c"), (5, "c"), (9, "c")]
+        key: Callable[[tuple[int, str]], int] = itemgetter(0)
+        for descending in (False, True):
+            source: LinqSequence[tuple[int, str]] = LinqSequence.from_iterable(first[::-1] if descending else first)
+            target: list[tuple[int, str]] = second[::-1] if descending else second
+            assert source.distinct_ordered(key).to_list() == source.distinct_by(key).to_list()
+            assert source.excepted_ordered(target, key, descending).to_list() == source.excepted_by(target, key).to_list()
+            assert source.intercept_ordered(target, key, descending).to_list() == source.intercept_by(target, key).to_list()
+            union: list[tuple[int, str]] = source.union_ordered(target, key, descending).to_list()
+            assert [x[0] for x in union] == sorted({x[0] for x in first + second}, reverse=descending)
+            assert all(x in first or x[0] not in {y[0] for y in first} for x in union)
+
+        numbers: LinqSequence[int] = LinqSequence.from_iterable([0, 0, 1, 3, 3, 4])
+        assert numbers.distinct_ordered().to_list() == [0, 1, 3, 4]
+        assert numbers.excepted_ordered([1, 1, 4, 7]).to_list() == [0, 0, 3, 3]
+        assert numbers.intercept_ordered([0, 3, 3, 5]).to_list() == [0, 3]
+        assert numbers.intercept_ordered([]).to_list() == []
+        assert numbers.excepted_ordered([]).to_list() == [0, 0, 1, 3, 3, 4]
+        assert numbers.union_ordered([2, 3]).union_ordered([5]).to_list() == [0, 1, 2, 3, 4, 5]
+
+    def test_ordered_auto(self) -> None:
+        source: list[int] = [5, 3, 1, 3, 0, 5, 2]
+        ordered: LinqSequence[int] = LinqSequence.from_iterable(source).order()
+        assert type(ordered.distinct()) is type(LinqSequence.from_iterable(source).distinct_ordered())
+        assert ordered.distinct().to_list() == [0, 1, 2, 3, 5]
+        assert ordered.where(lambda x: x > 0).distinct().to_list() == [1, 2, 3, 5]
+        assert ordered.excepted(LinqSequence.from_iterable([3, 2]).order()).to_list() == [0, 1, 5, 5]
+        assert ordered.intercept(LinqSequence.from_iterable([5, 3, 4]).order()).to_list() == [3, 5]
+        assert ordered.excepted(LinqSequence.from_iterable([3, 2]).order_descending()).to_list() == [0, 1, 5, 5]
+
+        key: Callable[[int], int] = lambda x: x // 2
+        rows: OrderedLinqSequence[int] = LinqSequence.from_iterable(source).order_by_descending(key).then_by(lambda x: x)
+        assert rows.distinct_by(key).to_list() == [5, 2, 0]
+        assert rows.excepted_by(LinqSequence.from_iterable([4, 0]).assume_sorted(key, True), key).to_list() == [2, 3, 3]
+        assert rows.intercept_by(LinqSequence.from_iterable([3, 1]).assume_sorted(key, True), key).to_list() == [2, 0]
@@ -0,0 +1,25 @@
+import unittest
+
+import pylinq._sequences
+from pylinq import LinqSequence
+
+
+class SlotsTest(unittest.TestCase):
+    def test_node_classes(self) -> None:
+        classes: list[type] = [value for value in vars(pylinq._sequences).values() if isinstance(value, type) and issubclass(value, LinqSequence)]
+        assert len(classes) > 0
+        for node_class in classes:
+            for base in node_class.__mro__:
+                if base is not object:
+                    assert "__slots__" in vars(base), (node_class.__name__, base.__name__)
+
+    def test_instances(self) -> None:
+        source: LinqSequence[int] = LinqSequence.from_iterable([3, 1, 2])
+        sequences: list[LinqSequence] = [
+            source.where(lambda x: x > 1).select(lambda x: x * 2).take(2),
+            source.order_by(lambda x: x).then_by(lambda x: -x),
+            source.zip(source).chunk(2).reverse(),
+        ]
+        sequences.extend(source.to_look_up(lambda x: x % 2))
+        for sequence in sequences:
+            assert not hasattr(sequence, "__dict__"), type(sequence).__name__
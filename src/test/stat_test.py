@@ -12,6 +12,19 @@ class StatTest(unittest.TestCase):
         sequence: LinqSequence[int] = LinqSequence.from_iterable(range(10))
         assert sequence.count(lambda x: x % 3 == 0) == 4
 
+    def test_count3(self) -> None:
+        called: list[int] = list[int]()
+
+        def record(x: int) -> int:
+            called.append(x)
+            return x
+
+        sequence: LinqSequence[int] = LinqSequence.from_iterable(x for x in range(10))\
+            .select(record)\
+            .order_by(lambda x: -x)
+        assert sequence.count() == 10
+        assert called == []
+
     def test_max_by1(self) -> None:
         sequence: LinqSequence[str] = LinqSequence.from_iterable(["1", "2", "3", "4", "5"])
         actual: str | None = sequence.max_by(lambda x: int(x))